@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import time
 from datetime import timedelta
 from pathlib import Path
 from typing import Final, Any
@@ -9,7 +10,7 @@ import async_timeout
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_REGION, CONF_USERNAME, UnitOfPressure, EVENT_HOMEASSISTANT_STARTED, Platform
-from homeassistant.core import HomeAssistant, ServiceCall, CoreState
+from homeassistant.core import HomeAssistant, CoreState, callback
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import entity_registry as the_entity_registry
 from homeassistant.helpers.aiohttp_client import async_create_clientsession
@@ -42,17 +43,17 @@ from .const_shared import (
     STARTUP_MESSAGE,
     CONF_PRESSURE_UNIT,
     CONF_LOG_TO_FILESYSTEM,
+    CONF_COMPACT_METRICS,
+    CONF_CUSTOM_ENTRIES_MAX_AGE,
+    DEFAULT_CUSTOM_ENTRIES_MAX_AGE,
     DEFAULT_PRESSURE_UNIT,
     MANUFACTURER_FORD,
     MANUFACTURER_LINCOLN,
     COORDINATOR_KEY,
     PRESSURE_UNITS,
     RCC_SEAT_MODE_NONE,
-    RCC_SEAT_MODE_HEAT_ONLY,
-    RCC_SEAT_MODE_HEAT_AND_COOL,
-    DAYS_MAP,
 )
-from .const_tags import Tag, EV_ONLY_TAGS, FUEL_OR_PEV_ONLY_TAGS, RCC_TAGS
+from .const_tags import Tag, EV_ONLY_TAGS, FUEL_OR_PEV_ONLY_TAGS, RCC_TAGS, PLATFORM_TAGS
 from .entity import CustomFriendlyNameEntity
 from .fordpass_bridge import ConnectedFordPassVehicle
 from .fordpass_handler import (
@@ -62,12 +63,14 @@ from .fordpass_handler import (
     ROOT_VEHICLES,
     FordpassDataHandler
 )
+from .service import async_setup_services, async_unload_services, get_coordinators
 
 _LOGGER = logging.getLogger(__name__)
 
 CONFIG_SCHEMA = vol.Schema({DOMAIN: vol.Schema({})}, extra=vol.ALLOW_EXTRA)
 PLATFORMS:Final = [Platform.BUTTON, Platform.LOCK, Platform.NUMBER, Platform.SENSOR, Platform.SWITCH, Platform.SELECT, Platform.DEVICE_TRACKER]
 WEBSOCKET_WATCHDOG_INTERVAL: Final = timedelta(seconds=64)
+WS_TASK_NAME: Final = "ws_connection"
 
 
 async def async_setup(hass: HomeAssistant, config: dict):
@@ -175,43 +178,58 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry):
     coordinator = FordPassDataUpdateCoordinator(hass, config_entry, user, vin, region_key, update_interval_as_int=update_interval_as_int, save_token=True)
     await coordinator.bridge._rename_token_file_if_needed(user)
 
-    # HA can check if we can make an initial data refresh and report the state
-    # back to HA (we don't have to code this by ourselves, HA will do this for us)
-    # await coordinator.async_config_entry_first_refresh()
-
-    # well 'coordinator.async_config_entry_first_refresh()' does not work for our fordpass integration
-    # I must debug later why this is the case
-    await coordinator.async_refresh()  # Get initial data
-
-    # TO TEST STARTUP-ISSUES/ERRORS
-    # coordinator.data = {"metrics": {}}
-
-    is_essential_vehicle_data_available = FordpassDataHandler.is_essential_vehicle_data_available(coordinator.data)
-    if not coordinator.last_update_success or is_essential_vehicle_data_available is False:
-        # we should check if 'reauth' is required... and trigger it when
-        # it's necessary...
-        await coordinator._check_for_reauth()
-
-        # report the GUI the final error/reason/some sort of what to check
-        if not is_essential_vehicle_data_available:
-            lang = hass.config.language.lower()
-            if lang in TRANSLATIONS:
-                lang_map = TRANSLATIONS[lang]
-            else:
-                lang_map = TRANSLATIONS["en"]
+    # fast path: when we have a snapshot of the last known vehicle data, we can create all our entities
+    # instantly (from the snapshot) - and the live data will be fetched in the background
+    restored_from_snapshot = await coordinator.restore_from_snapshot()
+    if restored_from_snapshot:
+        # we do not request any data here - but at least the stored tokens must be valid, otherwise the
+        # entities would show the snapshot data, as if they are live
+        if not await coordinator.bridge.check_stored_tokens():
+            await coordinator._check_for_reauth()
+            raise ConfigEntryNotReady("")
+        await coordinator.read_config_on_startup(hass, from_snapshot=True)
+    else:
+        # HA can check if we can make an initial data refresh and report the state
+        # back to HA (we don't have to code this by ourselves, HA will do this for us)
+        # await coordinator.async_config_entry_first_refresh()
+
+        # well 'coordinator.async_config_entry_first_refresh()' does not work for our fordpass integration
+        # I must debug later why this is the case
+        # HA is waiting for this vehicle - so it will be served before the background refreshes of the other
+        # vehicles of the account (that have been already created from their snapshots)
+        async with coordinator.bridge.startup.slot(coordinator.vli, "first_refresh", blocking=True):
+            await coordinator.async_refresh()  # Get initial data
+
+        # TO TEST STARTUP-ISSUES/ERRORS
+        # coordinator.data = {"metrics": {}}
+
+        is_essential_vehicle_data_available = FordpassDataHandler.is_essential_vehicle_data_available(coordinator.data)
+        if not coordinator.last_update_success or is_essential_vehicle_data_available is False:
+            # we should check if 'reauth' is required... and trigger it when
+            # it's necessary...
+            await coordinator._check_for_reauth()
+
+            # report the GUI the final error/reason/some sort of what to check
+            if not is_essential_vehicle_data_available:
+                lang = hass.config.language.lower()
+                if lang in TRANSLATIONS:
+                    lang_map = TRANSLATIONS[lang]
+                else:
+                    lang_map = TRANSLATIONS["en"]
 
-            if coordinator.data is None:
-                raise ConfigEntryNotReady(lang_map["coord_null_data"])
+                if coordinator.data is None:
+                    raise ConfigEntryNotReady(lang_map["coord_null_data"])
+                else:
+                    raise ConfigEntryNotReady(lang_map["coord_no_vehicle_data"])
             else:
-                raise ConfigEntryNotReady(lang_map["coord_no_vehicle_data"])
+                raise ConfigEntryNotReady("")
         else:
-            raise ConfigEntryNotReady("")
-    else:
-        await coordinator.read_config_on_startup(hass)
+            await coordinator.read_config_on_startup(hass)
 
-    # ws watchdog...
+    # ws watchdog... (the websocket connects of all vehicles of the account are staggered - so we must not
+    # wait for it here)
     if hass.state is CoreState.running:
-        await coordinator.start_watchdog()
+        coordinator.bridge.tasks.spawn(coordinator.start_watchdog(), "start_watchdog")
     else:
         hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, coordinator.start_watchdog)
 
@@ -222,181 +240,16 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry):
         COORDINATOR_KEY: coordinator
     }
 
-    await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
-
-    # SERVICES from here...
-    # simple service implementations (might be moved to separate service.py)
-    async def async_refresh_status_service(call: ServiceCall):
-        _LOGGER.debug(f"Running Service 'refresh_status'")
-        status = await coordinator.bridge.request_update()
-        if status == 401:
-            _LOGGER.debug(f"[@{coordinator.vli}] refresh_status: Invalid VIN?! (status 401)")
-        elif status in [200, 201, 202]:
-            _LOGGER.debug(f"[@{coordinator.vli}] refresh_status: Refresh sent")
-
-        await asyncio.sleep(10)
-        await coordinator.async_request_refresh_force_classic_requests()
-
-    async def async_clear_tokens_service(call: ServiceCall):
-        #await hass.async_add_executor_job(service_clear_tokens, hass, call, coordinator)
-        """Clear the token file in config directory, only use in emergency"""
-        _LOGGER.debug(f"Running Service 'clear_tokens'")
-        await coordinator.bridge.clear_token()
-        await asyncio.sleep(5)
-        await coordinator.async_request_refresh_force_classic_requests()
-
-    async def poll_api_service(call: ServiceCall):
-        await coordinator.async_request_refresh_force_classic_requests()
-
-    async def handle_reload_service(call: ServiceCall):
-        """Handle reload service call."""
-        _LOGGER.debug(f"Reloading Integration")
-
-        current_entries = hass.config_entries.async_entries(DOMAIN)
-        reload_tasks = [
-            hass.config_entries.async_reload(entry.entry_id)
-            for entry in current_entries
-        ]
-
-        await asyncio.gather(*reload_tasks)
-
-    async def async_delete_message_service(call: ServiceCall):
-        _LOGGER.debug(f"Running Service 'delete_message'")
-        msg_id = call.data.get('msgid', None)
-        if msg_id is not None:
-            try:
-                return await FordpassDataHandler.messages_delete_with_id_called_from_service(coordinator, int(msg_id))
-            except ValueError:
-                _LOGGER.warning(f"async_delete_message_service: provided 'msgid' can not be convert to a number: {type(msg_id).__name__} - {msg_id}")
-                return False
-        else:
-            _LOGGER.warning(f"async_delete_message_service: No 'msgid' was provided!")
-            return False
-
-    async def async_update_departure_schedule_service(call: ServiceCall):
-        _LOGGER.debug(f"Running Service 'update_departure_schedule'")
-
-        hour = call.data.get("hour", None)
-        minute = call.data.get("minute", None)
-        precon_temperature = str(call.data.get("precondition_temperature", "OFF")).upper()
-        days = call.data.get("schedule_days", [])
-
-        if hour is None or minute is None:
-            _LOGGER.warning("async_update_departure_schedule_service(): 'hour' and 'minute' are required")
-            return False
-
-        if isinstance(days, str):
-            days = [days]
-        elif not isinstance(days, list):
-            _LOGGER.warning(f"async_update_departure_schedule_service(): invalid 'days' format: {type(days).__name__}")
-            return False
-
-        validated_days = []
-        for day in days:
-            day_name = str(day).upper()
-            if day_name in DAYS_MAP:
-                validated_days.append(day_name)
-
-        if len(validated_days) == 0:
-            _LOGGER.warning("async_update_departure_schedule_service(): No valid days were provided")
-            return False
-
-        if precon_temperature not in ["LOW", "MEDIUM", "HIGH", "OFF"]:
-            _LOGGER.warning(f"async_update_departure_schedule_service(): invalid precon_temperature '{precon_temperature}' - fallback to OFF")
-            precon_temperature = "OFF"
-
-        try:
-            await FordpassDataHandler.update_departure_schedule(coordinator.data, coordinator.bridge,
-                validated_days, int(hour), int(minute), precon_temperature
-            )
-        except ValueError:
-            _LOGGER.warning(f"async_update_departure_schedule_service(): invalid hour/minute values: hour={hour}, minute={minute}")
-            return False
-
-        #await asyncio.sleep(2)
-        #await coordinator.async_request_refresh_force_classic_requests()
-        return True
-
-    async def async_delete_departure_schedule_by_days_service(call: ServiceCall):
-        _LOGGER.debug(f"Running Service 'delete_departure_schedule_by_days'")
-
-        days = call.data.get("schedule_days", [])
-        if isinstance(days, str):
-            days = [days]
-        elif not isinstance(days, list):
-            _LOGGER.warning(f"async_delete_departure_schedule_by_days_service(): invalid 'schedule_days' format: {type(days).__name__}")
-            return False
-
-        validated_days = []
-        for day in days:
-            day_name = str(day).upper()
-            if day_name in DAYS_MAP:
-                validated_days.append(day_name)
-
-        if len(validated_days) == 0:
-            _LOGGER.warning("async_delete_departure_schedule_by_days_service(): No valid days were provided")
-            return False
-
-        try:
-            await FordpassDataHandler.delete_departure_schedule_by_days(coordinator.data, coordinator.bridge,
-                validated_days
-            )
-        except ValueError:
-            _LOGGER.warning(f"async_delete_departure_schedule_by_days_service(): invalid values: validated_days={validated_days}")
-            return False
-
-        return True
-
-    async def async_delete_departure_schedule_by_ids_service(call: ServiceCall):
-        _LOGGER.debug(f"Running Service 'delete_departure_schedule_by_ids'")
-
-        raw_ids = call.data.get("schedule_ids", [])
-        if isinstance(raw_ids, int):
-            schedule_ids = [raw_ids]
-        elif isinstance(raw_ids, str):
-            parts = [p.strip() for p in raw_ids.split(",") if p.strip()]
-            try:
-                schedule_ids = [int(p) for p in parts]
-            except ValueError:
-                _LOGGER.warning(f"async_delete_departure_schedule_by_ids_service(): invalid 'schedule_ids' string: {raw_ids}")
-                return False
-        elif isinstance(raw_ids, list):
-            schedule_ids = []
-            for value in raw_ids:
-                try:
-                    schedule_ids.append(int(value))
-                except (TypeError, ValueError):
-                    _LOGGER.warning(f"async_delete_departure_schedule_by_ids_service(): invalid schedule id value: {value}")
-                    return False
-        else:
-            _LOGGER.warning(f"async_delete_departure_schedule_by_ids_service(): invalid 'schedule_ids' format: {type(raw_ids).__name__}")
-            return False
-
-        if len(schedule_ids) == 0:
-            _LOGGER.warning("async_delete_departure_schedule_by_ids_service(): No schedule IDs were provided")
-            return False
-
-        try:
-            await FordpassDataHandler.delete_departure_schedule_by_schedule_ids(coordinator.data, coordinator.bridge,
-                schedule_ids
-            )
-        except ValueError:
-            _LOGGER.warning(f"async_delete_departure_schedule_by_ids_service(): invalid values: schedule_ids={schedule_ids}")
-            return False
+    # only forward the platforms, that have at least one entity supported by the vehicle
+    coordinator.platforms = coordinator.get_supported_platforms()
+    await hass.config_entries.async_forward_entry_setups(config_entry, coordinator.platforms)
 
-        return True
+    # all entities have been created from the snapshot - the live data will trickle in (staggered) now
+    if restored_from_snapshot:
+        coordinator.bridge.tasks.spawn(coordinator.async_refresh_after_snapshot_restore(), "initial_refresh")
 
-    hass.services.async_register(DOMAIN, "refresh_status", async_refresh_status_service)
-    hass.services.async_register(DOMAIN, "clear_tokens", async_clear_tokens_service)
-    hass.services.async_register(DOMAIN, "poll_api", poll_api_service)
-    hass.services.async_register(DOMAIN, "reload", handle_reload_service)
-    hass.services.async_register(DOMAIN, "delete_message", async_delete_message_service)
-    if coordinator.tag_supported_by_vehicle(Tag.DEPARTURE_SCHEDULES):
-        hass.services.async_register(DOMAIN, "update_departure_schedule", async_update_departure_schedule_service)
-        hass.services.async_register(DOMAIN, "delete_departure_schedule_by_days", async_delete_departure_schedule_by_days_service)
-        hass.services.async_register(DOMAIN, "delete_departure_schedule_by_ids", async_delete_departure_schedule_by_ids_service)
-    else:
-        _LOGGER.debug(f"{coordinator.vli}Service 'departure_schedule services' will NOT be registered since this vehicle does not support departure schedules")
+    # SERVICES from here... (registered only once for all config entries)
+    async_setup_services(hass)
 
     config_entry.async_on_unload(config_entry.add_update_listener(entry_update_listener))
     return True
@@ -420,25 +273,30 @@ async def async_update_options(hass, config_entry):
 async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     _LOGGER.debug(f"async_unload_entry(): called for entry: {config_entry.entry_id}")
-    unload_ok = await hass.config_entries.async_unload_platforms(config_entry, PLATFORMS)
+    unload_start = time.monotonic()
+    platforms = PLATFORMS
+    if DOMAIN in hass.data and config_entry.entry_id in hass.data[DOMAIN]:
+        platforms = hass.data[DOMAIN][config_entry.entry_id][COORDINATOR_KEY].platforms
+    unload_ok = await hass.config_entries.async_unload_platforms(config_entry, platforms)
 
     if unload_ok:
         if DOMAIN in hass.data and config_entry.entry_id in hass.data[DOMAIN]:
             coordinator = hass.data[DOMAIN][config_entry.entry_id][COORDINATOR_KEY]
             coordinator.stop_watchdog()
+            # stops the command/refresh waiting loops, cancels the websocket & stores the final snapshot
+            await coordinator.bridge.async_shutdown()
+
+            # the account scoped caches (tokens lock, messages, ...) are shared with the other vehicles of the account
+            account_in_use = any(a_coordinator.bridge.account_key == coordinator.bridge.account_key
+                                 for a_entry_id, a_coordinator in get_coordinators(hass).items() if a_entry_id != config_entry.entry_id)
+            coordinator.bridge.release_global_caches(account_in_use)
             await coordinator.clear_data()
             hass.data[DOMAIN].pop(config_entry.entry_id)
-            if coordinator.tag_supported_by_vehicle(Tag.DEPARTURE_SCHEDULES):
-                hass.services.async_remove(DOMAIN, "update_departure_schedule")
-                hass.services.async_remove(DOMAIN, "delete_departure_schedule_by_days")
-                hass.services.async_remove(DOMAIN, "delete_departure_schedule_by_ids")
 
-        hass.services.async_remove(DOMAIN, "refresh_status")
-        hass.services.async_remove(DOMAIN, "clear_tokens")
-        hass.services.async_remove(DOMAIN, "poll_api")
-        hass.services.async_remove(DOMAIN, "reload")
-        hass.services.async_remove(DOMAIN, "delete_message")
+        # the services will be only removed, when no other config entry is using them
+        async_unload_services(hass)
 
+    _LOGGER.debug(f"async_unload_entry(): entry {config_entry.entry_id} unloaded in {int((time.monotonic() - unload_start) * 1000)} ms")
     return unload_ok
 
 
@@ -488,7 +346,9 @@ class FordPassDataUpdateCoordinator(DataUpdateCoordinator):
 
         self.bridge = ConnectedFordPassVehicle(get_none_closed_cached_session(hass, vin, self.vli), user,
                                                vin, region_key, coordinator=self, storage_path=Path(hass.config.config_dir).joinpath(STORAGE_DIR),
-                                               local_logging=config_entry.options.get(CONF_LOG_TO_FILESYSTEM, False))
+                                               local_logging=config_entry.options.get(CONF_LOG_TO_FILESYSTEM, False),
+                                               compact_metrics=config_entry.options.get(CONF_COMPACT_METRICS, False),
+                                               custom_entries_max_age_days=config_entry.options.get(CONF_CUSTOM_ENTRIES_MAX_AGE, DEFAULT_CUSTOM_ENTRIES_MAX_AGE))
 
         self._available = True
         self._reauth_requested = False
@@ -509,6 +369,9 @@ class FordPassDataUpdateCoordinator(DataUpdateCoordinator):
         self._supports_REMOTE_CLIMATE_CONTROL = None
         self._supports_HEATED_STEERING_WHEEL = None
         self._supports_HEATED_HEATED_SEAT_MODE = None
+        # will be created in 'read_config_on_startup' (when all _supports_* attributes are known)
+        self._supported_tags: frozenset | None = None
+        self.platforms = PLATFORMS
         #self._last_ENERGY_TRANSFER_LOG_ENTRY_ID = None
 
         # we need to make a clone of the unit system, so that we can change the pressure unit (for our tire types)
@@ -537,7 +400,6 @@ class FordPassDataUpdateCoordinator(DataUpdateCoordinator):
                 )
 
         self._watchdog = None
-        self._a_task = None
         self._force_classic_requests = False
         super().__init__(hass, _LOGGER, name=DOMAIN, update_interval=timedelta(seconds=update_interval_as_int))
 
@@ -549,26 +411,29 @@ class FordPassDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def start_watchdog(self, event=None):
         """Start websocket watchdog."""
-        await self._async_watchdog_check()
-        self._watchdog = async_track_time_interval(
-            self.hass,
-            self._async_watchdog_check,
-            WEBSOCKET_WATCHDOG_INTERVAL,
-        )
+        async with self.bridge.startup.slot(self.vli, "websocket"):
+            if self.bridge.tasks.closed:
+                # the entry has been unloaded while we were waiting for our slot
+                return
+            await self._async_watchdog_check()
+            self._watchdog = async_track_time_interval(
+                self.hass,
+                self._async_watchdog_check,
+                WEBSOCKET_WATCHDOG_INTERVAL,
+            )
 
     def stop_watchdog(self):
         if hasattr(self, "_watchdog") and self._watchdog is not None:
             self._watchdog()
 
     def _check_for_ws_task_and_cancel_if_running(self):
-        if self._a_task is not None and not self._a_task.done():
+        if self.bridge.tasks.is_running(WS_TASK_NAME):
             _LOGGER.debug(f"{self.vli}Watchdog: websocket connect task is still running - canceling it...")
             try:
-                canceled = self._a_task.cancel()
+                canceled = self.bridge.tasks.cancel(WS_TASK_NAME)
                 _LOGGER.debug(f"{self.vli}Watchdog: websocket connect task was CANCELED? {canceled}")
             except BaseException as ex:
                 _LOGGER.info(f"{self.vli}Watchdog: websocket connect task cancel failed: {type(ex).__name__} - {ex}")
-            self._a_task = None
 
     async def _check_for_reauth(self):
         if self.bridge.require_reauth:
@@ -580,21 +445,46 @@ class FordPassDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def _async_watchdog_check(self, *_):
         """Reconnect the websocket if it fails."""
+        if self.bridge.tasks.closed:
+            # the entry is going to be unloaded
+            return
         await self._check_for_reauth()
 
         if not self.bridge.ws_connected:
             self._check_for_ws_task_and_cancel_if_running()
             _LOGGER.info(f"{self.vli}Watchdog: websocket connect required")
-            self._a_task = self._config_entry.async_create_background_task(self.hass, self.bridge.ws_connect(), "ws_connection")
-            if self._a_task is not None:
-                _LOGGER.debug(f"{self.vli}Watchdog: task created {self._a_task.get_coro()}")
+            a_task = self.bridge.tasks.adopt(self._config_entry.async_create_background_task(self.hass, self.bridge.ws_connect(), WS_TASK_NAME),
+                                             WS_TASK_NAME, long_lived=True)
+            if a_task is not None:
+                _LOGGER.debug(f"{self.vli}Watchdog: task created {a_task.get_coro()}")
         else:
             _LOGGER.debug(f"{self.vli}Watchdog: websocket is connected")
             self._available = True
+            self.bridge.housekeeping()
+            await self.bridge.save_data_snapshot()
             if not self.bridge.ws_check_last_update():
                 self._check_for_ws_task_and_cancel_if_running()
 
     def tag_supported_by_vehicle(self, a_tag: Tag) -> bool:
+        if self._supported_tags is not None:
+            return a_tag in self._supported_tags
+        return self._tag_supported_by_vehicle_int(a_tag)
+
+    def _build_capability_index(self):
+        self._supported_tags = None
+        self._supported_tags = frozenset(a_tag for a_tag in Tag if self._tag_supported_by_vehicle_int(a_tag))
+        _LOGGER.debug(f"{self.vli}capability index: {len(self._supported_tags)} of {len(Tag)} tags supported")
+
+    def get_supported_platforms(self) -> list:
+        supported_platforms = []
+        for a_platform in PLATFORMS:
+            if self._supported_tags is None or not PLATFORM_TAGS[a_platform].isdisjoint(self._supported_tags):
+                supported_platforms.append(a_platform)
+            else:
+                _LOGGER.debug(f"{self.vli}platform '{a_platform}' will not be set up - no supported entities")
+        return supported_platforms
+
+    def _tag_supported_by_vehicle_int(self, a_tag: Tag) -> bool:
         if a_tag in FUEL_OR_PEV_ONLY_TAGS:
             return self.supportFuel
 
@@ -652,7 +542,8 @@ class FordPassDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def clear_data(self):
         _LOGGER.debug(f"{self.vli}clear_data called...")
-        self._check_for_ws_task_and_cancel_if_running()
+        # cancels the websocket & all pending debounced updates (and no new tasks will be accepted)
+        await self.bridge.tasks.cancel_all()
         self.bridge.clear_data()
         self.data.clear()
 
@@ -674,107 +565,88 @@ class FordPassDataUpdateCoordinator(DataUpdateCoordinator):
     def supportFuel(self) -> bool:
         return self._engine_type is not None and self._engine_type not in ["BEV"]
 
-    async def read_config_on_startup(self, hass: HomeAssistant):
+    async def read_config_on_startup(self, hass: HomeAssistant, from_snapshot: bool = False):
         _LOGGER.debug(f"{self.vli}read_config_on_startup...")
 
         # we are reading here from the global coordinator data object!
         if self.data is not None:
-            if ROOT_VEHICLES in self.data:
-                veh_data = self.data[ROOT_VEHICLES]
-
-                # getting the engineType...
-                if "vehicleProfile" in veh_data:
-                    for a_vehicle_profile in veh_data["vehicleProfile"]:
-                        if a_vehicle_profile["VIN"] == self._vin:
-                            if "model" in a_vehicle_profile:
-                                self.vli = f"[{a_vehicle_profile['model']}] "
-
-                            if "engineType" in a_vehicle_profile:
-                                self._engine_type = a_vehicle_profile["engineType"]
-                                _LOGGER.debug(f"{self.vli}EngineType is: {self._engine_type}")
-
-                            if "numberOfLightingZones" in a_vehicle_profile:
-                                self._number_of_lighting_zones = int(a_vehicle_profile["numberOfLightingZones"])
-                                _LOGGER.debug(f"{self.vli}NumberOfLightingZones is: {self._number_of_lighting_zones}")
-
-                            if "transmissionIndicator" in a_vehicle_profile:
-                                self._supports_GEARLEVERPOSITION = a_vehicle_profile["transmissionIndicator"] == "A"
-                                _LOGGER.debug(f"{self.vli}GearLeverPosition support: {self._supports_GEARLEVERPOSITION}")
-
-                            # remote climate control stuff...
-                            if self._force_REMOTE_CLIMATE_CONTROL:
-                                self._supports_REMOTE_CLIMATE_CONTROL = True
-                                _LOGGER.debug(f"{self.vli}RemoteClimateControl FORCED: {self._supports_REMOTE_CLIMATE_CONTROL}")
-                            else:
-                                if "remoteClimateControl" in a_vehicle_profile:
-                                    self._supports_REMOTE_CLIMATE_CONTROL = a_vehicle_profile["remoteClimateControl"]
-                                    _LOGGER.debug(f"{self.vli}RemoteClimateControl support: {self._supports_REMOTE_CLIMATE_CONTROL}")
-
-                                if not self._supports_REMOTE_CLIMATE_CONTROL and "remoteHeatingCooling" in a_vehicle_profile:
-                                    self._supports_REMOTE_CLIMATE_CONTROL = a_vehicle_profile["remoteHeatingCooling"]
-                                    _LOGGER.debug(f"{self.vli}RemoteClimateControl/remoteHeatingCooling support: {self._supports_REMOTE_CLIMATE_CONTROL}")
-
-
-                            if "heatedSteeringWheel" in a_vehicle_profile:
-                                self._supports_HEATED_STEERING_WHEEL = a_vehicle_profile["heatedSteeringWheel"]
-                                _LOGGER.debug(f"{self.vli}HeatedSteeringWheel support: {self._supports_HEATED_STEERING_WHEEL}")
-
-                            self._supports_HEATED_HEATED_SEAT_MODE = RCC_SEAT_MODE_NONE
-                            if "driverHeatedSeat" in a_vehicle_profile:
-                                # possible values: 'None', 'Heat Only', 'Heat with Vent'
-                                heated_seat = a_vehicle_profile["driverHeatedSeat"].upper()
-                                if heated_seat == "HEAT WITH VENT":
-                                    self._supports_HEATED_HEATED_SEAT_MODE = RCC_SEAT_MODE_HEAT_AND_COOL
-                                elif "HEAT" in heated_seat:
-                                    self._supports_HEATED_HEATED_SEAT_MODE = RCC_SEAT_MODE_HEAT_ONLY
-                            _LOGGER.debug(f"{self.vli}DriverHeatedSeat support mode: {self._supports_HEATED_HEATED_SEAT_MODE}")
-                            break
-                else:
-                    _LOGGER.warning(f"{self.vli}No vehicleProfile in 'vehicles' found in coordinator data - no 'engineType' available! {self.data['vehicles']}")
+            # the capabilities are derived (once) from the 'vehicleProfile' & 'vehicleCapabilities' of the vehicle
+            # list by the bridge - and are cached across restarts [when the entities are created from the snapshot,
+            # no request will be made here - the vehicle list of the snapshot must be sufficient]
+            caps = await self.bridge.ensure_capabilities(allow_request=not from_snapshot)
+            if caps is not None:
+                if caps.get("model", None) is not None:
+                    self.vli = f"[{caps['model']}] "
+
+                self._engine_type = caps.get("engineType", None)
+                _LOGGER.debug(f"{self.vli}EngineType is: {self._engine_type}")
+
+                self._number_of_lighting_zones = caps.get("numberOfLightingZones", 0)
+                _LOGGER.debug(f"{self.vli}NumberOfLightingZones is: {self._number_of_lighting_zones}")
+
+                self._supports_GEARLEVERPOSITION = caps.get("gearLeverPosition", None)
+                _LOGGER.debug(f"{self.vli}GearLeverPosition support: {self._supports_GEARLEVERPOSITION}")
+
+                # remote climate control stuff... [the bridge has already checked the 'forced' option]
+                self._supports_REMOTE_CLIMATE_CONTROL = self.bridge.remote_climate_control_supported
+                _LOGGER.debug(f"{self.vli}RemoteClimateControl support: {self._supports_REMOTE_CLIMATE_CONTROL} [forced: {self._force_REMOTE_CLIMATE_CONTROL}]")
+
+                self._supports_HEATED_STEERING_WHEEL = caps.get("heatedSteeringWheel", None)
+                _LOGGER.debug(f"{self.vli}HeatedSteeringWheel support: {self._supports_HEATED_STEERING_WHEEL}")
+
+                self._supports_HEATED_HEATED_SEAT_MODE = caps.get("heatedSeatMode", RCC_SEAT_MODE_NONE)
+                _LOGGER.debug(f"{self.vli}DriverHeatedSeat support mode: {self._supports_HEATED_HEATED_SEAT_MODE}")
 
                 # check, if RemoteStart is supported
-                if "vehicleCapabilities" in veh_data:
-                    for capability_obj in veh_data["vehicleCapabilities"]:
-                        if capability_obj["VIN"] == self._vin:
-                            self._supports_ALARM = Tag.ALARM.get_state(self.data) != UNSUPPORTED
-                            self._supports_REMOTE_LOCK = self._check_if_veh_capability_supported("remoteLock", capability_obj)
-                            self._supports_REMOTE_START = self._check_if_veh_capability_supported("remoteStart", capability_obj)
-                            self._supports_TRAILER_LIGHT_CHECK = self._check_if_veh_capability_supported("trailerLightCheck", capability_obj)
-                            self._supports_DEPARTURE_TIMES = self._check_if_veh_capability_supported("departureTimes", capability_obj)
-                            self._supports_GUARD_MODE = self._check_if_veh_capability_supported("guardMode", capability_obj)
-                            self._supports_ZONE_LIGHTING = self._check_if_veh_capability_supported("zoneLighting", capability_obj) and self._number_of_lighting_zones > 0
-                            self._supports_HAF = self._check_if_veh_capability_supported("remotePanicAlarm", capability_obj)
-                            break
-                else:
-                    _LOGGER.warning(f"{self.vli}No vehicleCapabilities in 'vehicles' found in coordinator data - no 'support_remote_start' available! {self.data['vehicles']}")
+                self._supports_ALARM = Tag.ALARM.get_state(self.data) != UNSUPPORTED
+                self._supports_REMOTE_LOCK = caps.get("remoteLock", None)
+                self._supports_REMOTE_START = caps.get("remoteStart", None)
+                self._supports_TRAILER_LIGHT_CHECK = caps.get("trailerLightCheck", None)
+                self._supports_DEPARTURE_TIMES = caps.get("departureTimes", None)
+                self._supports_ZONE_LIGHTING = caps.get("zoneLighting", None)
+                self._supports_HAF = caps.get("remotePanicAlarm", None)
 
                 # check, if GuardMode is supported
                 # [original impl]
                 self._supports_GUARD_MODE = FordpassDataHandler.is_guard_mode_supported(self.data)
 
             else:
-                _LOGGER.warning(f"{self.vli}No vehicles data found in coordinator data - no engineType available! {self.data}")
+                _LOGGER.warning(f"{self.vli}No vehicle capabilities available - no engineType available! {self.data.get(ROOT_VEHICLES, None)}")
 
             # other self._supports_* attribues will be checked in 'metrics' data...
             if ROOT_METRICS in self.data:
                 self._supports_AUTO_UPDATES = Tag.AUTO_UPDATES.get_state(self.data) != UNSUPPORTED
                 _LOGGER.debug(f"{self.vli}AutoUpdates supported: {self._supports_AUTO_UPDATES}")
 
-        else:
-            _LOGGER.warning(f"{self.vli}DATA is NONE!!! - {self.data}")
+            # all _supports_* attributes are known now - so we can build our capability index
+            self._build_capability_index()
 
-    def _check_if_veh_capability_supported(self, a_capability: str, capabilities: dict) -> bool:
-        """Check if a specific vehicle capability is supported."""
-        is_supported = False
-        if a_capability in capabilities and capabilities[a_capability] is not None:
-            val = capabilities[a_capability]
-            if (isinstance(val, bool) and val) or val.upper() == "DISPLAY":
-                is_supported = True
-            _LOGGER.debug(f"{self.vli}Is '{a_capability}' supported?: {is_supported} - {val}")
         else:
-            _LOGGER.warning(f"{self.vli}No '{a_capability}' data found for VIN {self._vin} - assuming not supported")
+            _LOGGER.warning(f"{self.vli}DATA is NONE!!! - {self.data}")
 
-        return is_supported
+    async def restore_from_snapshot(self) -> bool:
+        snapshot = await self.bridge.read_data_snapshot()
+        if snapshot is not None and FordpassDataHandler.is_essential_vehicle_data_available(snapshot):
+            _LOGGER.debug(f"{self.vli}restore_from_snapshot: using last known vehicle data - live data will be requested in the background")
+            self.bridge.restore_data_container(snapshot)
+            self.async_set_updated_data(snapshot)
+            return True
+        return False
+
+    @callback
+    def async_update_listeners(self) -> None:
+        # all entities will (synchronously) recompute their state - so we measure how long this takes
+        a_recompute_start = time.monotonic()
+        super().async_update_listeners()
+        self.bridge.metrics.observe_since("entity_recompute_ms", a_recompute_start)
+
+    async def async_refresh_after_snapshot_restore(self):
+        async with self.bridge.startup.slot(self.vli, "initial_refresh"):
+            if self.bridge.is_shutting_down:
+                return
+            await self.async_refresh()
+        if not self.last_update_success:
+            await self._check_for_reauth()
 
     async def async_request_refresh_force_classic_requests(self):
         self._force_classic_requests = True
@@ -819,6 +691,8 @@ class FordPassDataUpdateCoordinator(DataUpdateCoordinator):
                                 # only for private debugging
                                 # self.write_data_debug(data)
 
+                                await self.bridge.save_data_snapshot()
+
                                 # If data has now been fetched but was previously unavailable, log and reset
                                 if not self._available:
                                     _LOGGER.info(f"{self.vli}_async_update_data: Restored connection to FordPass for {self._vin}")
@@ -900,7 +774,10 @@ class FordPassEntity(CustomFriendlyNameEntity):
         ## messages are login/user bound... so we create an own device for the user objects
         #if not self._tag in [Tag.MESSAGES, Tag.MESSAGES_DELETE_LAST, Tag.MESSAGES_DELETE_ALL]:
         model = "unknown"
-        if "vehicles" in self.coordinator.data and self.coordinator.data["vehicles"] is not None:
+        caps = self.coordinator.bridge.capabilities
+        if caps is not None and caps.get("model", None) is not None:
+            model = f"{caps.get('year', '')} {caps['model']}".strip()
+        elif "vehicles" in self.coordinator.data and self.coordinator.data["vehicles"] is not None:
             if "vehicleProfile" in self.coordinator.data["vehicles"] and self.coordinator.data["vehicles"]["vehicleProfile"] is not None:
                 for vehicle in self.coordinator.data["vehicles"]["vehicleProfile"]:
                     if vehicle["VIN"] == self.coordinator._vin:
@@ -47,6 +47,9 @@ from .const import (
 from .const_shared import (
     CONF_PRESSURE_UNIT,
     CONF_LOG_TO_FILESYSTEM,
+    CONF_COMPACT_METRICS,
+    CONF_CUSTOM_ENTRIES_MAX_AGE,
+    DEFAULT_CUSTOM_ENTRIES_MAX_AGE,
     PRESSURE_UNITS,
     DEFAULT_PRESSURE_UNIT,
 )
@@ -804,5 +807,7 @@ class FordPassOptionsFlowHandler(OptionsFlow):
         options = {vol.Optional(CONF_PRESSURE_UNIT, default=self._options.get(CONF_PRESSURE_UNIT, DEFAULT_PRESSURE_UNIT),): vol.In(PRESSURE_UNITS),
                    vol.Optional(CONF_FORCE_REMOTE_CLIMATE_CONTROL, default=self._options.get(CONF_FORCE_REMOTE_CLIMATE_CONTROL, False),): bool,
                    vol.Optional(CONF_LOG_TO_FILESYSTEM, default=self._options.get(CONF_LOG_TO_FILESYSTEM, False),): bool,
+                   vol.Optional(CONF_COMPACT_METRICS, default=self._options.get(CONF_COMPACT_METRICS, False),): bool,
+                   vol.Optional(CONF_CUSTOM_ENTRIES_MAX_AGE, default=self._options.get(CONF_CUSTOM_ENTRIES_MAX_AGE, DEFAULT_CUSTOM_ENTRIES_MAX_AGE),): int,
                    vol.Optional(UPDATE_INTERVAL, default=self._options.get(UPDATE_INTERVAL, UPDATE_INTERVAL_DEFAULT),): int}
         return self.async_show_form(step_id="init", data_schema=vol.Schema(options), description_placeholders={"integration_name": "fordpass"})
\ No newline at end of file
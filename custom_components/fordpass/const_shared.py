@@ -17,7 +17,11 @@ If you have any issues with this you need to open an issue here:
 """
 
 COORDINATOR_KEY: Final = "coordinator"
+EVENT_NEW_MESSAGE: Final = "fordpass_new_message"
 CONF_LOG_TO_FILESYSTEM: Final = "log_to_filesystem"
+CONF_COMPACT_METRICS: Final = "compact_metrics"
+CONF_CUSTOM_ENTRIES_MAX_AGE: Final = "custom_entries_max_age"
+DEFAULT_CUSTOM_ENTRIES_MAX_AGE: Final = 14
 
 CONF_PRESSURE_UNIT: Final = "pressure_unit"
 DEFAULT_PRESSURE_UNIT: Final = "BAR"
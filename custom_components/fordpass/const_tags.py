@@ -17,7 +17,8 @@ from homeassistant.const import (
     UnitOfLength,
     UnitOfTemperature,
     UnitOfElectricCurrent,
-    EntityCategory
+    EntityCategory,
+    Platform
 )
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util.unit_system import UnitSystem
@@ -404,6 +405,10 @@ class Tag(ApiKey, Enum):
     # refreshes and persists them via RestoreEntity, since Ford does not expose a history list for this
     FIRMWARE_UPDATE_HISTORY = ApiKey(key="firmwareUpdateHistory")
 
+    # state/attrs are not used - this tag is backed by a dedicated sensor class (FordPassStatisticsSensor)
+    # that reads the runtime statistics (counters & histograms) of the integration itself
+    INTEGRATION_STATISTICS = ApiKey(key="integrationStatistics")
+
 
     # Debug Sensors (Disabled by default)
     EVENTS = ApiKey(key="events",
@@ -1042,6 +1047,15 @@ SENSORS = [
         has_entity_name=True,
         entity_category=EntityCategory.DIAGNOSTIC,
     ),
+    ExtSensorEntityDescription(
+        tag=Tag.INTEGRATION_STATISTICS,
+        key=Tag.INTEGRATION_STATISTICS.key,
+        icon="mdi:chart-box-outline",
+        entity_registry_enabled_default=False,
+        skip_existence_check=True,
+        has_entity_name=True,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
 ]
 
 # UNHANDLED_METTRICS:
@@ -1305,3 +1319,15 @@ NUMBERS = [
     #     entity_registry_enabled_default=False
     # )
 ]
+
+# all tags that can be handled by a platform - so we can check (before forwarding the setup to the platform)
+# if there is a single entity that is supported by the vehicle
+PLATFORM_TAGS: Final = {
+    Platform.BUTTON:            frozenset(a_desc.tag for a_desc in BUTTONS),
+    Platform.LOCK:              frozenset([Tag.DOOR_LOCK]),
+    Platform.NUMBER:            frozenset(a_desc.tag for a_desc in NUMBERS),
+    Platform.SENSOR:            frozenset(a_desc.tag for a_desc in SENSORS),
+    Platform.SWITCH:            frozenset(SWITCHES.keys()),
+    Platform.SELECT:            frozenset(a_desc.tag for a_desc in SELECTS),
+    Platform.DEVICE_TRACKER:    frozenset([Tag.TRACKER]),
+}
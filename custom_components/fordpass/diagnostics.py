@@ -0,0 +1,44 @@
+"""Diagnostics support for FordPass"""
+import logging
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, CONF_VIN
+from .const_shared import COORDINATOR_KEY
+from .fordpass_bridge import get_global_cache_sizes
+
+_LOGGER = logging.getLogger(__name__)
+
+TO_REDACT = {
+    CONF_USERNAME, CONF_VIN,
+    # tokens
+    "access_token", "refresh_token", "auth_token", "code_verifier",
+    # location & geo fields of the vehicle data
+    "position", "location", "latitude", "longitude", "lat", "lon", "geoHash", "heading", "compassDirection",
+}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, config_entry: ConfigEntry) -> dict[str, Any]:
+    """Return the diagnostics (incl. the runtime statistics) for a config entry."""
+    diagnostics = {
+        "entry": {
+            "data": async_redact_data(dict(config_entry.data), TO_REDACT),
+            "options": dict(config_entry.options),
+        }
+    }
+    if DOMAIN in hass.data and config_entry.entry_id in hass.data[DOMAIN]:
+        coordinator = hass.data[DOMAIN][config_entry.entry_id][COORDINATOR_KEY]
+        diagnostics["vehicle"] = async_redact_data({
+            "capabilities": coordinator.bridge.capabilities,
+            "platforms": [str(a_platform) for a_platform in coordinator.platforms],
+            "last_update_success": coordinator.last_update_success,
+        }, TO_REDACT)
+        # a fresh sample of the memory usage (the periodic samples are only taken by the watchdog)
+        coordinator.bridge.sample_memory()
+        diagnostics["statistics"] = async_redact_data(coordinator.bridge.get_statistics(), TO_REDACT)
+    diagnostics["global_caches"] = get_global_cache_sizes()
+    return diagnostics
@@ -28,7 +28,8 @@ from .const_shared import (
     ZONE_LIGHTS_VALUE_OFF,
     REMOTE_START_STATE_ACTIVE,
     REMOTE_START_STATE_INACTIVE,
-    HONK_AND_FLASH
+    HONK_AND_FLASH,
+    EVENT_NEW_MESSAGE
 )
 from .fordpass_handler import (
     ROOT_STATES,
@@ -42,6 +43,28 @@ from .fordpass_handler import (
     ROOT_ENERGY_TRANSFER_LOGS,
     ROOT_UPDTIME
 )
+from .fordpass_ingest import normalize_telemetry, is_stale
+from .fordpass_metric_record import SOURCE_POLL, SOURCE_WEBSOCKET, SOURCE_SNAPSHOT
+from .fordpass_timestamps import get_entry_epoch
+from .fordpass_messages import get_message_store_for_account, remove_message_store_for_account, get_message_store_count, FordPassMessageStore
+from .fordpass_metrics import FordPassMetrics
+from .fordpass_memory import FordPassMemoryProfile, prune_custom_entries
+from .fordpass_tasks import FordPassTaskSupervisor
+from .fordpass_startup import get_startup_orchestrator_for_account, remove_startup_orchestrator_for_account, get_startup_orchestrator_count
+from .fordpass_departure_model import remove_departure_model, get_departure_model_cache_size
+from .fordpass_command_stats import (
+    FordPassCommandTracker,
+    FordPassCommandStatistics,
+    read_command_stats,
+    write_command_stats,
+    COMMAND_ACCEPTED
+)
+from .fordpass_capabilities import (
+    derive_vehicle_capabilities,
+    read_capabilities_cache,
+    write_capabilities_cache
+)
+from .fordpass_snapshot import copy_container, encode_snapshot, encode_delta, write_atomic, append_line, read_snapshot_with_journal
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -84,6 +107,19 @@ loginHeadersOct2025 = {
 }
 
 MAX_401_RESPONSE_COUNT: Final = 10
+# min time between two complete writes of the vehicle data snapshot (and between two appends to the journal)
+SNAPSHOT_SAVE_INTERVAL: Final = 60 * 60
+SNAPSHOT_DELTA_INTERVAL: Final = 60
+SNAPSHOT_MAX_JOURNAL_LINES: Final = 250
+# all RCC changes within this time window [in seconds] will be sent as a single profile update
+RCC_COALESCING_WINDOW: Final = 0.75
+# max time [in seconds] we wait for fresh metrics (via the websocket) after a 'statusRefresh' - and the
+# tolerance [in seconds] for the clock difference between HA and the backend
+REFRESH_WAIT_TIMEOUT: Final = 60
+REFRESH_WAIT_CLOCK_TOLERANCE: Final = 2
+# max time to wait for the websocket close handshake & for the pending file writes when the entry will be unloaded [in seconds]
+WS_CLOSE_TIMEOUT: Final = 2
+WRITE_FLUSH_TIMEOUT: Final = 5
 LOG_DATA: Final = False
 
 AUTONOMIC_URL: Final = "https://api.autonomic.ai/v1"
@@ -119,6 +155,37 @@ FORD_COMMAND_MAP: Final ={
 }
 #session = None #requests.Session()
 
+# commands of the same group will be sent one after another (per vehicle) - commands that are not
+# listed here, will be only serialized with the same command
+COMMAND_GROUPS: Final = {
+    "lock":                             "doors",
+    "unlock":                           "doors",
+    "remoteStart":                      "remote_start",
+    "cancelRemoteStart":                "remote_start",
+    "startGlobalChargeCommand":         "charge",
+    "cancelGlobalChargeCommand":        "charge",
+    "pauseGlobalChargeCommand":         "charge",
+    "updateChargeSettingsCommand":      "charge",
+    SET_CHARGE_TARGET_KEY:              "charge",
+    "turnZoneLightsOff":                "zone_lighting",
+    "turnZoneLightsOn":                 "zone_lighting",
+    "setZoneLightsMode":                "zone_lighting",
+    "getGuardMode":                     "guard_mode",
+    "setGuardMode":                     "guard_mode",
+    "delGuardMode":                     "guard_mode",
+    "enableDepartureTimes":             "departure_times",
+    "disableDepartureTimes":            "departure_times",
+    "updateDepartureTimes":             "departure_times",
+    "startOnDemandPreconditioning":     "preconditioning",
+    "extendOnDemandPreconditioning":    "preconditioning",
+    "stopOnDemandPreconditioning":      "preconditioning",
+    "startTrailerLightCheck":           "trailer_light_check",
+    "stopTrailerLightCheck":            "trailer_light_check",
+    "ppoRefresh":                       "ppo_refresh",
+    "ppoRefreshContinuous":             "ppo_refresh",
+    "ppoRefreshContinuousCancel":       "ppo_refresh",
+}
+
 # we need global variables to keep track of the number of 401 responses per user account(=token file)
 _FOUR_NULL_ONE_COUNTER: dict = {}
 _AUTO_FOUR_NULL_ONE_COUNTER: dict = {}
@@ -139,6 +206,30 @@ def get_sync_lock_for_user_and_region(user: str, region_key: str, vli:str) -> th
             #_LOGGER.debug(f"{vli}Using cached threading.Lock for user: {user}, region: {region_key}")
     return _sync_lock_cache[a_key]
 
+# the messages and the vehicle-list (expdashboard) are bound to the ford account - when multiple vehicles of the
+# same account are refreshing at the same time, we only want to send a single request to the backend
+ACCOUNT_REQUEST_CACHE_SECONDS: Final = 30
+_account_requests_in_flight: dict = {}
+_account_requests_cache: dict = {}
+
+def invalidate_account_request_cache(account_key: str, request_name: str = None):
+    for a_key in list(_account_requests_cache.keys()):
+        if a_key[0] == account_key and (request_name is None or a_key[1] == request_name):
+            _account_requests_cache.pop(a_key, None)
+
+def get_global_cache_sizes() -> dict:
+    """The number of entries in all module level maps (that must not grow with every reload of an entry)."""
+    return {
+        "four_null_one_counter": len(_FOUR_NULL_ONE_COUNTER),
+        "auto_four_null_one_counter": len(_AUTO_FOUR_NULL_ONE_COUNTER),
+        "sync_locks": len(_sync_lock_cache),
+        "account_requests_cache": len(_account_requests_cache),
+        "account_requests_in_flight": len(_account_requests_in_flight),
+        "message_stores": get_message_store_count(),
+        "startup_orchestrators": get_startup_orchestrator_count(),
+        "departure_models": get_departure_model_cache_size(),
+    }
+
 class ConnectedFordPassVehicle:
     # Represents a Ford vehicle, with methods for status and issuing commands
 
@@ -152,17 +243,12 @@ class ConnectedFordPassVehicle:
     _cached_vehicles_data: dict
 
     ws_connected: bool = False
-    _ws_debounced_update_task: asyncio.Task | None = None
     _ws_in_use_access_token: str | None = None
     _LAST_MESSAGES_UPDATE: float = 0.0
     _message_update_is_running = False
     _last_ignition_state: str | None = None
     _last_remote_start_state: str | None = None
     _last_ev_connect_state: str | None = None
-    _ws_debounced_full_refresh_task: asyncio.Task | None = None
-    _ws_debounced_preferred_charge_times_refresh_task: asyncio.Task | None = None
-    _ws_debounced_energy_transfer_logs_refresh_task: asyncio.Task | None = None
-    _ws_debounced_update_remote_climate_task: asyncio.Task | None = None
     # when you have multiple vehicles, you need to set the vehicle log id
     # (v)ehicle (l)og (i)d
     vli: str = ""
@@ -171,9 +257,11 @@ class ConnectedFordPassVehicle:
     region_key: Final[str]
     accout_key: Final[str]
     _LOCAL_LOGGING: Final[bool]
+    _COMPACT_METRICS: Final[bool]
 
     def __init__(self, web_session, username, vin, region_key, coordinator: DataUpdateCoordinator=None,
-                 storage_path:Path=None, tokens_location=None, local_logging:bool=False):
+                 storage_path:Path=None, tokens_location=None, local_logging:bool=False, compact_metrics:bool=False,
+                 custom_entries_max_age_days:int=0):
         self.session = web_session
         self.timeout = aiohttp.ClientTimeout(
             total=45,      # Total request timeout
@@ -182,9 +270,15 @@ class ConnectedFordPassVehicle:
             sock_read=120   # Socket read timeout
         )
         self._LOCAL_LOGGING = local_logging
+        self._COMPACT_METRICS = compact_metrics
+        # 'customMetrics' & 'customEvents' that have not been updated for this period will be removed (0 = never)
+        self._custom_entries_max_age = max(0, custom_entries_max_age_days) * 24 * 60 * 60
         self.username = username
         self.region_key = region_key
         self.account_key = f"{username}µ@µ{region_key}"
+        self._message_store = get_message_store_for_account(self.account_key)
+        # the startup of all vehicles of the account will be staggered
+        self.startup = get_startup_orchestrator_for_account(self.account_key)
         self.app_id = REGIONS[self.region_key]["app_id"]
         self.locale_code = REGIONS[self.region_key]["locale"]
         self.login_url = REGIONS[self.region_key]["login_url"]
@@ -226,8 +320,41 @@ class ConnectedFordPassVehicle:
         else:
             self.stored_tokens_location = tokens_location
 
+        if storage_path is not None:
+            self.stored_snapshot_location = str(storage_path.joinpath(DOMAIN, "snapshots", f"{vin}_data.snapshot"))
+        else:
+            self.stored_snapshot_location = f".storage/{DOMAIN}/snapshots/{vin}_data.snapshot"
+        self.stored_snapshot_journal_location = f"{self.stored_snapshot_location}.journal"
+        if storage_path is not None:
+            self.stored_capabilities_location = str(storage_path.joinpath(DOMAIN, "capabilities", f"{vin}.json"))
+        else:
+            self.stored_capabilities_location = f".storage/{DOMAIN}/capabilities/{vin}.json"
+        if storage_path is not None:
+            self.stored_command_stats_location = str(storage_path.joinpath(DOMAIN, "commands", f"{vin}.json"))
+        else:
+            self.stored_command_stats_location = f".storage/{DOMAIN}/commands/{vin}.json"
+        self.command_statistics = FordPassCommandStatistics()
+        self._command_statistics_loaded = False
+        # the commands (by command id) we are currently waiting for a final state
+        self._pending_commands = {}
+        self.capabilities = None
+        self._capabilities_cache_read = False
+        self._skip_initial_vehicles_request = False
+        self._LAST_SNAPSHOT_SAVE = 0.0
+        self._LAST_SNAPSHOT_DELTA_SAVE = 0.0
+        self._snapshot_full_required = True
+        self._snapshot_dirty_keys = set()
+        self._snapshot_journal_lines = 0
+
         self._is_reauth_required = False
-        self.status_updates_allowed = True
+        self.metrics = FordPassMetrics()
+        self.memory_profile = FordPassMemoryProfile()
+
+        # the per-vehicle command queue: the commands in flight (by command & parameters), the locks
+        # per command group and the number of commands that are waiting (by polling) for the final state
+        self._commands_in_flight = {}
+        self._command_group_locks = {}
+        self._commands_polling = 0
 
         self.coordinator = coordinator
         # our main data container that holds all data that have been fetched from the vehicle
@@ -238,6 +365,9 @@ class ConnectedFordPassVehicle:
         self._remote_climate_control_supported = None
         self._remote_climate_control_forced = None
         self._cached_rcc_data = {}
+        self._rcc_pending_update = None
+        # (request_time, future) of the callers that are waiting for metrics newer than the request_time
+        self._fresh_metrics_waiters = []
         self._preferred_charge_times_supported = None
         self._cached_pct_data = {}
         self._energy_transfer_status_supported = None
@@ -246,11 +376,15 @@ class ConnectedFordPassVehicle:
         self._cached_etl_data = {}
 
         # websocket connection related variables
-        self._ws_debounced_update_task = None
-        self._ws_debounced_full_refresh_task = None
-        self._ws_debounced_preferred_charge_times_refresh_task = None
-        self._ws_debounced_energy_transfer_logs_refresh_task = None
-        self._ws_debounced_update_remote_climate_task = None
+        # all background tasks (debounced updates, the websocket, ...) of this vehicle
+        self.tasks = FordPassTaskSupervisor(self)
+        # will be set, when the config entry is going to be unloaded - all waiting loops (command states,
+        # status refresh) will stop immediately
+        self._shutdown_event = asyncio.Event()
+        # the file writes (token, snapshot, ...) that are currently running in the executor
+        self._pending_writes = set()
+        # the full snapshot write removes the journal - so the snapshot & journal writes must not overlap
+        self._snapshot_write_lock = asyncio.Lock()
         self._ws_in_use_access_token = None
         self.ws_connected = False
         self._ws_LAST_UPDATE = 0
@@ -260,6 +394,127 @@ class ConnectedFordPassVehicle:
 
         _LOGGER.info(f"{self.vli}init vehicle object for vin: '{self.vin}' - using token from: '{self.stored_tokens_location}'")
 
+    def get_statistics(self) -> dict:
+        statistics = self.metrics.as_dict()
+        statistics["websocket_connected"] = self.ws_connected
+        statistics["four_null_one_counter"] = _FOUR_NULL_ONE_COUNTER.get(self.vin, 0)
+        statistics["auto_four_null_one_counter"] = _AUTO_FOUR_NULL_ONE_COUNTER.get(self.vin, 0)
+        statistics["commands"] = self.command_statistics.as_dict()
+        statistics["memory"] = self.memory_profile.as_dict()
+        statistics["tasks"] = self.tasks.as_dict()
+        statistics["startup"] = self.startup.as_dict()
+        return statistics
+
+    def sample_memory(self):
+        self.memory_profile.sample(self._data_container)
+
+    def housekeeping(self):
+        """Report long-running tasks, prune the outdated custom entries & sample the size of our data container
+        (at most every MEMORY_SAMPLE_INTERVAL) - the websocket merge only ever adds new 'customMetrics' & 'customEvents'."""
+        self.tasks.check_long_running()
+        now = time.time()
+        if not self.memory_profile.sample_due(now):
+            return
+
+        if self._custom_entries_max_age > 0:
+            removed = prune_custom_entries(self._data_container, self._custom_entries_max_age, now)
+            if len(removed) > 0:
+                _LOGGER.debug(f"{self.vli}housekeeping(): removed {len(removed)} outdated custom entries: {[a_entry[2] for a_entry in removed]}")
+                self.memory_profile.pruned_entries += len(removed)
+                self.metrics.incr("custom_entries_pruned", len(removed))
+                for a_root_key, a_sub_key, a_entry_key in removed:
+                    self._mark_snapshot_dirty(a_root_key, a_sub_key)
+
+        self.memory_profile.sample(self._data_container, now)
+
+    @property
+    def is_shutting_down(self) -> bool:
+        return self._shutdown_event.is_set()
+
+    def begin_shutdown(self):
+        """Stop all waiting loops (command states & status refresh) immediately - no new background tasks
+        will be accepted from now on."""
+        if self._shutdown_event.is_set():
+            return
+        _LOGGER.debug(f"{self.vli}begin_shutdown(): {len(self._pending_commands)} command(s) & {len(self._fresh_metrics_waiters)} refresh waiter(s) pending")
+        self._shutdown_event.set()
+        for a_tracker in list(self._pending_commands.values()):
+            a_tracker.changed.set()
+        for a_request_time, a_future in self._fresh_metrics_waiters:
+            if not a_future.done():
+                a_future.set_result(None)
+
+    async def _sleep_unless_shutdown(self, a_delay: float):
+        try:
+            await asyncio.wait_for(self._shutdown_event.wait(), timeout=a_delay)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _run_write(self, a_write_func):
+        """Run the (synchronous) file write in the executor - the write is tracked (so it can be awaited when the
+        entry will be unloaded) and will not be canceled together with the calling task."""
+        a_future = asyncio.get_running_loop().run_in_executor(None, a_write_func)
+        self._pending_writes.add(a_future)
+        a_future.add_done_callback(self._pending_writes.discard)
+        return await asyncio.shield(a_future)
+
+    async def flush_pending_writes(self, timeout: float = WRITE_FLUSH_TIMEOUT) -> int:
+        """Wait (max timeout seconds) till all running file writes are completed - returns the number of
+        writes that are still running."""
+        if len(self._pending_writes) == 0:
+            return 0
+        done, pending = await asyncio.wait(list(self._pending_writes), timeout=timeout)
+        if len(pending) > 0:
+            _LOGGER.warning(f"{self.vli}flush_pending_writes(): {len(pending)} file write(s) not completed within {timeout} sec")
+        return len(pending)
+
+    async def async_shutdown(self) -> int:
+        """Cooperative shutdown of the vehicle (when the config entry will be unloaded): stop all waiting loops,
+        cancel the background tasks (incl. the websocket), store the final snapshot & flush all pending file
+        writes - returns the duration in ms."""
+        a_start = time.monotonic()
+        self.begin_shutdown()
+        await asyncio.gather(self.tasks.cancel_all(), self.save_data_snapshot(force=True))
+        await self.flush_pending_writes()
+        a_duration = int((time.monotonic() - a_start) * 1000)
+        _LOGGER.debug(f"{self.vli}async_shutdown(): completed in {a_duration} ms")
+        return a_duration
+
+    def release_global_caches(self, account_in_use: bool):
+        """Remove all entries of this vehicle from the module level maps (when the config entry will be unloaded) -
+        the account scoped entries will be only removed, when no other vehicle of the account is loaded."""
+        _FOUR_NULL_ONE_COUNTER.pop(self.vin, None)
+        _AUTO_FOUR_NULL_ONE_COUNTER.pop(self.vin, None)
+        remove_departure_model(self._data_container.get(ROOT_METRICS, {}).get("configurations", {}).get("xevDepartureSchedulesSetting", None))
+        if not account_in_use:
+            with _sync_lock:
+                _sync_lock_cache.pop(self.account_key, None)
+            invalidate_account_request_cache(self.account_key)
+            remove_message_store_for_account(self.account_key)
+            remove_startup_orchestrator_for_account(self.account_key)
+        _LOGGER.debug(f"{self.vli}release_global_caches(): account still in use: {account_in_use} - remaining: {get_global_cache_sizes()}")
+
+    async def load_command_statistics(self):
+        if self._command_statistics_loaded:
+            return
+        self._command_statistics_loaded = True
+        try:
+            stored = await asyncio.get_running_loop().run_in_executor(None, lambda: read_command_stats(self.stored_command_stats_location))
+            if stored is not None:
+                self.command_statistics.from_storage(stored)
+        except BaseException as e:
+            _LOGGER.info(f"{self.vli}load_command_statistics(): Error while reading '{self.stored_command_stats_location}' - {type(e).__name__} - {e}")
+
+    async def save_command_statistics(self):
+        if not self.command_statistics.dirty:
+            return
+        try:
+            stats = self.command_statistics.to_storage()
+            await self._run_write(lambda: write_command_stats(self.stored_command_stats_location, stats))
+            self.command_statistics.dirty = False
+        except BaseException as e:
+            _LOGGER.info(f"{self.vli}save_command_statistics(): Error while writing '{self.stored_command_stats_location}' - {type(e).__name__} - {e}")
+
     async def _local_logging(self, type, data):
         if self._LOCAL_LOGGING:
             await asyncio.get_running_loop().run_in_executor(None, lambda: self.__dump_data(type, data))
@@ -286,6 +541,85 @@ class ConnectedFordPassVehicle:
         self._cached_rcc_data = {}
         self._data_container = {}
 
+    def restore_data_container(self, snapshot: dict):
+        """Restore our data container from a previously stored snapshot (the live data will be merged into it)"""
+        # older snapshots might have been stored before the data was normalized
+        self._data_container = normalize_telemetry(snapshot, self._COMPACT_METRICS, SOURCE_SNAPSHOT)
+        self._snapshot_full_required = False
+        self._LAST_SNAPSHOT_SAVE = time.time()
+        if ROOT_VEHICLES in snapshot and snapshot[ROOT_VEHICLES] is not None and len(snapshot[ROOT_VEHICLES]) > 0:
+            self._cached_vehicles_data = snapshot[ROOT_VEHICLES]
+            self._update_vli_from_vehicles_data(self._cached_vehicles_data)
+        if ROOT_REMOTE_CLIMATE_CONTROL in snapshot and snapshot[ROOT_REMOTE_CLIMATE_CONTROL] is not None:
+            self._cached_rcc_data = snapshot[ROOT_REMOTE_CLIMATE_CONTROL]
+        if ROOT_MESSAGES in snapshot and isinstance(snapshot[ROOT_MESSAGES], list):
+            # seeding the message store - so messages that arrived while HA was down will be reported as new
+            self._message_store.update(snapshot[ROOT_MESSAGES], self.vin)
+
+    async def read_data_snapshot(self) -> dict | None:
+        """Read the last stored snapshot of our data container (incl. all websocket deltas of the journal)"""
+        try:
+            snapshot, journal_lines = await asyncio.get_running_loop().run_in_executor(None, lambda: read_snapshot_with_journal(self.stored_snapshot_location, self.stored_snapshot_journal_location))
+            if snapshot is not None and isinstance(snapshot, dict) and len(snapshot) > 0:
+                _LOGGER.debug(f"{self.vli}read_data_snapshot(): snapshot restored with keys: {list(snapshot.keys())} [+{journal_lines} deltas]")
+                self._snapshot_journal_lines = journal_lines
+                return snapshot
+            else:
+                _LOGGER.debug(f"{self.vli}read_data_snapshot(): no snapshot available at '{self.stored_snapshot_location}'")
+
+        except BaseException as e:
+            _LOGGER.info(f"{self.vli}read_data_snapshot(): Error while reading snapshot '{self.stored_snapshot_location}' - {type(e).__name__} - {e}")
+        return None
+
+    def _mark_snapshot_dirty(self, a_root_key: str, a_sub_key: str = None):
+        if a_sub_key is None or (a_root_key, None) not in self._snapshot_dirty_keys:
+            self._snapshot_dirty_keys.add((a_root_key, a_sub_key))
+
+    async def save_data_snapshot(self, force: bool = False):
+        """Store the current data container (so that we can create all entities instantly on the next startup).
+
+        The complete (compressed) snapshot will only be written every SNAPSHOT_SAVE_INTERVAL - in between only
+        the changed keys will be appended to the journal (at most every SNAPSHOT_DELTA_INTERVAL)."""
+        if self._data_container is None or len(self._data_container.get(ROOT_METRICS, {})) == 0:
+            return
+
+        now = time.time()
+        write_full = (force or
+                      (self._snapshot_full_required and self._LAST_SNAPSHOT_DELTA_SAVE + SNAPSHOT_DELTA_INTERVAL < now) or
+                      self._LAST_SNAPSHOT_SAVE + SNAPSHOT_SAVE_INTERVAL < now or
+                      self._snapshot_journal_lines >= SNAPSHOT_MAX_JOURNAL_LINES)
+        try:
+            if write_full:
+                self._LAST_SNAPSHOT_SAVE = now
+                self._LAST_SNAPSHOT_DELTA_SAVE = now
+                self._snapshot_full_required = False
+                self._snapshot_dirty_keys = set()
+                async with self._snapshot_write_lock:
+                    # the websocket might modify the container in parallel - so only a (cheap) copy is taken in
+                    # the loop, the encoding & compression will be done in the executor
+                    a_container_copy = copy_container(self._data_container)
+                    await self._run_write(lambda: self.__write_snapshot_int(a_container_copy))
+                self._snapshot_journal_lines = 0
+
+            elif len(self._snapshot_dirty_keys) > 0 and self._LAST_SNAPSHOT_DELTA_SAVE + SNAPSHOT_DELTA_INTERVAL < now:
+                self._LAST_SNAPSHOT_DELTA_SAVE = now
+                a_delta_line = encode_delta(self._data_container, self._snapshot_dirty_keys)
+                self._snapshot_dirty_keys = set()
+                async with self._snapshot_write_lock:
+                    await self._run_write(lambda: append_line(self.stored_snapshot_journal_location, a_delta_line))
+                self._snapshot_journal_lines += 1
+
+        except BaseException as e:
+            _LOGGER.info(f"{self.vli}save_data_snapshot(): Error while writing snapshot '{self.stored_snapshot_location}' - {type(e).__name__} - {e}")
+
+    def __write_snapshot_int(self, a_container_copy: dict):
+        """Synchronous method to encode & write the snapshot file (and reset the journal), called from executor."""
+        raw = encode_snapshot(a_container_copy)
+        write_atomic(self.stored_snapshot_location, raw)
+        if os.path.isfile(self.stored_snapshot_journal_location):
+            os.remove(self.stored_snapshot_journal_location)
+        _LOGGER.debug(f"{self.vli}__write_snapshot_int(): snapshot written to '{self.stored_snapshot_location}' [{len(raw)} bytes]")
+
     async def __check_for_closed_session(self, e:BaseException):
         if isinstance(e, RuntimeError) and self.session is not None and self.session.closed:
             self.ws_connected = False
@@ -334,6 +668,7 @@ class ConnectedFordPassVehicle:
         }
 
         try:
+            a_request_start = time.monotonic()
             response = await self.session.post(
                 f"{self.login_url}/{OAUTH_ID}/{sign_up}{self.locale_code}/oauth2/v2.0/token",
                 headers=headers,
@@ -342,6 +677,7 @@ class ConnectedFordPassVehicle:
                 timeout=self.timeout
             )
             _LOGGER.debug(f"{self.vli}REQUEST: {response.request_info.method} {response.request_info.url}")
+            self.metrics.observe_response("login_token", response.status, a_request_start)
 
             # do not check the status code here - since it's not always return http 200!
             token_data = await response.json()
@@ -371,6 +707,7 @@ class ConnectedFordPassVehicle:
     async def generate_tokens_part2(self, token):
         headers = {**apiHeaders, "Application-Id": self.app_id}
         data = {"idpToken": token["access_token"]}
+        a_request_start = time.monotonic()
         response = await self.session.post(
             f"{FORD_FOUNDATIONAL_API}/token/v2/cat-with-b2c-access-token",
             data=json.dumps(data),
@@ -379,6 +716,7 @@ class ConnectedFordPassVehicle:
             timeout=self.timeout
         )
         _LOGGER.debug(f"{self.vli}REQUEST: {response.request_info.method} {response.request_info.url}")
+        self.metrics.observe_response("cat_token", response.status, a_request_start)
 
         # do not check the status code here - since it's not always return http 200!
         final_access_token = await response.json()
@@ -404,6 +742,17 @@ class ConnectedFordPassVehicle:
             _LOGGER.warning(f"{self.vli}generate_tokens_part2 'FAILED' - http status: {response.status} for '...cat-with-b2c-access-token' request - JSON: {final_access_token}")
             return False
 
+    @property
+    def remote_climate_control_supported(self) -> bool:
+        # (the 'forced' option of the coordinator has been already considered)
+        return self._remote_climate_control_supported is True
+
+    @property
+    def status_updates_allowed(self) -> bool:
+        # as long as any command is waiting (by polling) for its final state, the coordinator must not
+        # request the status by itself
+        return self._commands_polling == 0
+
     @property
     def require_reauth(self) -> bool:
         return self._is_reauth_required
@@ -412,7 +761,7 @@ class ConnectedFordPassVehicle:
         stack_trace = traceback.format_stack()
         stack_trace_str = ''.join(stack_trace[:-1])  # Exclude the call to this function
         _LOGGER.info(f"{self.vli}mark_re_auth_required() called\nThis is not an error/issue - it will just help me (marq24, the integration developer) to understand the method sequence - Please do not report this occurrence itself as issue - TIA - so here is the stack trace:\n{stack_trace_str}")
-        asyncio.create_task(self.ws_close(ws))
+        self.tasks.spawn(self.ws_close(ws), "ws_close")
         self._is_reauth_required = True
 
     async def __ensure_valid_tokens(self, now_time:float=None):
@@ -494,6 +843,7 @@ class ConnectedFordPassVehicle:
     async def refresh_token_func(self, prev_token_data):
         """Refresh token if still valid"""
         _LOGGER.debug(f"{self.vli}refresh_token_func()")
+        self.metrics.incr("token_refreshes")
 
         token_data = await self._request_token(prev_token_data)
         if token_data is None or token_data is False:
@@ -546,6 +896,7 @@ class ConnectedFordPassVehicle:
                 data = {
                     "refresh_token": prev_token_data["refresh_token"]
                 }
+                a_request_start = time.monotonic()
                 response = await self.session.post(
                     f"{FORD_FOUNDATIONAL_API}/token/v2/cat-with-refresh-token",
                     data=json.dumps(data),
@@ -553,6 +904,7 @@ class ConnectedFordPassVehicle:
                     timeout=self.timeout
                 )
                 _LOGGER.debug(f"{self.vli}REQUEST: {response.request_info.method} {response.request_info.url}")
+                self.metrics.observe_response("token", response.status, a_request_start)
 
                 if response.status == 200:
                     # ok first resetting the counter for 401 errors (if we had any)
@@ -599,6 +951,7 @@ class ConnectedFordPassVehicle:
 
     async def refresh_auto_token_func(self, cur_token_data):
         _LOGGER.debug(f"{self.vli}refresh_auto_token_func()")
+        self.metrics.incr("auto_token_refreshes")
         auto_token = await self._request_auto_token()
         if auto_token is None or auto_token is False:
             self.auto_access_token = None
@@ -653,6 +1006,7 @@ class ConnectedFordPassVehicle:
                     "grant_type": "urn:ietf:params:oauth:grant-type:token-exchange",
                     "subject_token_type": "urn:ietf:params:oauth:token-type:jwt",
                 }
+                a_request_start = time.monotonic()
                 response = await self.session.post(
                     f"{AUTONOMIC_ACCOUNT_URL}/auth/oidc/token",
                     data=data,
@@ -660,6 +1014,7 @@ class ConnectedFordPassVehicle:
                     timeout=self.timeout
                 )
                 _LOGGER.debug(f"{self.vli}REQUEST: {response.request_info.method} {response.request_info.url}")
+                self.metrics.observe_response("auto_token", response.status, a_request_start)
 
                 if response.status == 200:
                     # ok first resetting the counter for 401 errors (if we had any)
@@ -740,7 +1095,7 @@ class ConnectedFordPassVehicle:
 
         if os.path.exists(directory):
             # Write the file in executor
-            await asyncio.get_running_loop().run_in_executor(None, lambda: self.__write_token_int(token))
+            await self._run_write(lambda: self.__write_token_int(token))
         else:
             _LOGGER.warning(f"{self.vli}_write_token_to_storage(): Directory '{directory}' does not exist, cannot write token file.")
 
@@ -786,6 +1141,29 @@ class ConnectedFordPassVehicle:
             self.mark_re_auth_required()
         return None
 
+    async def check_stored_tokens(self) -> bool:
+        """Cheap local check of the stored tokens (no request) - used when the entities will be created from the
+        snapshot, so invalid credentials are detected before the live data have been requested."""
+        if not os.path.isfile(self.stored_tokens_location):
+            _LOGGER.warning(f"{self.vli}check_stored_tokens(): no token file '{self.stored_tokens_location}' -> mark_re_auth_required()")
+            self.mark_re_auth_required()
+            return False
+
+        token_data = await self._read_token_from_storage()
+        if token_data is None:
+            # (_read_token_from_storage() has marked the re-auth already)
+            return False
+        if token_data.get("refresh_token", None) is None:
+            _LOGGER.warning(f"{self.vli}check_stored_tokens(): no refresh token stored -> mark_re_auth_required()")
+            self.mark_re_auth_required()
+            return False
+        refresh_expiry_date = token_data.get("refresh_expiry_date", None)
+        if refresh_expiry_date is not None and refresh_expiry_date < time.time():
+            _LOGGER.warning(f"{self.vli}check_stored_tokens(): refresh token has expired {int(time.time() - refresh_expiry_date)} sec ago -> mark_re_auth_required()")
+            self.mark_re_auth_required()
+            return False
+        return True
+
     def __read_token_int(self):
         """Synchronous method to read the token file, called from executor."""
         with open(self.stored_tokens_location, encoding="utf-8") as token_file:
@@ -882,6 +1260,7 @@ class ConnectedFordPassVehicle:
                     new_data_arrived = False
                     do_housekeeping_checks = False
                     if msg.type == aiohttp.WSMsgType.TEXT:
+                        self.metrics.incr("ws_frames_received")
                         try:
                             ws_data = msg.json()
                             if ws_data is None or len(ws_data) == 0:
@@ -926,10 +1305,13 @@ class ConnectedFordPassVehicle:
                                     if self._LOCAL_LOGGING:
                                         await self._local_logging("ws", data_obj)
 
+                                    a_merge_start = time.monotonic()
                                     new_data_arrived = self._ws_handle_data(data_obj)
                                     if new_data_arrived is False:
-                                        _LOGGER.debug(f"{self.vli}ws_connect(): received unknown 'data': {data_obj}")
+                                        _LOGGER.debug(f"{self.vli}ws_connect(): received unknown (or only stale) 'data': {data_obj}")
                                     else:
+                                        self.metrics.observe_since("ws_merge_ms", a_merge_start)
+                                        self.metrics.incr("ws_frames_merged")
                                         _LOGGER.debug(f"{self.vli}ws_connect(): received vehicle 'data'")
                                 else:
                                     if self._LOCAL_LOGGING:
@@ -979,14 +1361,20 @@ class ConnectedFordPassVehicle:
         return None
 
     def _ws_handle_data(self, data_obj):
+        normalize_telemetry(data_obj, self._COMPACT_METRICS, SOURCE_WEBSOCKET)
         collected_keys = []
         new_states = self._ws_update_key(data_obj, ROOT_STATES, collected_keys)
         new_events = self._ws_update_key(data_obj, ROOT_EVENTS, collected_keys)
         new_msg = self._ws_update_key(data_obj, ROOT_MESSAGES, collected_keys)
         if new_msg:
             self._LAST_MESSAGES_UPDATE = time.time()
+            # the cached message list of the account is outdated now
+            invalidate_account_request_cache(self.account_key, ROOT_MESSAGES)
 
         new_metrics = self._ws_update_key(data_obj, ROOT_METRICS, collected_keys)
+        if new_metrics and len(self._fresh_metrics_waiters) > 0:
+            self._ws_resolve_fresh_metrics_waiters(data_obj[ROOT_METRICS])
+
         if ROOT_STATES not in data_obj:
             self._ws_update_key(data_obj, ROOT_UPDTIME, collected_keys)
 
@@ -999,16 +1387,13 @@ class ConnectedFordPassVehicle:
             #_LOGGER.info(f"{self.vli}ws(): NEW ignition state '{new_ignition_state}' | LAST ignition state: '{self._last_ignition_state}'")
             if self._last_ignition_state != INTEGRATION_INIT:
                 if "OFF" == new_ignition_state and new_ignition_state != self._last_ignition_state:
-                    if self._ws_debounced_full_refresh_task is not None and not self._ws_debounced_full_refresh_task.done():
-                        self._ws_debounced_full_refresh_task.cancel()
                     _LOGGER.debug(f"{self.vli}ws(): ignition state changed to 'OFF' -> triggering full data update (will be started in 30sec)")
-                    self._ws_debounced_full_refresh_task = asyncio.create_task(self._ws_debounce_full_data_refresh())
+                    self.tasks.spawn(self._ws_debounce_full_data_refresh(), "full_refresh", replace=True)
 
                 elif "ON" == new_ignition_state:
                     # cancel any running the full refresh task if the new state is 'ON'...
-                    if self._ws_debounced_full_refresh_task is not None and not self._ws_debounced_full_refresh_task.done():
-                        _LOGGER.debug(f"{self.vli}ws(): ignition state changed to 'ON' -> canceling any running full refresh task")
-                        self._ws_debounced_full_refresh_task.cancel()
+                    if self.tasks.cancel("full_refresh"):
+                        _LOGGER.debug(f"{self.vli}ws(): ignition state changed to 'ON' -> canceled the running full refresh task")
 
             self._last_ignition_state = new_ignition_state
 
@@ -1018,9 +1403,7 @@ class ConnectedFordPassVehicle:
             new_remote_start_state = REMOTE_START_STATE_ACTIVE if a_start_val > 0 else REMOTE_START_STATE_INACTIVE
             if self._last_remote_start_state != INTEGRATION_INIT:
                 if REMOTE_START_STATE_ACTIVE == new_remote_start_state and self._last_remote_start_state != new_remote_start_state:
-                    if self._ws_debounced_update_remote_climate_task is not None and not self._ws_debounced_update_remote_climate_task.done():
-                        self._ws_debounced_update_remote_climate_task.cancel()
-                    self._ws_debounced_update_remote_climate_task = asyncio.create_task(self._ws_debounced_update_remote_climate())
+                    self.tasks.spawn(self._ws_debounced_update_remote_climate(), "remote_climate_refresh", replace=True)
 
             self._last_remote_start_state = new_remote_start_state
 
@@ -1030,10 +1413,8 @@ class ConnectedFordPassVehicle:
             #_LOGGER.info(f"{self.vli}ws(): NEW EV connect state '{new_ev_connect_state}' | LAST EV connect state: '{self._last_ev_connect_state}'")
             if self._last_ev_connect_state != INTEGRATION_INIT:
                 if "DISCONNECTED" == new_ev_connect_state and new_ev_connect_state != self._last_ev_connect_state:
-                    if self._ws_debounced_energy_transfer_logs_refresh_task is not None and not self._ws_debounced_energy_transfer_logs_refresh_task.done():
-                        self._ws_debounced_energy_transfer_logs_refresh_task.cancel()
                     _LOGGER.debug(f"{self.vli}ws(): EV connect state changed to 'DISCONNECTED' -> triggering 'energy_transfer_logs' data update (will be started in 3min)")
-                    self._ws_debounced_energy_transfer_logs_refresh_task = asyncio.create_task(self._ws_debounce_update_energy_transfer_logs())
+                    self.tasks.spawn(self._ws_debounce_update_energy_transfer_logs(), "energy_transfer_logs_refresh", replace=True)
 
                 elif "CONNECTED" == new_ev_connect_state:
                     pass
@@ -1042,32 +1423,40 @@ class ConnectedFordPassVehicle:
 
         return new_metrics or new_states or new_events or new_msg
 
+    def _ws_resolve_fresh_metrics_waiters(self, metrics_obj):
+        # the newest 'updateTime' of all metrics in this frame...
+        newest_update_time = None
+        if hasattr(metrics_obj, "items"):
+            for a_metric_obj in metrics_obj.values():
+                a_update_time = get_entry_epoch(a_metric_obj) if hasattr(a_metric_obj, "get") else None
+                if a_update_time is not None and (newest_update_time is None or a_update_time > newest_update_time):
+                    newest_update_time = a_update_time
+
+        if newest_update_time is not None:
+            for a_request_time, a_future in self._fresh_metrics_waiters:
+                if newest_update_time > a_request_time - REFRESH_WAIT_CLOCK_TOLERANCE and not a_future.done():
+                    a_future.set_result(newest_update_time)
+
     def _ws_update_key(self, data_obj, a_root_key, collected_keys):
         if a_root_key in data_obj:
 
             if a_root_key == ROOT_STATES:
-                # moving the content of a possible 'commands' dict to the root level
-                # [since this makes checking for commands easier].
-                if "commands" in data_obj[a_root_key] and hasattr(data_obj[a_root_key]["commands"], "items"):
-                    # Move each command to the root level
-                    for cmd_key, cmd_value in data_obj[a_root_key]["commands"].items():
-                        data_obj[a_root_key][cmd_key] = cmd_value
-
-                    # Remove the original commands dictionary
-                    del data_obj[a_root_key]["commands"]
-
+                # (the 'commands' have been already moved to the root level of the states by normalize_telemetry())
                 # special handling for state updates...
+                a_states_container = self._data_container.get(ROOT_STATES, {})
                 for a_state_name, a_state_obj in data_obj[a_root_key].items():
+                    # a late delivered frame must not trigger any side effect (it will be also dropped by the merge below)
+                    if is_stale(a_state_obj, a_states_container.get(a_state_name, None)):
+                        _LOGGER.debug(f"{self.vli}ws(): skip '{a_state_name}' handling - we have already a newer state")
+                        continue
+
                     # "timestamp": "2025-06-05T21:34:47.619487Z",
                     if "timestamp" in a_state_obj and a_state_obj["timestamp"] is not None:
-                        try:
-                            # Convert ISO 8601 format to Unix timestamp
-                            parsed_dt = datetime.fromisoformat(a_state_obj["timestamp"].replace('Z', '+00:00'))
-                            if time.time() - parsed_dt.timestamp() > 60 * 10:
-                                _LOGGER.debug(f"{self.vli}ws(): skip '{a_state_name}' handling - older than 10 minutes")
-                                continue
-                        except BaseException as ex:
-                            pass
+                        # (the ISO 8601 timestamp has been already parsed by normalize_telemetry())
+                        a_state_epoch = get_entry_epoch(a_state_obj)
+                        if a_state_epoch is not None and time.time() - a_state_epoch > 60 * 10:
+                            _LOGGER.debug(f"{self.vli}ws(): skip '{a_state_name}' handling - older than 10 minutes")
+                            continue
 
                     if "value" in a_state_obj:
                         a_value_obj = a_state_obj["value"]
@@ -1075,6 +1464,11 @@ class ConnectedFordPassVehicle:
                             _LOGGER.debug(f"{self.vli}ws(): new state '{a_state_name}' arrived -> toState: {a_value_obj['toState']}")
                             to_state_value_upper = a_value_obj["toState"].upper()
 
+                            # timestamp the transition of the commands we are waiting for
+                            a_tracker = self._pending_commands.get(a_state_obj.get("commandId", None), None)
+                            if a_tracker is not None:
+                                a_tracker.mark(to_state_value_upper)
+
                             # # when we detect, that the car is disconnected from a charger...
                             # # we want to update the 'energy_transfer_logs'
                             # _LOGGER.warning(f"--------------------------------------------> {a_state_name} {to_state_value_upper}")
@@ -1095,10 +1489,8 @@ class ConnectedFordPassVehicle:
                                     # we have a special handling for the 'updateChargeProfilesCommand'
                                     # -> when we receive a 'success' state, we will update our
                                     # energy_transfer_object...
-                                    if self._ws_debounced_preferred_charge_times_refresh_task is not None and not self._ws_debounced_preferred_charge_times_refresh_task.done():
-                                        self._ws_debounced_preferred_charge_times_refresh_task.cancel()
                                     _LOGGER.debug(f"{self.vli}ws(): updateChargeProfilesCommand -> triggering 'preferred_charge_times' data update (will be started in 30sec)")
-                                    self._ws_debounced_preferred_charge_times_refresh_task = asyncio.create_task(self._ws_debounce_update_preferred_charge_times())
+                                    self.tasks.spawn(self._ws_debounce_update_preferred_charge_times(), "preferred_charge_times_refresh", replace=True)
 
                         else:
                             _LOGGER.debug(f"{self.vli}ws(): new state (without toState) '{a_state_name}' arrived: {a_value_obj}")
@@ -1109,31 +1501,49 @@ class ConnectedFordPassVehicle:
             if a_root_key not in self._data_container:
                 self._data_container[a_root_key] = {}
 
-            # Update only the specific keys (e.g. if only one state is present) that are in the new data
+            # Update only the specific keys (e.g. if only one state is present) that are in the new data - entries
+            # that are older than the ones we have already stored (late delivered frames) will be dropped
+            collected_keys_before = len(collected_keys)
             if hasattr(data_obj[a_root_key], "items"):
+                a_root_container = self._data_container[a_root_key]
                 for a_key_name, a_key_value in data_obj[a_root_key].items():
                     # for 'ROOT_METRICS' we must merge 'customMetrics' & 'configurations'
                     # and for 'ROOT_EVENTS' we must merge 'customEvents'
                     if ((a_root_key == ROOT_METRICS and (a_key_name == "customMetrics" or a_key_name == "configurations")) or
                         (a_root_key == ROOT_EVENTS and a_key_name == "customEvents")):
-                        if a_key_name not in self._data_container[a_root_key]:
-                            self._data_container[a_root_key][a_key_name] = {}
+                        if a_key_name not in a_root_container:
+                            a_root_container[a_key_name] = {}
+                        a_sub_container = a_root_container[a_key_name]
+                        any_sub_key_merged = False
                         for a_sub_key_name, a_sub_key_value in a_key_value.items():
-                            self._data_container[a_root_key][a_key_name][a_sub_key_name] = a_sub_key_value
+                            if is_stale(a_sub_key_value, a_sub_container.get(a_sub_key_name, None)):
+                                self.metrics.incr("ws_stale_entries_dropped")
+                                continue
+                            a_sub_container[a_sub_key_name] = a_sub_key_value
                             collected_keys.append(f"{a_key_name}[{a_sub_key_name}]")
+                            any_sub_key_merged = True
+                        if any_sub_key_merged:
+                            self._mark_snapshot_dirty(a_root_key, a_key_name)
                     # for all other keys, we simply update the value
                     else:
-                        self._data_container[a_root_key][a_key_name] = a_key_value
+                        if is_stale(a_key_value, a_root_container.get(a_key_name, None)):
+                            _LOGGER.debug(f"{self.vli}ws(): dropped stale '{a_root_key}.{a_key_name}' - we have already newer data")
+                            self.metrics.incr("ws_stale_entries_dropped")
+                            continue
+                        a_root_container[a_key_name] = a_key_value
                         collected_keys.append(a_key_name)
+                        self._mark_snapshot_dirty(a_root_key, a_key_name)
 
             elif isinstance(data_obj[a_root_key], (str, Number)):
                 self._data_container[a_root_key] = data_obj[a_root_key]
                 collected_keys.append(a_root_key)
+                self._mark_snapshot_dirty(a_root_key)
 
             if a_root_key == ROOT_UPDTIME:
                 _LOGGER.info(f"{self.vli}ws(): this is a 'heartbeat': {data_obj[a_root_key]} {collected_keys}")
 
-            return True
+            # when all entries have been stale, there is nothing new that must be pushed
+            return len(collected_keys) > collected_keys_before
 
         return False
 
@@ -1223,7 +1633,8 @@ class ConnectedFordPassVehicle:
                     # we need to update the messages...
                     msg_data = await self.req_messages()
                     if msg_data is not None:
-                        self._data_container[ROOT_MESSAGES] = msg_data
+                        self._data_container[ROOT_MESSAGES] = self._apply_messages(msg_data)
+                        self._mark_snapshot_dirty(ROOT_MESSAGES)
                         self._ws_notify_for_new_data()
                     elif self._HAS_COM_ERROR:
                         # we have some communication issues when try to read messages - as long as the
@@ -1231,6 +1642,15 @@ class ConnectedFordPassVehicle:
                         # we will still update the last messages update time... so that we don't hammer
                         # the backend with requests...
                         self._LAST_MESSAGES_UPDATE = time.time()
+
+                    # the vehicle data might not have been requested on startup (when the capabilities were cached)
+                    if self._cached_vehicles_data is None or len(self._cached_vehicles_data) == 0:
+                        veh_data = await self.req_vehicles()
+                        if veh_data is not None and len(veh_data) > 0:
+                            self._cached_vehicles_data = veh_data
+                            self._data_container[ROOT_VEHICLES] = veh_data
+                            self._mark_snapshot_dirty(ROOT_VEHICLES)
+
                 else:
                     _LOGGER.debug(f"{self.vli}ws_check_for_message_update_required(): no update required [wait for: {round((to_wait_till - time.time())/60, 1)} min]")
             except BaseException as e:
@@ -1239,14 +1659,19 @@ class ConnectedFordPassVehicle:
             self._message_update_is_running = False
 
     def _ws_notify_for_new_data(self):
-        if self._ws_debounced_update_task is not None and not self._ws_debounced_update_task.done():
-            self._ws_debounced_update_task.cancel()
-        self._ws_debounced_update_task = asyncio.create_task(self._ws_debounce_coordinator_update())
+        if self.tasks.cancel("coordinator_push"):
+            # the pending push has been replaced - so the previous frame(s) will be coalesced into the next push
+            self.metrics.incr("ws_frames_coalesced")
+        self.tasks.spawn(self._ws_debounce_coordinator_update(), "coordinator_push")
 
     async def _ws_debounce_coordinator_update(self):
         await asyncio.sleep(0.3)
         if self.coordinator is not None:
-            self.coordinator.async_set_updated_data(self._data_container)
+            self.push_data_to_coordinator()
+
+    def push_data_to_coordinator(self):
+        self.metrics.incr("coordinator_pushes")
+        self.coordinator.async_set_updated_data(self._data_container)
 
     async def _ws_debounce_full_data_refresh(self):
         try:
@@ -1264,7 +1689,7 @@ class ConnectedFordPassVehicle:
             _LOGGER.debug(f"{self.vli}_ws_debounce_full_data_refresh(): starting the full update now")
             updated_data = await self.update_all()
             if updated_data is not None and self.coordinator is not None:
-                self.coordinator.async_set_updated_data(self._data_container)
+                self.push_data_to_coordinator()
         except CancelledError:
             _LOGGER.debug(f"{self.vli}_ws_debounce_full_data_refresh(): was canceled - all good")
         except BaseException as ex:
@@ -1276,7 +1701,7 @@ class ConnectedFordPassVehicle:
             await asyncio.sleep(5)
             await self.update_remote_climate_int()
             if self.coordinator is not None:
-                self.coordinator.async_set_updated_data(self._data_container)
+                self.push_data_to_coordinator()
         except CancelledError:
             _LOGGER.debug(f"{self.vli}_ws_debounced_update_remote_climate(): was canceled - all good")
         except BaseException as ex:
@@ -1288,7 +1713,7 @@ class ConnectedFordPassVehicle:
         self.ws_connected = False
         if ws is not None:
             try:
-                await ws.close()
+                await asyncio.wait_for(ws.close(), timeout=WS_CLOSE_TIMEOUT)
                 _LOGGER.debug(f"{self.vli}ws_close(): connection closed successfully")
             except BaseException as e:
                 _LOGGER.info(f"{self.vli}ws_close(): Error closing WebSocket connection: {type(e).__name__} - {e}")
@@ -1318,63 +1743,21 @@ class ConnectedFordPassVehicle:
         # data["guardstatus"] = await self.hass.async_add_executor_job(self.guard_status)
         msg_data = await self.req_messages()
         if msg_data is not None:
-            data[ROOT_MESSAGES] = msg_data
+            data[ROOT_MESSAGES] = self._apply_messages(msg_data)
+
+        # will request the vehicle data only if the capabilities are not known yet (and not cached)
+        await self.ensure_capabilities()
 
-        # only update vehicle data if not present yet
-        if self._cached_vehicles_data is None or len(self._cached_vehicles_data) == 0:
+        # only update vehicle data if not present yet (when the capabilities of the vehicle have been read
+        # from our capability cache, the vehicle data is not required for the initial update)
+        if (self._cached_vehicles_data is None or len(self._cached_vehicles_data) == 0) and not self._skip_initial_vehicles_request:
             _LOGGER.debug(f"{self.vli}_update_others(): request vehicle data...")
             self._cached_vehicles_data = await self.req_vehicles()
+        self._skip_initial_vehicles_request = False
 
         if self._cached_vehicles_data is not None and len(self._cached_vehicles_data) > 0:
             data[ROOT_VEHICLES] = self._cached_vehicles_data
 
-            if not self._vehicle_options_init_complete:
-                if "vehicleProfile" in self._cached_vehicles_data:
-                    for a_vehicle_profile in self._cached_vehicles_data["vehicleProfile"]:
-                        if a_vehicle_profile["VIN"] == self.vin:
-
-                            # we must check if the vehicle supports 'remote climate control'...
-                            if hasattr(self.coordinator, "_force_REMOTE_CLIMATE_CONTROL") and self.coordinator._force_REMOTE_CLIMATE_CONTROL:
-                                self._remote_climate_control_supported = True
-                                self._remote_climate_control_forced = True
-                            else:
-                                self._remote_climate_control_forced = False
-                                if "remoteClimateControl" in a_vehicle_profile:
-                                    self._remote_climate_control_supported = a_vehicle_profile["remoteClimateControl"]
-                                elif "remoteHeatingCooling" in a_vehicle_profile:
-                                    self._remote_climate_control_supported = a_vehicle_profile["remoteHeatingCooling"]
-                                else:
-                                    self._remote_climate_control_supported = False
-
-                            if "showEVBatteryLevel" in a_vehicle_profile:
-                                self._preferred_charge_times_supported = a_vehicle_profile["showEVBatteryLevel"]
-                                #self._energy_transfer_status_supported = a_vehicle_profile["showEVBatteryLevel"]
-
-                                # I would like to have a more specific check here...
-                                self._energy_transfer_logs_supported = a_vehicle_profile["showEVBatteryLevel"]
-                            else:
-                                self._preferred_charge_times_supported = False
-                                self._energy_transfer_status_supported = False
-                                self._energy_transfer_logs_supported = True
-
-                            # tripAndChargeLogs is not present in the 'a_vehicle_profile'
-                            # if "tripAndChargeLogs" in a_vehicle_profile:
-                            #     val = a_vehicle_profile["tripAndChargeLogs"]
-                            #     if (isinstance(val, bool) and val) or val.upper() == "DISPLAY":
-                            #         _LOGGER.warning(f"AAA: {val}")
-                            #         self._energy_transfer_logs_supported = True
-                            #     else:
-                            #         _LOGGER.warning(f"BBB: {val}")
-                            #         self._energy_transfer_logs_supported = False
-                            # else:
-                            #     _LOGGER.warning(f"CCC: {a_vehicle_profile}")
-                            #     self._energy_transfer_logs_supported = False
-
-                            # ok record that we do not read the vehicle profile data again - since the init for this
-                            # VIN is completed...
-                            self._vehicle_options_init_complete = True
-                            break
-
         # only update remote climate data if not present yet
         if self._remote_climate_control_supported:
             if self._cached_rcc_data is None or len(self._cached_rcc_data) == 0:
@@ -1412,6 +1795,69 @@ class ConnectedFordPassVehicle:
 
         # ok finally store the data in our main data container...
         self._data_container = data
+        self._snapshot_full_required = True
+
+    async def ensure_capabilities(self, allow_request: bool = True) -> dict | None:
+        """Make sure that the capabilities of the vehicle are known - without 'allow_request' the capabilities
+        will be only derived from the cache or the already known vehicle data. The capabilities are only read
+        during the setup (the coordinator derives its _supports_* attributes from them) - an expired cache will
+        be refreshed with the next setup of the integration."""
+        if self.capabilities is not None:
+            return self.capabilities
+
+        if not self._capabilities_cache_read:
+            self._capabilities_cache_read = True
+            try:
+                caps, created = await asyncio.get_running_loop().run_in_executor(None, lambda: read_capabilities_cache(self.stored_capabilities_location))
+                if caps is not None:
+                    _LOGGER.debug(f"{self.vli}ensure_capabilities(): using cached capabilities [age: {round((time.time() - created) / 3600, 1)} h]")
+                    self._apply_capabilities(caps)
+                    if self._cached_vehicles_data is None or len(self._cached_vehicles_data) == 0:
+                        self._skip_initial_vehicles_request = True
+                    return self.capabilities
+            except BaseException as e:
+                _LOGGER.info(f"{self.vli}ensure_capabilities(): Error while reading '{self.stored_capabilities_location}' - {type(e).__name__} - {e}")
+
+        if not allow_request:
+            if self._cached_vehicles_data is None or len(self._cached_vehicles_data) == 0:
+                _LOGGER.debug(f"{self.vli}ensure_capabilities(): no vehicle data available (and no request allowed)")
+                return self.capabilities
+        elif self._cached_vehicles_data is None or len(self._cached_vehicles_data) == 0:
+            _LOGGER.debug(f"{self.vli}ensure_capabilities(): request vehicle data...")
+            veh_data = await self.req_vehicles()
+            if veh_data is not None and len(veh_data) > 0:
+                self._cached_vehicles_data = veh_data
+                if self._data_container is not None and len(self._data_container) > 0:
+                    self._data_container[ROOT_VEHICLES] = veh_data
+                    self._mark_snapshot_dirty(ROOT_VEHICLES)
+
+        caps = derive_vehicle_capabilities(self._cached_vehicles_data, self.vin, self.vli)
+        if caps is not None:
+            self._apply_capabilities(caps)
+            try:
+                await self._run_write(lambda: write_capabilities_cache(self.stored_capabilities_location, caps))
+            except BaseException as e:
+                _LOGGER.info(f"{self.vli}ensure_capabilities(): Error while writing '{self.stored_capabilities_location}' - {type(e).__name__} - {e}")
+        return self.capabilities
+
+    def _apply_capabilities(self, caps: dict):
+        self.capabilities = caps
+
+        if "@" in self.vli and caps.get("model", None) is not None:
+            self.vli = f"[{caps['model']}] "
+
+        # we must check if the vehicle supports 'remote climate control'...
+        if hasattr(self.coordinator, "_force_REMOTE_CLIMATE_CONTROL") and self.coordinator._force_REMOTE_CLIMATE_CONTROL:
+            self._remote_climate_control_supported = True
+            self._remote_climate_control_forced = True
+        else:
+            self._remote_climate_control_forced = False
+            self._remote_climate_control_supported = caps.get("remoteClimateControl", False)
+
+        self._preferred_charge_times_supported = caps.get("preferredChargeTimes", False)
+        self._energy_transfer_status_supported = caps.get("energyTransferStatus", False)
+        self._energy_transfer_logs_supported = caps.get("energyTransferLogs", False)
+        self._vehicle_options_init_complete = True
 
     async def update_remote_climate_int(self):
         # only update remote climate data if not present yet
@@ -1421,6 +1867,7 @@ class ConnectedFordPassVehicle:
 
             if self._cached_rcc_data is not None and len(self._cached_rcc_data) > 0:
                 self._data_container[ROOT_REMOTE_CLIMATE_CONTROL] = self._cached_rcc_data
+                self._mark_snapshot_dirty(ROOT_REMOTE_CLIMATE_CONTROL)
 
     async def update_preferred_charge_times_int(self):
         # only update remote climate data if not present yet
@@ -1430,6 +1877,7 @@ class ConnectedFordPassVehicle:
 
             if self._cached_pct_data is not None and len(self._cached_pct_data) > 0:
                 self._data_container[ROOT_PREFERRED_CHARGE_TIMES] = self._cached_pct_data
+                self._mark_snapshot_dirty(ROOT_PREFERRED_CHARGE_TIMES)
                 return True
 
         return False
@@ -1442,6 +1890,7 @@ class ConnectedFordPassVehicle:
 
             if self._cached_ets_data is not None and len(self._cached_ets_data) > 0:
                 self._data_container[ROOT_ENERGY_TRANSFER_STATUS] = self._cached_ets_data
+                self._mark_snapshot_dirty(ROOT_ENERGY_TRANSFER_STATUS)
                 return True
 
         return False
@@ -1454,6 +1903,7 @@ class ConnectedFordPassVehicle:
 
             if self._cached_etl_data is not None and len(self._cached_etl_data) > 0:
                 self._data_container[ROOT_ENERGY_TRANSFER_LOGS] = self._cached_etl_data
+                self._mark_snapshot_dirty(ROOT_ENERGY_TRANSFER_LOGS)
                 return True
 
         return False
@@ -1476,7 +1926,7 @@ class ConnectedFordPassVehicle:
                     success_energy = True
 
                 if success_times and success_energy and self.coordinator is not None:
-                    self.coordinator.async_set_updated_data(self._data_container)
+                    self.push_data_to_coordinator()
 
             except CancelledError:
                 _LOGGER.debug(f"{self.vli}_ws_debounce_update_preferred_charge_times(): was canceled - all good")
@@ -1493,7 +1943,7 @@ class ConnectedFordPassVehicle:
                     _LOGGER.debug(f"{self.vli}_ws_debounce_update_energy_transfer_logs(): starting the 'update_energy_transfer_logs_int()' update now")
                     success = await self.update_energy_transfer_logs_int()
                     if success:
-                        self.coordinator.async_set_updated_data(self._data_container)
+                        self.push_data_to_coordinator()
 
             except CancelledError:
                 _LOGGER.debug(f"{self.vli}_ws_debounce_update_energy_transfer_logs(): was canceled - all good")
@@ -1544,6 +1994,7 @@ class ConnectedFordPassVehicle:
                         "messages",
                     ]
                 }
+                a_request_start = time.monotonic()
                 response_state = await self.session.post(
                     f"{AUTONOMIC_BETA_URL}/telemetry/sources/fordpass/vehicles/{self.vin}:query",
                     headers=headers_state,
@@ -1560,6 +2011,7 @@ class ConnectedFordPassVehicle:
                 params_state = {
                     "lrdt": "01-01-1970 00:00:00"
                 }
+                a_request_start = time.monotonic()
                 response_state = await self.session.get(
                     f"{AUTONOMIC_URL}/telemetry/sources/fordpass/vehicles/{self.vin}",
                     params=params_state,
@@ -1567,6 +2019,7 @@ class ConnectedFordPassVehicle:
                     timeout=self.timeout
                 )
             _LOGGER.debug(f"{self.vli}REQUEST: {response_state.request_info.method} {response_state.request_info.url}")
+            self.metrics.observe_response("status", response_state.status, a_request_start)
 
             if response_state.status == 200:
                 # ok first resetting the counter for 401 errors (if we had any)
@@ -1575,7 +2028,7 @@ class ConnectedFordPassVehicle:
                 result_state = await response_state.json()
                 if self._LOCAL_LOGGING:
                     await self._local_logging("state", result_state)
-                return result_state
+                return normalize_telemetry(result_state, self._COMPACT_METRICS, SOURCE_POLL)
             elif response_state.status == 401:
                 _AUTO_FOUR_NULL_ONE_COUNTER[self.vin] += 1
                 if _AUTO_FOUR_NULL_ONE_COUNTER[self.vin] > MAX_401_RESPONSE_COUNT:
@@ -1616,7 +2069,71 @@ class ConnectedFordPassVehicle:
             self._HAS_COM_ERROR = True
             return None
 
+    async def _coalesced_account_request(self, request_name: str, request_fn):
+        a_key = (self.account_key, request_name)
+        a_cache_entry = _account_requests_cache.get(a_key, None)
+        if a_cache_entry is not None and a_cache_entry[0] + ACCOUNT_REQUEST_CACHE_SECONDS > time.time():
+            _LOGGER.debug(f"{self.vli}_coalesced_account_request(): '{request_name}' using account cache [age: {round(time.time() - a_cache_entry[0], 1)} sec]")
+            return a_cache_entry[1]
+
+        a_task, a_owner = _account_requests_in_flight.get(a_key, (None, None))
+        if a_task is None or a_task.done():
+            async def _do_request():
+                try:
+                    a_result = await request_fn()
+                    if a_result is not None:
+                        _account_requests_cache[a_key] = (time.time(), a_result)
+                    return a_result
+                finally:
+                    _account_requests_in_flight.pop(a_key, None)
+
+            a_owner = self
+            a_task = self.tasks.spawn(_do_request(), f"account_{request_name}")
+            if a_task is None:
+                # our supervisor is closed (the entry will be unloaded)
+                return None
+            _account_requests_in_flight[a_key] = (a_task, a_owner)
+        else:
+            _LOGGER.debug(f"{self.vli}_coalesced_account_request(): '{request_name}' joining request in flight of {a_owner.vli}")
+
+        try:
+            # other vehicles might wait for the same task - so a cancel of this caller must not cancel the request
+            a_result = await asyncio.shield(a_task)
+        except CancelledError:
+            if not a_task.cancelled():
+                # we have been canceled ourselves
+                raise
+            # the request has been canceled by the owner (its config entry has been unloaded)
+            _LOGGER.debug(f"{self.vli}_coalesced_account_request(): '{request_name}' was canceled by {a_owner.vli}")
+            return None
+
+        self._adopt_account_request_state(a_owner, a_result)
+        return a_result
+
+    def _adopt_account_request_state(self, a_owner, a_result):
+        """The shared request has been executed by the bridge of another vehicle (of the same account) - the
+        communication error, the 401 counter & the re-auth state of that request must be applied to us too."""
+        if a_owner is self:
+            return
+        if a_result is not None:
+            _FOUR_NULL_ONE_COUNTER[self.vin] = 0
+        else:
+            _FOUR_NULL_ONE_COUNTER[self.vin] = max(_FOUR_NULL_ONE_COUNTER.get(self.vin, 0), _FOUR_NULL_ONE_COUNTER.get(a_owner.vin, 0))
+            if a_owner._HAS_COM_ERROR:
+                self._HAS_COM_ERROR = True
+            if a_owner.require_reauth and not self.require_reauth:
+                _LOGGER.warning(f"{self.vli}_adopt_account_request_state(): shared request of {a_owner.vli} requires re-auth - mark_re_auth_required()")
+                self.mark_re_auth_required()
+            _LOGGER.debug(f"{self.vli}_adopt_account_request_state(): shared request of {a_owner.vli} failed - COMM ERROR: {self._HAS_COM_ERROR}")
+
     async def req_messages(self):
+        """Get Vehicle messages from API (shared by all vehicles of the account)"""
+        result = await self._coalesced_account_request(ROOT_MESSAGES, self.req_messages_int)
+        if result is not None:
+            self._LAST_MESSAGES_UPDATE = time.time()
+        return result
+
+    async def req_messages_int(self):
         """Get Vehicle messages from API"""
         global _FOUR_NULL_ONE_COUNTER
         try:
@@ -1634,8 +2151,10 @@ class ConnectedFordPassVehicle:
                 "auth-token": self.access_token,
                 "Application-Id": self.app_id,
             }
+            a_request_start = time.monotonic()
             response_msg = await self.session.get(f"{FORD_FOUNDATIONAL_API}/messagecenter/v3/messages", headers=headers_msg, timeout=self.timeout)
             _LOGGER.debug(f"{self.vli}REQUEST: {response_msg.request_info.method} {response_msg.request_info.url}")
+            self.metrics.observe_response("messages", response_msg.status, a_request_start)
 
             if response_msg.status == 200:
                 # ok first resetting the counter for 401 errors (if we had any)
@@ -1669,6 +2188,33 @@ class ConnectedFordPassVehicle:
             self._HAS_COM_ERROR = True
             return None
 
+    def _apply_messages(self, msg_data: list) -> list:
+        added, removed_ids = self._message_store.update(msg_data, self.vin)
+        if len(added) > 0 or len(removed_ids) > 0:
+            _LOGGER.debug(f"{self.vli}_apply_messages(): {len(added)} new and {len(removed_ids)} removed messages")
+
+        if self.coordinator is not None and self.coordinator.hass is not None:
+            for a_msg in added:
+                self.coordinator.hass.bus.async_fire(EVENT_NEW_MESSAGE, {
+                    "vin": self.vin,
+                    "message_id": a_msg.get("messageId"),
+                    "created_date": a_msg.get("createdDate"),
+                    "message_type": a_msg.get("messageType"),
+                    "subject": a_msg.get("messageSubject"),
+                    "body": a_msg.get("messageBody"),
+                })
+        # the store is shared by all vehicles of the account - so each container gets its own (mutable) list
+        # [the snapshot & the message attributes are list based]
+        return list(self._message_store.messages)
+
+    @property
+    def message_store(self) -> FordPassMessageStore:
+        return self._message_store
+
+    def get_message_ids(self) -> list:
+        """All message ids that are relevant for this vehicle"""
+        return self._message_store.get_ids_for_vin(self.vin)
+
     async def delete_messages(self, delete_list: list = None):
         """Get Vehicle messages from API"""
         global _FOUR_NULL_ONE_COUNTER
@@ -1691,14 +2237,18 @@ class ConnectedFordPassVehicle:
             post_data = {
                 "messageIds": delete_list
             }
+            a_request_start = time.monotonic()
             response_msg = await self.session.delete(f"{FORD_FOUNDATIONAL_API}/messagecenter/v3/user/messages", data=json.dumps(post_data), headers=headers_msg, timeout=self.timeout)
             _LOGGER.debug(f"{self.vli}REQUEST: {response_msg.request_info.method} {response_msg.request_info.url}")
+            self.metrics.observe_response("messages_delete", response_msg.status, a_request_start)
 
             if response_msg.status == 200:
                 # ok first resetting the counter for 401 errors (if we had any)
                 _FOUR_NULL_ONE_COUNTER[self.vin] = 0
                 result_msg = await response_msg.json()
                 _LOGGER.debug(f"{self.vli}delete_messages(): Deleted messages response: {result_msg}")
+                self._message_store.remove_ids(delete_list)
+                invalidate_account_request_cache(self.account_key, ROOT_MESSAGES)
                 self._LAST_MESSAGES_UPDATE = 0
                 return True
             elif response_msg.status == 401:
@@ -1723,7 +2273,25 @@ class ConnectedFordPassVehicle:
             self._HAS_COM_ERROR = True
             return None
 
-    async def req_vehicles(self, retry:int=0):
+    async def req_vehicles(self):
+        """Get the vehicle list from the ford account (shared by all vehicles of the account)"""
+        result_veh = await self._coalesced_account_request(ROOT_VEHICLES, self.req_vehicles_int)
+        self._update_vli_from_vehicles_data(result_veh)
+        return result_veh
+
+    def _update_vli_from_vehicles_data(self, result_veh: dict):
+        # creating our logger id for the vehicle...
+        if "@" in self.vli and result_veh is not None and "userVehicles" in result_veh and "vehicleDetails" in result_veh["userVehicles"]:
+            self._vehicles = result_veh["userVehicles"]["vehicleDetails"]
+            self._vehicle_name = {}
+            if "vehicleProfile" in result_veh:
+                for a_vehicle in result_veh["vehicleProfile"]:
+                    if "VIN" in a_vehicle and "model" in a_vehicle:
+                        if self.vin == a_vehicle["VIN"]:
+                            self.vli = f"[{a_vehicle['model']}] "
+                            break
+
+    async def req_vehicles_int(self, retry:int=0):
         """Get the vehicle list from the ford account"""
         global _FOUR_NULL_ONE_COUNTER
         try:
@@ -1746,6 +2314,7 @@ class ConnectedFordPassVehicle:
             data_veh = {
                 "dashboardRefreshRequest": "All"
             }
+            a_request_start = time.monotonic()
             response_veh = await self.session.post(
                 f"{FORD_VEHICLE_API}/expdashboard/v1/details/",
                 headers=headers_veh,
@@ -1753,6 +2322,7 @@ class ConnectedFordPassVehicle:
                 timeout=self.timeout
             )
             _LOGGER.debug(f"{self.vli}REQUEST: {response_veh.request_info.method} {response_veh.request_info.url}")
+            self.metrics.observe_response("vehicles", response_veh.status, a_request_start)
 
             if response_veh.status == 207 or response_veh.status == 200:
                 # ok first resetting the counter for 401 errors (if we had any)
@@ -1761,17 +2331,6 @@ class ConnectedFordPassVehicle:
                 result_veh = await response_veh.json()
                 if self._LOCAL_LOGGING:
                     await self._local_logging("veh", result_veh)
-
-                # creating our logger id for the vehicle...
-                if "@" in self.vli and result_veh is not None and "userVehicles" in result_veh and "vehicleDetails" in result_veh["userVehicles"]:
-                    self._vehicles = result_veh["userVehicles"]["vehicleDetails"]
-                    self._vehicle_name = {}
-                    if "vehicleProfile" in result_veh:
-                        for a_vehicle in result_veh["vehicleProfile"]:
-                            if "VIN" in a_vehicle and "model" in a_vehicle:
-                                if self.vin == a_vehicle["VIN"]:
-                                    self.vli = f"[{a_vehicle['model']}] "
-                                    break
                 return result_veh
 
             elif response_veh.status == 401:
@@ -1795,7 +2354,7 @@ class ConnectedFordPassVehicle:
                 if retry < 5:
                     new_retry = retry + 1
                     await asyncio.sleep(random.uniform(0.2, 1.5))
-                    return await self.req_vehicles(new_retry)
+                    return await self.req_vehicles_int(new_retry)
             else:
                 _LOGGER.info(f"{self.vli}req_vehicles(): RuntimeError - Session was closed occurred - but a new Session could be generated")
 
@@ -1812,6 +2371,7 @@ class ConnectedFordPassVehicle:
                 "Authorization": f"Bearer {self.auto_access_token}",
                 #"Host": "api.autonomic.ai"
             }
+            a_request_start = time.monotonic()
             response_inv = await self.session.get(
                 f"{AUTONOMIC_URL}/inventory/vehicles:getByVin",
                 params={"vin": self.vin, "includeRelations": "groups"},
@@ -1819,6 +2379,7 @@ class ConnectedFordPassVehicle:
                 timeout=self.timeout,
             )
             _LOGGER.debug(f"{self.vli}REQUEST: {response_inv.request_info.method} {response_inv.request_info.url}")
+            self.metrics.observe_response("inventory", response_inv.status, a_request_start)
 
             if 200 <= response_inv.status <= 205:
                 inventory_data = await response_inv.json()
@@ -1854,6 +2415,7 @@ class ConnectedFordPassVehicle:
             data_veh = {
                 "vin": self.vin
             }
+            a_request_start = time.monotonic()
             response_rcc = await self.session.post(
                 f"{FORD_VEHICLE_API}/rcc/profile/status",
                 headers=headers_veh,
@@ -1861,6 +2423,7 @@ class ConnectedFordPassVehicle:
                 timeout=self.timeout
             )
             _LOGGER.debug(f"{self.vli}REQUEST: {response_rcc.request_info.method} {response_rcc.request_info.url}")
+            self.metrics.observe_response("rcc_status", response_rcc.status, a_request_start)
 
             if response_rcc.status == 200:
                 # ok first resetting the counter for 401 errors (if we had any)
@@ -1937,12 +2500,14 @@ class ConnectedFordPassVehicle:
                 "Application-Id": self.app_id,
                 "vin": self.vin
             }
+            a_request_start = time.monotonic()
             response_pct = await self.session.get(
                 f"{FORD_VEHICLE_API}/electrification/experiences/v2/vehicles/preferred-charge-times",
                 headers=headers_veh,
                 timeout=self.timeout
             )
             _LOGGER.debug(f"{self.vli}REQUEST: {response_pct.request_info.method} {response_pct.request_info.url}")
+            self.metrics.observe_response("preferred_charge_times", response_pct.status, a_request_start)
 
             if response_pct.status == 200:
                 # ok first resetting the counter for 401 errors (if we had any)
@@ -2020,12 +2585,14 @@ class ConnectedFordPassVehicle:
                 "Application-Id": self.app_id,
                 "deviceId": self.vin
             }
+            a_request_start = time.monotonic()
             response_ets = await self.session.get(
                 f"{FORD_VEHICLE_API}/electrification/experiences/v2/devices/energy-transfer-status",
                 headers=headers_veh,
                 timeout=self.timeout
             )
             _LOGGER.debug(f"{self.vli}REQUEST: {response_ets.request_info.method} {response_ets.request_info.url}")
+            self.metrics.observe_response("energy_transfer_status", response_ets.status, a_request_start)
 
             if response_ets.status == 200:
                 # ok first resetting the counter for 401 errors (if we had any)
@@ -2081,6 +2648,7 @@ class ConnectedFordPassVehicle:
                 "Application-Id": self.app_id,
                 "deviceId": self.vin
             }
+            a_request_start = time.monotonic()
             response_etl = await self.session.get(
                 # we hard code 'maxRecords=20' here - since that's what the app is requesting AND
                 # the backend will anyhow return a max of 21 records... which is still some sort
@@ -2090,6 +2658,7 @@ class ConnectedFordPassVehicle:
                 timeout=self.timeout
             )
             _LOGGER.debug(f"{self.vli}REQUEST: {response_etl.request_info.method} {response_etl.request_info.url}")
+            self.metrics.observe_response("energy_transfer_logs", response_etl.status, a_request_start)
 
             if response_etl.status == 200:
                 # ok first resetting the counter for 401 errors (if we had any)
@@ -2313,7 +2882,61 @@ class ConnectedFordPassVehicle:
                                                                    wait_for_state=True)
         return False
 
-    async def set_rcc(self, data:dict, result_list:dict):
+    async def set_rcc(self, data:dict, result_list:dict, changed_preferences:dict=None):
+        # when an automation sets e.g. the temperature, the seats & the defrost - we don't want to send
+        # a profile update for each single change - so we collect all changes within a short time window
+        # and send them (together with the latest profile data) as a single profile update
+        if self.tasks.closed:
+            _LOGGER.debug(f"{self.vli}set_rcc() - vehicle is unloading - profile update will not be sent")
+            return False
+        if self._rcc_pending_update is None:
+            self._rcc_pending_update = {
+                "data": data,
+                "result_list": result_list,
+                "changes": dict(changed_preferences) if changed_preferences is not None else {},
+                "future": asyncio.get_running_loop().create_future()
+            }
+            self._rcc_pending_update["task"] = self.tasks.spawn(self._set_rcc_after_coalescing_window(), "rcc_update")
+        else:
+            _LOGGER.debug(f"{self.vli}set_rcc() - merging change into pending profile update: {changed_preferences}")
+            self.metrics.incr("rcc_updates_coalesced")
+            self._rcc_pending_update["data"] = data
+            self._rcc_pending_update["result_list"] = result_list
+            if changed_preferences is not None:
+                self._rcc_pending_update["changes"].update(changed_preferences)
+
+        # all callers will get the result of the combined profile update
+        return await asyncio.shield(self._rcc_pending_update["future"])
+
+    async def _set_rcc_after_coalescing_window(self):
+        try:
+            await asyncio.sleep(RCC_COALESCING_WINDOW)
+        except CancelledError:
+            # the vehicle is going to be unloaded - the waiting callers must not wait forever
+            a_pending_update = self._rcc_pending_update
+            self._rcc_pending_update = None
+            if a_pending_update is not None and not a_pending_update["future"].done():
+                a_pending_update["future"].set_result(False)
+            raise
+        a_pending_update = self._rcc_pending_update
+        self._rcc_pending_update = None
+        try:
+            # the latest profile data might not contain the changes of the previous callers (when the
+            # remote climate control data have been refreshed in the meantime)
+            for a_pref in a_pending_update["data"].get("userPreferences", []):
+                a_type = a_pref.get("preferenceType", "")
+                if a_type in a_pending_update["changes"]:
+                    a_pref["preferenceValue"] = a_pending_update["changes"][a_type]
+
+            result = await self._set_rcc_int(a_pending_update["data"], a_pending_update["result_list"])
+        except BaseException as e:
+            _LOGGER.warning(f"{self.vli}_set_rcc_after_coalescing_window() - {type(e).__name__} - {e}")
+            result = False
+
+        if not a_pending_update["future"].done():
+            a_pending_update["future"].set_result(result)
+
+    async def _set_rcc_int(self, data:dict, result_list:dict):
         _LOGGER.debug(f"{self.vli}set_rcc() - Attempting to set RCC with VIN: {data.get('vin')}, crccStateFlag: {data.get('crccStateFlag')}, preferences count: {len(data.get('userPreferences', []))}")
 
         result = await self.__request_command(command="setRemoteClimateControl", post_data=data)
@@ -2327,9 +2950,10 @@ class ConnectedFordPassVehicle:
                     self._data_container[ROOT_REMOTE_CLIMATE_CONTROL] = {}
 
                 self._data_container[ROOT_REMOTE_CLIMATE_CONTROL] = self._cached_rcc_data
+                self._mark_snapshot_dirty(ROOT_REMOTE_CLIMATE_CONTROL)
                 _LOGGER.debug(f"{self.vli}set_rcc() - Updated cached RCC data")
                 if self.coordinator is not None:
-                    self.coordinator.async_set_updated_data(self._data_container)
+                    self.push_data_to_coordinator()
         else:
             _LOGGER.info(f"{self.vli}set_rcc() - remote_climate_control failed: data that was sent: {data}")
 
@@ -2403,6 +3027,49 @@ class ConnectedFordPassVehicle:
         status = await self.__request_and_poll_command_autonomic(baseurl=AUTONOMIC_URL, write_command="statusRefresh")
         return status
 
+    async def request_update_and_wait(self, timeout: float = REFRESH_WAIT_TIMEOUT) -> bool:
+        """Send request to vehicle for update and return as soon as the fresh metrics have arrived (via the
+        websocket) - when no fresh metrics have been received till the timeout, the status will be requested once."""
+        a_request_time = time.time()
+        a_waiter = asyncio.get_running_loop().create_future()
+        a_waiter_entry = (a_request_time, a_waiter)
+        self._fresh_metrics_waiters.append(a_waiter_entry)
+        try:
+            status = await self.request_update()
+            if not status:
+                _LOGGER.debug(f"{self.vli}request_update_and_wait(): 'statusRefresh' failed")
+                return False
+
+            if self.ws_connected:
+                try:
+                    remaining = max(0.0, a_request_time + timeout - time.time())
+                    await asyncio.wait_for(a_waiter, timeout=remaining)
+                    if self.is_shutting_down:
+                        return False
+                    self.metrics.incr("status_refresh_pushed")
+                    self.metrics.observe("status_refresh_wait_ms", (time.time() - a_request_time) * 1000)
+                    return True
+                except asyncio.TimeoutError:
+                    _LOGGER.debug(f"{self.vli}request_update_and_wait(): no fresh metrics received within {timeout} sec - requesting status")
+        finally:
+            self._fresh_metrics_waiters.remove(a_waiter_entry)
+
+        if self.is_shutting_down:
+            return False
+
+        # fallback: a single status request (no need to update all the other data)
+        self.metrics.incr("status_refresh_fallback")
+        data = await self.req_status()
+        if data is None:
+            return False
+
+        for a_root_key, a_root_value in data.items():
+            self._data_container[a_root_key] = a_root_value
+            self._mark_snapshot_dirty(a_root_key)
+        if self.coordinator is not None:
+            self.push_data_to_coordinator()
+        return True
+
     # BOTH COMMANDS cause a HTTP 400 -> so they DOES NOT WORK!
     # async def open_all_windows(self):
     #     """Open all windows (master reset)"""
@@ -2532,7 +3199,45 @@ class ConnectedFordPassVehicle:
     # ***********************************************************
     # ***********************************************************
 
+    async def _queued_command(self, command: str, params, request_fn):
+        """Serialize the commands of the same group & join identical commands that are already in flight."""
+        a_key = (command, json.dumps(params, sort_keys=True, default=str))
+        a_task = self._commands_in_flight.get(a_key, None)
+        if a_task is not None and not a_task.done():
+            _LOGGER.debug(f"{self.vli}_queued_command(): '{command}' with same parameters is already in flight - joining")
+            self.metrics.incr("commands_deduplicated")
+        else:
+            a_group = COMMAND_GROUPS.get(command, command)
+            async def _do_command():
+                try:
+                    a_lock = self._command_group_locks.setdefault(a_group, asyncio.Lock())
+                    if a_lock.locked():
+                        _LOGGER.debug(f"{self.vli}_queued_command(): '{command}' waiting for other '{a_group}' command(s)")
+                    async with a_lock:
+                        return await request_fn()
+                finally:
+                    self._commands_in_flight.pop(a_key, None)
+
+            a_task = self.tasks.spawn(_do_command(), f"command_{command}")
+            if a_task is None:
+                # our supervisor is closed (the entry will be unloaded)
+                return False
+            self._commands_in_flight[a_key] = a_task
+
+        try:
+            # other callers might wait for the same task - so a cancel of this caller must not cancel the command
+            return await asyncio.shield(a_task)
+        except CancelledError:
+            if not a_task.cancelled():
+                raise
+            _LOGGER.debug(f"{self.vli}_queued_command(): '{command}' was canceled (entry unload)")
+            return False
+
     async def __request_command(self, command:str, post_data=None, include_xvin_in_header=False, return_response_content=False):
+        return await self._queued_command(command, post_data,
+                                          lambda: self.__request_command_int(command, post_data, include_xvin_in_header, return_response_content))
+
+    async def __request_command_int(self, command:str, post_data=None, include_xvin_in_header=False, return_response_content=False):
         try:
             await self.__ensure_valid_tokens()
             if self._HAS_COM_ERROR:
@@ -2607,6 +3312,7 @@ class ConnectedFordPassVehicle:
                 return False
 
             req = None
+            a_request_start = time.monotonic()
             if request_type == "POST":
                 req = await self.session.post(f"{command_url}",
                                               data=json_post_data,
@@ -2630,6 +3336,7 @@ class ConnectedFordPassVehicle:
 
             if req is not None:
                 _LOGGER.debug(f"{self.vli}REQUEST: {req.request_info.method} {req.request_info.url}")
+                self.metrics.observe_response(command, req.status, a_request_start)
 
                 if not (200 <= req.status <= 205):
                     if req.status in (401, 402, 403, 404, 405):
@@ -2664,6 +3371,10 @@ class ConnectedFordPassVehicle:
             return False
 
     async def __request_and_poll_command_autonomic(self, baseurl, write_command, properties={}, data_version:str="1.0.0", wait_for_state:bool=True):
+        return await self._queued_command(write_command, properties,
+                                          lambda: self.__request_and_poll_command_autonomic_int(baseurl, write_command, properties, data_version, wait_for_state))
+
+    async def __request_and_poll_command_autonomic_int(self, baseurl, write_command, properties={}, data_version:str="1.0.0", wait_for_state:bool=True):
         """Send command to the new Command endpoint"""
         try:
             await self.__ensure_valid_tokens()
@@ -2698,12 +3409,14 @@ class ConnectedFordPassVehicle:
 
             _LOGGER.debug(f"__request_and_poll_command_autonomic(): POST DATA: {json.dumps(data)}")
 
+            a_request_start = time.monotonic()
             post_req = await self.session.post(f"{baseurl}/command/vehicles/{self.vin}/commands",
                                     data=json.dumps(data),
                                     headers=headers,
                                     timeout=self.timeout
                                     )
             _LOGGER.debug(f"{self.vli}REQUEST: {post_req.request_info.method} {post_req.request_info.url}")
+            self.metrics.observe_response("autonomic_command", post_req.status, a_request_start)
 
             return await self.__request_and_poll_comon(request_obj=post_req,
                                                  state_command_str=write_command,
@@ -2720,6 +3433,10 @@ class ConnectedFordPassVehicle:
             return False
 
     async def __request_and_poll_command_ford(self, command_key:str, post_data=None, include_vin_in_header:bool=False):
+        return await self._queued_command(command_key, post_data,
+                                          lambda: self.__request_and_poll_command_ford_int(command_key, post_data, include_vin_in_header))
+
+    async def __request_and_poll_command_ford_int(self, command_key:str, post_data=None, include_vin_in_header:bool=False):
         try:
             await self.__ensure_valid_tokens()
             if self._HAS_COM_ERROR:
@@ -2760,11 +3477,13 @@ class ConnectedFordPassVehicle:
             if command_url_part and command_url_part.startswith("/"):
                 command_url_part = command_url_part.lstrip('/')
 
+            a_request_start = time.monotonic()
             post_req = await self.session.post(f"{FORD_VEHICLE_API}/{command_url_part}",
                                                data=json_post_data,
                                                headers=headers,
                                                timeout=self.timeout)
             _LOGGER.debug(f"{self.vli}REQUEST: {post_req.request_info.method} {post_req.request_info.url}")
+            self.metrics.observe_response("ford_command", post_req.status, a_request_start)
 
             return await self.__request_and_poll_comon(request_obj=post_req,
                                                  state_command_str=command,
@@ -2817,6 +3536,7 @@ class ConnectedFordPassVehicle:
     #         return False
 
     async def __request_and_poll_comon(self, request_obj, state_command_str, use_websocket, wait_for_state:bool=True):
+        a_tracker = FordPassCommandTracker(state_command_str)
         _LOGGER.debug(f"{self.vli}__request_and_poll_comon(): Testing command status: {request_obj.status} (check by {'WebSocket' if use_websocket else 'polling'})")
 
         if not (200 <= request_obj.status <= 205):
@@ -2843,23 +3563,68 @@ class ConnectedFordPassVehicle:
 
         # ok we have our command reference id, now we can/should wait for a positive state change
         if wait_for_state:
-            return await self.__wait_for_state(command_id, state_command_str, use_websocket=use_websocket)
+            await self.load_command_statistics()
+            a_tracker.command_id = command_id
+            a_tracker.mark(COMMAND_ACCEPTED)
+            self._pending_commands[command_id] = a_tracker
+            # only block the status updates of the coordinator when polling
+            if not use_websocket:
+                self._commands_polling += 1
+            try:
+                result = await self.__wait_for_state(command_id, state_command_str, use_websocket=use_websocket, tracker=a_tracker)
+            finally:
+                self._pending_commands.pop(command_id, None)
+                if not use_websocket:
+                    self._commands_polling -= 1
+
+            if self.is_shutting_down:
+                # the wait has been interrupted - so the duration is not meaningful
+                return result
+            self.command_statistics.add(a_tracker)
+            self.metrics.observe("command_roundtrip_ms", a_tracker.duration_ms)
+            self.metrics.incr("commands_succeeded" if result else "commands_failed")
+            await self.save_command_statistics()
+            return result
         else:
             return True
 
-    async def __wait_for_state(self, command_id, state_command_str, use_websocket):
-        # Wait for backend to process command
-        await asyncio.sleep(2)
+    async def __wait_for_next_state_check(self, a_delay: float, use_websocket: bool, tracker:FordPassCommandTracker=None):
+        if use_websocket and tracker is not None:
+            # the websocket will mark every new state of our command - so we can stop waiting early
+            try:
+                await asyncio.wait_for(tracker.changed.wait(), timeout=a_delay)
+            except asyncio.TimeoutError:
+                pass
+        else:
+            await self._sleep_unless_shutdown(a_delay)
+
+    async def __wait_for_state(self, command_id, state_command_str, use_websocket, tracker:FordPassCommandTracker=None):
+        # when we have enough history of this command type, the first delay, the poll interval and the
+        # max wait time will be derived from the past durations - otherwise we use the default schedule
+        # (15 attempts with a growing delay)
+        a_wait_plan = self.command_statistics.get_wait_plan(state_command_str)
+        if a_wait_plan is not None:
+            first_delay, poll_interval, max_wait = a_wait_plan
+            _LOGGER.debug(f"{self.vli}__wait_for_state(): adaptive wait for '{state_command_str}' - first: {round(first_delay, 1)} sec, interval: {round(poll_interval, 1)} sec, max: {round(max_wait, 1)} sec")
+        else:
+            first_delay, poll_interval, max_wait = 2, None, None
+        a_deadline = time.monotonic() + max_wait if max_wait is not None else None
 
-        # Only set status updates flag when polling
-        if not use_websocket:
-            self.status_updates_allowed = False
+        # Wait for backend to process command
+        if tracker is not None:
+            tracker.changed.clear()
+        await self.__wait_for_next_state_check(first_delay, use_websocket, tracker)
 
         try:
             i = 0
-            while i < 15:
+            while a_deadline is not None or i < 15:
+                if self.is_shutting_down:
+                    _LOGGER.debug(f"{self.vli}__wait_for_state(): vehicle is unloading - stop waiting for '{state_command_str}'")
+                    return False
                 if i > 0:
                     _LOGGER.debug(f"{self.vli}__wait_for_state(): retry again [count: {i}] waiting for '{state_command_str}' - COMM ERRORS: {self._HAS_COM_ERROR}")
+                if tracker is not None:
+                    tracker.changed.clear()
 
                 # Get data based on method
                 if use_websocket:
@@ -2869,18 +3634,9 @@ class ConnectedFordPassVehicle:
 
                 # Check states for command status
                 if updated_data is not None and ROOT_STATES in updated_data:
+                    # (req_status() & the websocket deliver already normalized data)
                     states = updated_data[ROOT_STATES]
 
-                    # doing some cleanup of the states dict moving the content of a possible existing
-                    # commands dict to the root level
-                    if "commands" in states and hasattr(states["commands"], "items"):
-                        # Move each command to the root level
-                        for cmd_key, cmd_value in states["commands"].items():
-                            states[cmd_key] = cmd_value
-
-                        # Remove the original commands dictionary
-                        del states["commands"]
-
                     command_key = state_command_str
                     # ONLY append 'Command' to the state_command_str, if the plain state_command_str cannot
                     # be found in the states dict... e.g., for disableDepartureTimes & enableDepartureTimes
@@ -2899,11 +3655,13 @@ class ConnectedFordPassVehicle:
 
                             if "value" in resp_command_obj and "toState" in resp_command_obj["value"]:
                                 to_state = resp_command_obj["value"]["toState"].upper()
+                                if tracker is not None:
+                                    tracker.mark(to_state)
 
                                 if to_state in ["SUCCESS", "COMMAND_SUCCEEDED_ON_DEVICE"]:
                                     _LOGGER.debug(f"{self.vli}__wait_for_state(): EXCELLENT! Command succeeded")
-                                    if not use_websocket:
-                                        self.status_updates_allowed = True
+                                    if tracker is not None:
+                                        tracker.finish("SUCCESS", to_state)
                                     return True
 
                                 elif to_state == "COMMAND_FAILED_ON_DEVICE":
@@ -2920,14 +3678,14 @@ class ConnectedFordPassVehicle:
                                         _LOGGER.warning(f"{self.vli}__wait_for_state(): Error during status checking - {type(err).__name__} - {err}")
 
                                     _LOGGER.info(f"{self.vli}__wait_for_state(): Command FAILED ON DEVICE - vehicle rejected the command. Error: {error_context} (code: {error_code})")
-                                    if not use_websocket:
-                                        self.status_updates_allowed = True
+                                    if tracker is not None:
+                                        tracker.finish("FAILED", to_state)
                                     return False
 
                                 elif "EXPIRED" == to_state:
                                     _LOGGER.info(f"{self.vli}__wait_for_state(): Command EXPIRED - wait is OVER")
-                                    if not use_websocket:
-                                        self.status_updates_allowed = True
+                                    if tracker is not None:
+                                        tracker.finish("EXPIRED", to_state)
                                     return False
 
                                 elif to_state in ["REQUEST_QUEUED", "RECEIVED_BY_DEVICE"] or "IN_PROGRESS" in to_state or "DELIVERY" in to_state:
@@ -2941,15 +3699,21 @@ class ConnectedFordPassVehicle:
                             _LOGGER.debug(f"{self.vli}__wait_for_state(): Command ID mismatch: {command_id} vs {cmd_id}")
 
                 i += 1
-                a_delay = i * 5
+                if a_deadline is not None and time.monotonic() >= a_deadline:
+                    break
+
+                a_delay = i * 5 if poll_interval is None else poll_interval
                 if self._HAS_COM_ERROR:
                     a_delay = a_delay + 60
+                if a_deadline is not None:
+                    # we want a final check at the deadline
+                    a_delay = max(0.5, min(a_delay, a_deadline - time.monotonic()))
 
                 # finally, wait in our loop
-                await asyncio.sleep(a_delay)
+                await self.__wait_for_next_state_check(a_delay, use_websocket, tracker)
 
             # end of while loop reached...
-            _LOGGER.info(f"{self.vli}__wait_for_state(): CHECK for '{state_command_str}' unsuccessful after 15 attempts")
+            _LOGGER.info(f"{self.vli}__wait_for_state(): CHECK for '{state_command_str}' unsuccessful after {i} attempts")
 
         except BaseException as exc:
             if not await self.__check_for_closed_session(exc):
@@ -2957,7 +3721,4 @@ class ConnectedFordPassVehicle:
             else:
                 _LOGGER.info(f"{self.vli}__wait_for_state(): RuntimeError - Session was closed occurred - but a new Session could be generated")
 
-        if not use_websocket:
-            self.status_updates_allowed = True
-
         return False
\ No newline at end of file
@@ -0,0 +1,124 @@
+"""Vehicle capabilities (derived from the 'vehicleProfile' & 'vehicleCapabilities' of the vehicle list)"""
+import json
+import logging
+import os
+import time
+from typing import Final
+
+from .const_shared import (
+    RCC_SEAT_MODE_NONE,
+    RCC_SEAT_MODE_HEAT_ONLY,
+    RCC_SEAT_MODE_HEAT_AND_COOL
+)
+from .fordpass_snapshot import write_atomic
+
+_LOGGER = logging.getLogger(__name__)
+
+# increase the version, when the derivation of the capabilities below has been changed (so
+# the cached capabilities will be derived again from the vehicle list)
+CAPABILITIES_CACHE_VERSION: Final = 2
+CAPABILITIES_CACHE_TTL: Final = 7 * 24 * 60 * 60
+
+def is_veh_capability_supported(a_capability: str, capabilities: dict, vli: str = "") -> bool:
+    """Check if a specific vehicle capability is supported."""
+    is_supported = False
+    if a_capability in capabilities and capabilities[a_capability] is not None:
+        val = capabilities[a_capability]
+        if (isinstance(val, bool) and val) or (isinstance(val, str) and val.upper() == "DISPLAY"):
+            is_supported = True
+        _LOGGER.debug(f"{vli}Is '{a_capability}' supported?: {is_supported} - {val}")
+    else:
+        _LOGGER.warning(f"{vli}No '{a_capability}' data found - assuming not supported")
+
+    return is_supported
+
+def derive_vehicle_capabilities(veh_data: dict, vin: str, vli: str = "") -> dict | None:
+    """Derive all capabilities of the vehicle from the vehicle list (expdashboard) response"""
+    if veh_data is None or "vehicleProfile" not in veh_data:
+        _LOGGER.warning(f"{vli}derive_vehicle_capabilities(): No vehicleProfile in 'vehicles' found - no capabilities available! {veh_data}")
+        return None
+
+    caps = None
+    for a_vehicle_profile in veh_data["vehicleProfile"]:
+        if a_vehicle_profile.get("VIN", None) == vin:
+            caps = {
+                "model": a_vehicle_profile.get("model", None),
+                "year": a_vehicle_profile.get("year", None),
+                "engineType": a_vehicle_profile.get("engineType", None),
+                "numberOfLightingZones": int(a_vehicle_profile.get("numberOfLightingZones", 0) or 0),
+            }
+            if "transmissionIndicator" in a_vehicle_profile:
+                caps["gearLeverPosition"] = a_vehicle_profile["transmissionIndicator"] == "A"
+
+            # remote climate control stuff...
+            rcc_supported = a_vehicle_profile.get("remoteClimateControl", False)
+            if not rcc_supported:
+                rcc_supported = a_vehicle_profile.get("remoteHeatingCooling", False)
+            caps["remoteClimateControl"] = rcc_supported
+            caps["heatedSteeringWheel"] = a_vehicle_profile.get("heatedSteeringWheel", None)
+
+            # possible values: 'None', 'Heat Only', 'Heat with Vent'
+            caps["heatedSeatMode"] = RCC_SEAT_MODE_NONE
+            if "driverHeatedSeat" in a_vehicle_profile:
+                heated_seat = str(a_vehicle_profile["driverHeatedSeat"]).upper()
+                if heated_seat == "HEAT WITH VENT":
+                    caps["heatedSeatMode"] = RCC_SEAT_MODE_HEAT_AND_COOL
+                elif "HEAT" in heated_seat:
+                    caps["heatedSeatMode"] = RCC_SEAT_MODE_HEAT_ONLY
+
+            # all three are plain booleans - the 'energyTransferStatus' can not be derived from the profile (so the
+            # request stays disabled in both cases)
+            if "showEVBatteryLevel" in a_vehicle_profile:
+                caps["preferredChargeTimes"] = a_vehicle_profile["showEVBatteryLevel"]
+                # I would like to have a more specific check here...
+                caps["energyTransferLogs"] = a_vehicle_profile["showEVBatteryLevel"]
+                caps["energyTransferStatus"] = False
+            else:
+                caps["preferredChargeTimes"] = False
+                caps["energyTransferLogs"] = True
+                caps["energyTransferStatus"] = False
+            break
+
+    if caps is None:
+        _LOGGER.warning(f"{vli}derive_vehicle_capabilities(): VIN not found in vehicleProfile")
+        return None
+
+    if "vehicleCapabilities" in veh_data:
+        for capability_obj in veh_data["vehicleCapabilities"]:
+            if capability_obj.get("VIN", None) == vin:
+                caps["remoteLock"] = is_veh_capability_supported("remoteLock", capability_obj, vli)
+                caps["remoteStart"] = is_veh_capability_supported("remoteStart", capability_obj, vli)
+                caps["trailerLightCheck"] = is_veh_capability_supported("trailerLightCheck", capability_obj, vli)
+                caps["departureTimes"] = is_veh_capability_supported("departureTimes", capability_obj, vli)
+                caps["guardMode"] = is_veh_capability_supported("guardMode", capability_obj, vli)
+                caps["zoneLighting"] = is_veh_capability_supported("zoneLighting", capability_obj, vli) and caps["numberOfLightingZones"] > 0
+                caps["remotePanicAlarm"] = is_veh_capability_supported("remotePanicAlarm", capability_obj, vli)
+                break
+    else:
+        _LOGGER.warning(f"{vli}derive_vehicle_capabilities(): No vehicleCapabilities in 'vehicles' found")
+
+    return caps
+
+def read_capabilities_cache(filename: str) -> tuple[dict | None, float]:
+    """Synchronous method to read the cached capabilities (if still valid), called from executor."""
+    if not os.path.isfile(filename):
+        return None, 0
+
+    with open(filename, encoding="utf-8") as cache_file:
+        cache_obj = json.load(cache_file)
+
+    if not isinstance(cache_obj, dict) or cache_obj.get("version", None) != CAPABILITIES_CACHE_VERSION:
+        return None, 0
+    created = cache_obj.get("created", 0)
+    if created + CAPABILITIES_CACHE_TTL < time.time():
+        return None, 0
+    return cache_obj.get("capabilities", None), created
+
+def write_capabilities_cache(filename: str, capabilities: dict):
+    """Synchronous method to write the capabilities cache, called from executor."""
+    cache_obj = {
+        "version": CAPABILITIES_CACHE_VERSION,
+        "created": time.time(),
+        "capabilities": capabilities
+    }
+    write_atomic(filename, json.dumps(cache_obj).encode("utf-8"))
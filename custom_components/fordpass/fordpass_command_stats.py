@@ -0,0 +1,153 @@
+"""Round-trip statistics of the vehicle commands (persisted per vehicle)"""
+import asyncio
+import copy
+import json
+import logging
+import os
+import time
+from typing import Final
+
+from .fordpass_metrics import percentile
+from .fordpass_snapshot import write_atomic
+
+_LOGGER = logging.getLogger(__name__)
+
+COMMAND_STATS_VERSION: Final = 1
+# number of the most recent samples (per command type) that will be kept
+COMMAND_STATS_SAMPLE_SIZE: Final = 50
+
+# the (pseudo) state that will be used, when the backend has accepted the command and returned the command id
+COMMAND_ACCEPTED: Final = "ACCEPTED"
+# the (pseudo) final state, when no final state has been reported by the backend at all
+COMMAND_TIMEOUT: Final = "TIMEOUT"
+
+# the adaptive wait (for the final state of a command) will be only used, when we have enough
+# samples of the command type - the deadline will be a multiple of the p95 duration, but never
+# shorter/longer than the min/max values [in seconds]
+COMMAND_WAIT_MIN_SAMPLES: Final = 5
+COMMAND_WAIT_DEADLINE_FACTOR: Final = 2
+COMMAND_WAIT_MIN_DEADLINE: Final = 20
+COMMAND_WAIT_MAX_DEADLINE: Final = 600
+COMMAND_WAIT_MIN_POLL_INTERVAL: Final = 3
+COMMAND_WAIT_MAX_POLL_INTERVAL: Final = 30
+# when too many commands of this type have run into a timeout, we fall back to the default wait
+COMMAND_WAIT_MAX_TIMEOUT_RATIO: Final = 0.2
+
+
+class FordPassCommandTracker:
+    """Timestamps of all state transitions (in ms since the command was sent) of a single command."""
+    __slots__ = ("command", "command_id", "started", "transitions", "result", "changed")
+
+    def __init__(self, command: str):
+        self.command = command
+        self.command_id = None
+        self.started = time.monotonic()
+        self.transitions = {}
+        self.result = None
+        # will be set on every new transition (so a waiting caller can check the state immediately)
+        self.changed = asyncio.Event()
+
+    def mark(self, a_state: str):
+        # only the first occurrence of a state is relevant
+        if a_state not in self.transitions:
+            self.transitions[a_state] = int((time.monotonic() - self.started) * 1000)
+            self.changed.set()
+
+    def finish(self, result: str, a_state: str = None):
+        # when the final state has been already marked (by the websocket), we use its timestamp
+        if a_state is not None and a_state in self.transitions and result not in self.transitions:
+            self.transitions[result] = self.transitions[a_state]
+        self.mark(result)
+        self.result = result
+
+    @property
+    def duration_ms(self) -> int:
+        if self.result is not None and self.result in self.transitions:
+            return self.transitions[self.result]
+        return int((time.monotonic() - self.started) * 1000)
+
+
+class FordPassCommandStatistics:
+    """Per command type: the durations till the final state, the durations till each state
+    transition and the number of the final results."""
+
+    def __init__(self):
+        self._stats: dict = {}
+        self.dirty = False
+
+    def add(self, tracker: FordPassCommandTracker):
+        a_cmd_stats = self._stats.setdefault(tracker.command, {"durations": [], "transitions": {}, "results": {}})
+
+        result = tracker.result if tracker.result is not None else COMMAND_TIMEOUT
+        a_cmd_stats["results"][result] = a_cmd_stats["results"].get(result, 0) + 1
+        # a timeout does not tell us anything about the real duration of a command
+        if result != COMMAND_TIMEOUT:
+            a_cmd_stats["durations"] = (a_cmd_stats["durations"] + [tracker.duration_ms])[-COMMAND_STATS_SAMPLE_SIZE:]
+
+        for a_state, a_duration in tracker.transitions.items():
+            a_list = a_cmd_stats["transitions"].get(a_state, [])
+            a_cmd_stats["transitions"][a_state] = (a_list + [a_duration])[-COMMAND_STATS_SAMPLE_SIZE:]
+        self.dirty = True
+
+    def samples(self, command: str) -> int:
+        return len(self._stats.get(command, {}).get("durations", []))
+
+    def percentile(self, command: str, pct: float, a_state: str = None) -> float | None:
+        a_cmd_stats = self._stats.get(command, None)
+        if a_cmd_stats is None:
+            return None
+        if a_state is None:
+            return percentile(a_cmd_stats["durations"], pct)
+        return percentile(a_cmd_stats["transitions"].get(a_state, []), pct)
+
+    def get_wait_plan(self, command: str) -> tuple[float, float, float] | None:
+        """The (first_delay, poll_interval, max_wait) in seconds for the command type - or None when
+        there is not enough history available."""
+        a_cmd_stats = self._stats.get(command, None)
+        if a_cmd_stats is None or len(a_cmd_stats["durations"]) < COMMAND_WAIT_MIN_SAMPLES:
+            return None
+
+        total = sum(a_cmd_stats["results"].values())
+        if total > 0 and a_cmd_stats["results"].get(COMMAND_TIMEOUT, 0) / total > COMMAND_WAIT_MAX_TIMEOUT_RATIO:
+            return None
+
+        p50 = percentile(a_cmd_stats["durations"], 50) / 1000
+        p95 = percentile(a_cmd_stats["durations"], 95) / 1000
+        max_wait = min(COMMAND_WAIT_MAX_DEADLINE, max(COMMAND_WAIT_MIN_DEADLINE, p95 * COMMAND_WAIT_DEADLINE_FACTOR))
+        poll_interval = min(COMMAND_WAIT_MAX_POLL_INTERVAL, max(COMMAND_WAIT_MIN_POLL_INTERVAL, p50 / 3))
+        first_delay = min(COMMAND_WAIT_MAX_POLL_INTERVAL, max(2, p50 * 0.8))
+        return first_delay, poll_interval, max_wait
+
+    def as_dict(self) -> dict:
+        summary = {}
+        for a_command, a_cmd_stats in sorted(self._stats.items()):
+            summary[a_command] = {
+                "count": sum(a_cmd_stats["results"].values()),
+                "results": dict(a_cmd_stats["results"]),
+                "p50_ms": percentile(a_cmd_stats["durations"], 50),
+                "p95_ms": percentile(a_cmd_stats["durations"], 95),
+                "transitions": {a_state: {"p50_ms": percentile(a_list, 50), "p95_ms": percentile(a_list, 95)}
+                                for a_state, a_list in a_cmd_stats["transitions"].items()},
+            }
+        return summary
+
+    def to_storage(self) -> dict:
+        # a copy, since the statistics will be written by the executor
+        return {"version": COMMAND_STATS_VERSION, "commands": copy.deepcopy(self._stats)}
+
+    def from_storage(self, stored: dict):
+        if isinstance(stored, dict) and stored.get("version", None) == COMMAND_STATS_VERSION:
+            self._stats = stored.get("commands", {})
+            self.dirty = False
+
+
+def read_command_stats(filename: str) -> dict | None:
+    """Synchronous method to read the command statistics, called from executor."""
+    if not os.path.isfile(filename):
+        return None
+    with open(filename, encoding="utf-8") as stats_file:
+        return json.load(stats_file)
+
+def write_command_stats(filename: str, stats: dict):
+    """Synchronous method to write the command statistics, called from executor."""
+    write_atomic(filename, json.dumps(stats).encode("utf-8"))
@@ -0,0 +1,108 @@
+"""Parsed model of the 'xevDepartureSchedulesSetting' configuration (cached per configuration version)"""
+import logging
+from datetime import datetime, timedelta
+from typing import Final
+
+from .const_shared import DAYS_MAP
+
+_LOGGER = logging.getLogger(__name__)
+
+MINUTES_PER_DAY: Final = 24 * 60
+# number of parsed configurations that will be kept (one per vehicle is sufficient)
+DEPARTURE_MODEL_CACHE_SIZE: Final = 16
+
+# the 'updateTime' of the 'xevDepartureSchedulesSetting' entry is used as configuration version (the cached
+# model will be only used, when its configuration is equal to the requested one)
+_DEPARTURE_MODEL_CACHE: dict = {}
+
+
+class FordPassDepartureModel:
+    """All active (LOCAL_TIME) departure schedules - per location as a sorted list of the minute in the
+    week (monday 00:00 = 0) and per (locationId, scheduleId) for the direct lookup."""
+    __slots__ = ("setting", "single_location", "schedules_by_id", "timeline_by_location", "schedule_attrs")
+
+    def __init__(self, setting: dict):
+        # we keep the parsed configuration, so that the cache can verify the content
+        self.setting = setting
+        self.schedules_by_id = {}
+        self.timeline_by_location = {}
+        # will be lazy filled by the handler (the 'schedule' attribute of the sensor)
+        self.schedule_attrs = None
+
+        departure_locations = setting.get("departureLocations", []) if hasattr(setting, "get") else []
+        self.single_location = len(departure_locations) == 1
+        for a_depart_location in departure_locations:
+            loc_id = str(a_depart_location.get("locationId", None))
+            timeline = []
+            for a_schedule in a_depart_location.get("departureSchedules", []):
+                if a_schedule.get("scheduleStatus", "OFF").upper() != "ON":
+                    continue
+                a_schedule_obj = a_schedule.get("schedule", {})
+                if a_schedule_obj.get("timeZone", None) != "LOCAL_TIME":
+                    continue
+                time_obj = a_schedule_obj.get("weeklySchedule", {})
+                day_of_week = str(time_obj.get("dayOfWeek", "")).upper()
+                if day_of_week not in DAYS_MAP:
+                    continue
+                try:
+                    hours, minutes = map(int, str(time_obj.get("timeOfDay", "")).split(":"))
+                except ValueError:
+                    _LOGGER.debug(f"FordPassDepartureModel: invalid timeOfDay in schedule: {a_schedule}")
+                    continue
+
+                week_minute = DAYS_MAP[day_of_week] * MINUTES_PER_DAY + hours * 60 + minutes
+                self.schedules_by_id[(loc_id, str(a_schedule.get("scheduleId", None)))] = week_minute
+                timeline.append(week_minute)
+
+            timeline.sort()
+            self.timeline_by_location[loc_id] = timeline
+
+    def get_week_minute(self, schedule_id, location_id=None) -> int | None:
+        if self.single_location:
+            # when there is only a single location, the location id will be ignored
+            location_id = next(iter(self.timeline_by_location))
+        return self.schedules_by_id.get((str(location_id), str(schedule_id)), None)
+
+    @staticmethod
+    def to_datetime(now: datetime, week_minute: int) -> datetime:
+        """The next occurrence (after 'now') of the minute in the week."""
+        target_weekday = (week_minute // MINUTES_PER_DAY) % 7
+        minute_of_day = week_minute % MINUTES_PER_DAY
+        days_until = (target_weekday - now.weekday() + 7) % 7
+        if days_until == 0 and (now.hour * 60 + now.minute, now.second, now.microsecond) >= (minute_of_day, 0, 0):
+            days_until = 7
+        next_date = now + timedelta(days=days_until)
+        return next_date.replace(hour=minute_of_day // 60, minute=minute_of_day % 60, second=0, microsecond=0)
+
+
+def get_departure_model(a_setting_entry) -> FordPassDepartureModel:
+    """The (cached) model of the 'xevDepartureSchedulesSetting' entry (value & updateTime)."""
+    setting = a_setting_entry.get("value", None) if hasattr(a_setting_entry, "get") else None
+    if not setting:
+        # nothing to parse
+        return FordPassDepartureModel({})
+
+    a_key = a_setting_entry.get("updateTime", None)
+    a_model = _DEPARTURE_MODEL_CACHE.get(a_key, None) if a_key is not None else None
+    if a_model is not None and a_model.setting == setting:
+        return a_model
+
+    a_model = FordPassDepartureModel(setting)
+    if a_key is not None:
+        if a_key not in _DEPARTURE_MODEL_CACHE and len(_DEPARTURE_MODEL_CACHE) >= DEPARTURE_MODEL_CACHE_SIZE:
+            # dropping the oldest entry (dicts keep the insertion order)
+            _DEPARTURE_MODEL_CACHE.pop(next(iter(_DEPARTURE_MODEL_CACHE)))
+        _DEPARTURE_MODEL_CACHE[a_key] = a_model
+    return a_model
+
+def remove_departure_model(a_setting_entry):
+    """Drop the cached model of the configuration (when the vehicle has been unloaded)."""
+    if not hasattr(a_setting_entry, "get"):
+        return
+    a_key = a_setting_entry.get("updateTime", None)
+    a_model = _DEPARTURE_MODEL_CACHE.get(a_key, None) if a_key is not None else None
+    if a_model is not None and a_model.setting == a_setting_entry.get("value", None):
+        _DEPARTURE_MODEL_CACHE.pop(a_key, None)
+
+def get_departure_model_cache_size() -> int:
+    return len(_DEPARTURE_MODEL_CACHE)
@@ -31,6 +31,8 @@ from .const_shared import (
     OTA_DEPLOYMENT_STATE_MAP,
     OTA_TRIGGER_STATE_MAP
 )
+from .fordpass_departure_model import get_departure_model, FordPassDepartureModel
+from .fordpass_timestamps import parse_datetime
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -295,7 +297,8 @@ class FordpassDataHandler:
         return FordpassDataHandler.get_metrics(data).get("position", {}).get("value", {}).get("location", {})
 
     def get_gps_attrs(data, units:UnitSystem):
-        attrs = FordpassDataHandler.get_metrics_dict(data, "position")
+        # (a copy - the stored entry must not be modified)
+        attrs = dict(FordpassDataHandler.get_metrics_dict(data, "position"))
         data_metrics = FordpassDataHandler.get_metrics(data)
         if "compassDirection" in data_metrics:
             attrs["compassDirection"] = data_metrics.get("compassDirection", {}).get("value", UNSUPPORTED)
@@ -329,7 +332,7 @@ class FordpassDataHandler:
 
     # ALARM attributes
     def get_alarm_attrs(data, units:UnitSystem):
-        attrs = FordpassDataHandler.get_metrics_dict(data, "alarmStatus")
+        attrs = dict(FordpassDataHandler.get_metrics_dict(data, "alarmStatus"))
         data_metrics = FordpassDataHandler.get_metrics(data)
         if "panicAlarmStatus" in data_metrics:
             val = data_metrics.get("panicAlarmStatus", {}).get("value", UNSUPPORTED)
@@ -579,7 +582,8 @@ class FordpassDataHandler:
 
     # LAST_REFRESH state
     def get_last_refresh_state(data, prev_state=None):
-        return dt.as_local(dt.parse_datetime(data.get(ROOT_UPDTIME, "1970-01-01T00:00:00.000Z")))
+        a_datetime = parse_datetime(data.get(ROOT_UPDTIME, "1970-01-01T00:00:00.000Z"))
+        return dt.as_local(a_datetime) if a_datetime is not None else None
 
 
     # ELVEH state + attributes
@@ -640,9 +644,6 @@ class FordpassDataHandler:
             else:
                 attrs["motorkW"] = 0
 
-        xev_next_departure_time_schedule_id = None
-        xev_next_departure_time_location_id = None
-
         if "customMetrics" in data_metrics:
             for key in data_metrics.get("customMetrics", {}):
                 if "accumulated-vehicle-speed-cruising-coaching-score" in key:
@@ -662,56 +663,16 @@ class FordpassDataHandler:
                     attrs["remoteDataResponseStatus"] = data_metrics.get("customMetrics", {}).get(key, {}).get("value")
 
                 if ":custom:xev-" in key:
-                    if "next-departure-time-schedule-id" in key:
-                        xev_next_departure_time_schedule_id = data_metrics.get("customMetrics", {}).get(key, {}).get("value")
-                    elif "next-departure-time-location-id" in key:
-                        xev_next_departure_time_location_id = data_metrics.get("customMetrics", {}).get(key, {}).get("value")
-                    else:
+                    # the next departure ids will be handled by _get_next_departure_ids()
+                    if "next-departure-time-schedule-id" not in key and "next-departure-time-location-id" not in key:
                         entryName = FordpassDataHandler.to_camel(key.split(":custom:xev-")[1])
                         attrs[entryName] = data_metrics.get("customMetrics", {}).get(key, {}).get("value")
 
+        xev_next_departure_time_schedule_id, xev_next_departure_time_location_id = FordpassDataHandler._get_next_departure_ids(data_metrics)
         if xev_next_departure_time_schedule_id is not None: #and xev_next_departure_time_location_id is not None:
             # IF there is a 'schedule_id' defined, then we set the attribute, in order to make the processing
             # of this data a bit easier - since you must not check for existence of both id's all the time
-            attrs["nextScheduledDepartureTime"] = UNDEFINED
-            xev_departure_locations = data_metrics.get("configurations", {}).get("xevDepartureSchedulesSetting",{}).get("value", {}).get("departureLocations", {})
-            for a_depart_location in xev_departure_locations:
-                if "departureSchedules" in a_depart_location and (
-                        len(xev_departure_locations) == 1 or
-                        a_depart_location.get("locationId", None) == xev_next_departure_time_location_id
-                ) :
-                    for a_schedule in a_depart_location["departureSchedules"]:
-                        if str(a_schedule.get("scheduleId", None)) == str(xev_next_departure_time_schedule_id):
-                            if a_schedule.get("scheduleStatus", "OFF").upper() == "ON":
-                                a_schedule_obj = a_schedule.get("schedule", {})
-                                if len(a_schedule_obj) > 0:
-                                    #_LOGGER.debug(f"A schedule object: {a_schedule_obj}")
-                                    time_obj = a_schedule_obj.get("weeklySchedule", {})
-                                    day_of_week = time_obj.get("dayOfWeek", UNSUPPORTED).upper()
-                                    time_of_day = time_obj.get("timeOfDay", UNSUPPORTED)
-                                    tz = a_schedule_obj.get("timeZone", UNSUPPORTED)
-
-                                    if "LOCAL_TIME" == tz:
-                                        if day_of_week in DAYS_MAP and time_of_day != UNSUPPORTED:
-                                            # Get the current date and time in local timezone
-                                            now = datetime.now()
-
-                                            # Get the weekday number for the specified day
-                                            target_weekday = DAYS_MAP[day_of_week]
-                                            target_time = datetime.strptime(time_of_day, "%H:%M").time()
-
-                                            # Calculate days until the next target day
-                                            days_until = (target_weekday - now.weekday() + 7) % 7
-                                            if days_until == 0 and now.time() >= target_time:
-                                                days_until = 7  # If today is Friday but the time is past, go to next week
-
-                                            # Calculate the next date
-                                            next_date = now + timedelta(days=days_until)
-
-                                            # Set the target time
-                                            attrs["nextScheduledDepartureTime"] = next_date.replace(hour=target_time.hour, minute=target_time.minute, second=0, microsecond=0)
-
-                                    break
+            attrs["nextScheduledDepartureTime"] = FordpassDataHandler._get_next_scheduled_departure_time(data_metrics, xev_next_departure_time_schedule_id, xev_next_departure_time_location_id)
 
         data_events = FordpassDataHandler.get_events(data)
         if "customEvents" in data_events:
@@ -843,9 +804,10 @@ class FordpassDataHandler:
             attrs["chargingkW"] = charging_kw
 
         if "xevBatteryTimeToFullCharge" in data_metrics:
-            cs_update_time = dt.parse_datetime(data_metrics.get("xevBatteryTimeToFullCharge", {}).get("updateTime", 0))
-            cs_est_end_time = cs_update_time + timedelta(minutes=data_metrics.get("xevBatteryTimeToFullCharge", {}).get("value", 0))
-            attrs["estimatedEndTime"] = dt.as_local(cs_est_end_time)
+            cs_update_time = parse_datetime(data_metrics.get("xevBatteryTimeToFullCharge", {}).get("updateTime", None))
+            if cs_update_time is not None:
+                cs_est_end_time = cs_update_time + timedelta(minutes=data_metrics.get("xevBatteryTimeToFullCharge", {}).get("value", 0))
+                attrs["estimatedEndTime"] = dt.as_local(cs_est_end_time)
 
         if "customMetrics" in data_metrics:
             for key in data_metrics.get("customMetrics", {}):
@@ -1509,7 +1471,7 @@ class FordpassDataHandler:
         # grrr this does not work - we don't have access to the data conatiner object...
         #data[ROOT_REMOTE_CLIMATE_CONTROL]["rccUserProfiles"] = list_data
 
-        return await vehicle.set_rcc(rcc_dict, list_data)
+        return await vehicle.set_rcc(rcc_dict, list_data, {rcc_key: new_value})
 
     # DEVICE_CONNECTIVITY state
     def get_device_connectivity_state(data, prev_state=None):
@@ -1638,7 +1600,6 @@ class FordpassDataHandler:
     # request it ourselves
     def get_ota_schedule_state(data, prev_state=None):
         oem_data = (FordpassDataHandler.get_states(data)
-                    .get("commands", {})
                     .get("getASUSettingsCommand", {})
                     .get("value", {})
                     .get("oemData", {}))
@@ -1680,7 +1641,6 @@ class FordpassDataHandler:
 
     def get_ota_schedule_attrs(data, units):
         oem_data = (FordpassDataHandler.get_states(data)
-                    .get("commands", {})
                     .get("getASUSettingsCommand", {})
                     .get("value", {})
                     .get("oemData", {}))
@@ -1726,7 +1686,7 @@ class FordpassDataHandler:
         if update_time is None:
             return None
         try:
-            return dt.as_local(dt.parse_datetime(update_time))
+            return dt.as_local(parse_datetime(update_time))
         except BaseException as ex:
             _LOGGER.debug(f"get_last_firmware_update_state(): could not parse datetime: '{update_time}', error: {ex}")
             return None
@@ -1754,12 +1714,37 @@ class FordpassDataHandler:
         }
 
     # DEPARTURE_SCHEDULE SENSOR & SERVICE stuff
+    def _get_departure_model(data_metrics) -> FordPassDepartureModel:
+        # the parsed model will be only rebuilt, when the 'xevDepartureSchedulesSetting' have been changed
+        return get_departure_model(data_metrics.get("configurations", {}).get("xevDepartureSchedulesSetting", None))
+
+    def _get_next_scheduled_departure_time(data_metrics, schedule_id, location_id):
+        a_model = FordpassDataHandler._get_departure_model(data_metrics)
+        now = datetime.now()
+        a_week_minute = a_model.get_week_minute(schedule_id, location_id)
+        if a_week_minute is not None:
+            return FordPassDepartureModel.to_datetime(now, a_week_minute)
+        return UNDEFINED
+
+    def _get_next_departure_ids(data_metrics) -> tuple:
+        """The (schedule_id, location_id) of the next departure reported by the vehicle (customMetrics)."""
+        schedule_id = None
+        location_id = None
+        for key, a_custom_metric in data_metrics.get("customMetrics", {}).items():
+            if ":custom:xev-" in key:
+                if "next-departure-time-schedule-id" in key:
+                    schedule_id = a_custom_metric.get("value")
+                elif "next-departure-time-location-id" in key:
+                    location_id = a_custom_metric.get("value")
+        return schedule_id, location_id
+
     def get_departure_schedules_state(data, prev_state=None):
-        ev_attrs = FordpassDataHandler.get_elveh_attrs(data, units=None)
-        if ev_attrs is not None and len(ev_attrs) > 0:
-            # 2026-04-13 10:30:00
-            val = ev_attrs.get("nextScheduledDepartureTime", None)
-            if val is not None:
+        data_metrics = FordpassDataHandler.get_metrics(data)
+        if "xevBatteryRange" in data_metrics:
+            schedule_id, location_id = FordpassDataHandler._get_next_departure_ids(data_metrics)
+            if schedule_id is not None:
+                # 2026-04-13 10:30:00
+                val = FordpassDataHandler._get_next_scheduled_departure_time(data_metrics, schedule_id, location_id)
                 if isinstance(val, datetime):
                     if val.tzinfo is None:
                         local_tz = datetime.now().astimezone().tzinfo
@@ -1770,12 +1755,18 @@ class FordpassDataHandler:
                 elif isinstance(val, str):
                     if val is not None and val != UNDEFINED:
                         try:
-                            return dt.as_local(dt.parse_datetime(val))
+                            return dt.as_local(parse_datetime(val))
                         except BaseException as ex:
                             _LOGGER.debug(f"get_departure_schedules_state(): could not parse datetime: '{val}', error: {ex}")
         return None
 
     def get_departure_schedules_attrs(data, units:UnitSystem):
+        a_model = FordpassDataHandler._get_departure_model(FordpassDataHandler.get_metrics(data))
+        if a_model.schedule_attrs is None:
+            a_model.schedule_attrs = FordpassDataHandler._build_departure_schedules_attrs(data)
+        return a_model.schedule_attrs
+
+    def _build_departure_schedules_attrs(data):
         departure_schedules_list = FordpassDataHandler._convert_departure_schedules_setting(data)
         # in the sensor attibute, we will display the 'dayOfWeek' in lower case, since
         # in the service we also must user 'lc' in the options (in order to support translations)
@@ -1880,6 +1871,22 @@ class FordpassDataHandler:
     def _update_departure_schedule_int(data, enable_schedule:bool, days_list:list, schedule_id_list:list=None, hour=0, minute=0, precon_temperature="OFF", location_id_filter="0"):
         # 1. Get current state (sorted and indexed)
         departure_schedules_list = FordpassDataHandler._convert_departure_schedules_setting(data, location_id_filter)
+        if departure_schedules_list is None:
+            return False, None
+
+        any_changes = FordpassDataHandler._apply_departure_schedule_edit(departure_schedules_list, enable_schedule, days_list, schedule_id_list, hour, minute, precon_temperature)
+
+        # checking if we have manipulated the departure_schedules_list
+        if not any_changes:
+            return False, departure_schedules_list
+
+        FordpassDataHandler._reindex_departure_schedules(departure_schedules_list)
+        return True, departure_schedules_list
+
+    def _apply_departure_schedule_edit(departure_schedules_list:list, enable_schedule:bool, days_list:list, schedule_id_list:list=None, hour=0, minute=0, precon_temperature="OFF") -> bool:
+        # applies a single edit to the (already converted) departure_schedules_list - the scheduleIds will
+        # be only re-indexed after all edits have been applied (so the ids of a batch always refer to the
+        # schedules that have been shown to the user)
         any_changes = False
 
         # 2. Time Validation & Rounding (calculated once for all days)
@@ -1952,10 +1959,9 @@ class FordpassDataHandler:
                 any_changes = True
                 _LOGGER.debug(f"update_departure_schedule(): Updated slot on {day_name} (ID: {target_slot['scheduleId']}) to {"ON" if enable_schedule else "OFF"}.")
 
-        # checking if we have manipulated the departure_schedules_list
-        if not any_changes:
-            return False, departure_schedules_list
+        return any_changes
 
+    def _reindex_departure_schedules(departure_schedules_list:list):
         # 5. Final Re-Sort and Re-Index after all changes are done
         for day_group in departure_schedules_list:
             day_group["schedules"].sort(key=lambda x: (
@@ -1970,28 +1976,68 @@ class FordpassDataHandler:
                 s["scheduleId"] = new_id_counter
                 new_id_counter += 1
 
-        return True, departure_schedules_list
-
     async def update_departure_schedule(data, vehicle, days_list, hour, minute, precon_temperature):
         any_change, day_schedules_list = FordpassDataHandler._update_departure_schedule_int(data, True, days_list, None, hour, minute, precon_temperature)
         if day_schedules_list is not None and any_change:
-            await vehicle.departure_times_update(day_schedules_list)
+            return await vehicle.departure_times_update(day_schedules_list)
         else:
             _LOGGER.warning(f"update_departure_schedule(): Failed to update departure schedule for day(s) {days_list}, hour {hour}, minute {minute} with precondition temperature {precon_temperature} - NO FREE SLOTS")
+            return False
 
     async def delete_departure_schedule_by_days(data, vehicle, days_list):
         any_change, day_schedules_list = FordpassDataHandler._update_departure_schedule_int(data, False, days_list)
         if day_schedules_list is not None and any_change:
-            await vehicle.departure_times_update(day_schedules_list)
+            return await vehicle.departure_times_update(day_schedules_list)
         else:
             _LOGGER.warning(f"delete_departure_schedule_by_days(): Failed to update departure schedule for day(s) {days_list}")
+            return False
 
     async def delete_departure_schedule_by_schedule_ids(data, vehicle, schedule_id_list):
         any_change, day_schedules_list = FordpassDataHandler._update_departure_schedule_int(data, False, None, schedule_id_list)
         if day_schedules_list is not None and any_change:
-            await vehicle.departure_times_update(day_schedules_list)
+            return await vehicle.departure_times_update(day_schedules_list)
         else:
             _LOGGER.warning(f"delete_departure_schedule_by_schedule_ids(): Failed to update departure schedule for day(s) {schedule_id_list}")
+            return False
+
+    async def batch_update_departure_schedules(data, vehicle, edits:list) -> bool:
+        # all edits will be applied to a single in-memory copy of the departure schedules - only when all
+        # edits are valid, a single departure_times_update command will be sent to the vehicle
+        departure_schedules_list = FordpassDataHandler._convert_departure_schedules_setting(data)
+        if departure_schedules_list is None:
+            _LOGGER.warning("batch_update_departure_schedules(): No departure schedules available")
+            return False
+
+        any_changes = False
+        for idx, a_edit in enumerate(edits):
+            action = str(a_edit.get("action", "")).lower()
+            if action == "update":
+                edit_changes = FordpassDataHandler._apply_departure_schedule_edit(departure_schedules_list, True,
+                                                                                  a_edit.get("days_list", None), None,
+                                                                                  a_edit.get("hour", 0),
+                                                                                  a_edit.get("minute", 0),
+                                                                                  a_edit.get("precon_temperature", "OFF"))
+            elif action == "delete_by_days":
+                edit_changes = FordpassDataHandler._apply_departure_schedule_edit(departure_schedules_list, False,
+                                                                                  a_edit.get("days_list", None))
+            elif action == "delete_by_ids":
+                edit_changes = FordpassDataHandler._apply_departure_schedule_edit(departure_schedules_list, False,
+                                                                                  None, a_edit.get("schedule_id_list", None))
+            else:
+                # the whole batch will be rejected - we do not want to send a partial modified schedule
+                _LOGGER.warning(f"batch_update_departure_schedules(): unknown action '{action}' in edit #{idx + 1} - batch rejected")
+                return False
+
+            if not edit_changes:
+                _LOGGER.info(f"batch_update_departure_schedules(): edit #{idx + 1} ({action}) did not change anything")
+            any_changes = any_changes or edit_changes
+
+        if not any_changes:
+            _LOGGER.warning(f"batch_update_departure_schedules(): None of the {len(edits)} edit(s) changed the departure schedule")
+            return False
+
+        FordpassDataHandler._reindex_departure_schedules(departure_schedules_list)
+        return await vehicle.departure_times_update(departure_schedules_list)
 
     # TRAILER_LIGHT_CHECK stuff
     def get_trailer_light_check_state(data, prev_state=None):
@@ -2052,8 +2098,7 @@ class FordpassDataHandler:
         await coordinator.async_request_refresh_force_classic_requests()
 
     async def request_update_and_reload(coordinator, vehicle):
-        await vehicle.request_update()
-        await coordinator.async_request_refresh_force_classic_requests()
+        await vehicle.request_update_and_wait()
 
     async def lock_vehicle(coordinator, vehicle):
         await vehicle.lock()
@@ -2074,30 +2119,25 @@ class FordpassDataHandler:
         await vehicle.remote_start()
 
     async def messages_delete_last(coordinator, vehicle):
-        msgs = coordinator.data.get(ROOT_MESSAGES, {})
-        if len(msgs) > 0:
-            message_ids = [int(message['messageId']) for message in msgs if (len(message['relevantVin']) == 0 or message['relevantVin'] == vehicle.vin)]
-            if len(message_ids) > 0:
-                if await vehicle.delete_messages([message_ids[0]]):
-                    await vehicle.ws_check_for_message_update_required()
-                    return True
+        message_ids = vehicle.get_message_ids()
+        if len(message_ids) > 0:
+            if await vehicle.delete_messages([message_ids[0]]):
+                await vehicle.ws_check_for_message_update_required()
+                return True
         return False
 
     async def messages_delete_all(coordinator, vehicle):
-        msgs = coordinator.data.get(ROOT_MESSAGES, {})
-        if len(msgs) > 0:
-            message_ids = [int(message['messageId']) for message in msgs if (len(message['relevantVin']) == 0 or message['relevantVin'] == vehicle.vin)]
-            if len(message_ids) > 0:
-                if await vehicle.delete_messages(message_ids):
-                    await vehicle.ws_check_for_message_update_required()
-                    return True
+        message_ids = list(vehicle.get_message_ids())
+        if len(message_ids) > 0:
+            if await vehicle.delete_messages(message_ids):
+                await vehicle.ws_check_for_message_update_required()
+                return True
         return False
 
     async def messages_delete_with_id_called_from_service(coordinator, msg_id: int):
         _LOGGER.debug(f"messages_delete_id_from_service(): msg_id: {msg_id} called...")
-        msgs = coordinator.data.get(ROOT_MESSAGES, {})
-        if len(msgs) > 0:
-            message_ids = [int(message['messageId']) for message in msgs if (len(message['relevantVin']) == 0 or message['relevantVin'] == coordinator.bridge.vin)]
+        if not coordinator.bridge.message_store.is_empty:
+            message_ids = coordinator.bridge.get_message_ids()
             if len(message_ids) > 0:
                 if msg_id in message_ids:
                     _LOGGER.debug(f"messages_delete_id_from_service(): will delete message_id: {msg_id} now")
@@ -2110,7 +2150,7 @@ class FordpassDataHandler:
             else:
                 _LOGGER.debug(f"messages_delete_id_from_service(): no messages found for vin: {coordinator.bridge.vin}")
         else:
-            _LOGGER.debug(f"messages_delete_id_from_service(): no messages found in coordinator.data")
+            _LOGGER.debug("messages_delete_id_from_service(): no messages found in message store")
         return False
 
     # # Window control handlers (master open/close all windows)
@@ -0,0 +1,47 @@
+"""Normalization of the telemetry payloads (polled data, websocket frames & snapshots) into the canonical
+shape of our data container - every payload passes this stage exactly once before it will be merged/stored"""
+import logging
+
+from .fordpass_handler import ROOT_STATES, ROOT_METRICS, ROOT_EVENTS
+from .fordpass_metric_record import compact_metrics
+from .fordpass_timestamps import get_entry_epoch
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def normalize_telemetry(data_obj: dict, compact: bool = False, source: str = None) -> dict:
+    """Bring the payload into the canonical shape (in place) & return it.
+
+    - the content of 'states.commands' will be moved to the root level of 'states' (since this makes
+      checking for commands easier) - so all handlers can read e.g. 'states.getASUSettingsCommand'
+    - when 'compact' is set, all metric entries will be replaced by (read only) MetricRecords
+    """
+    if not hasattr(data_obj, "get"):
+        return data_obj
+
+    states = data_obj.get(ROOT_STATES, None)
+    if hasattr(states, "items") and "commands" in states:
+        commands = states.pop("commands")
+        if hasattr(commands, "items"):
+            # Move each command to the root level
+            for cmd_key, cmd_value in commands.items():
+                states[cmd_key] = cmd_value
+        else:
+            _LOGGER.debug(f"normalize_telemetry(): unexpected 'commands' object in states: {type(commands).__name__}")
+
+    if compact and hasattr(data_obj.get(ROOT_METRICS, None), "items"):
+        data_obj[ROOT_METRICS] = compact_metrics(data_obj[ROOT_METRICS], source)
+
+    return data_obj
+
+
+def is_stale(new_entry, stored_entry) -> bool:
+    """True, when the new entry is older than the entry we have already stored (out-of-order delivery) - when
+    one of the timestamps is unknown, the new entry will be accepted."""
+    if stored_entry is None:
+        return False
+    new_epoch = get_entry_epoch(new_entry)
+    if new_epoch is None:
+        return False
+    stored_epoch = get_entry_epoch(stored_entry)
+    return stored_epoch is not None and new_epoch < stored_epoch
@@ -0,0 +1,110 @@
+"""Memory accounting (size, key counts & growth) of the vehicle data container & pruning of outdated custom entries"""
+import sys
+import time
+from collections import deque
+from typing import Final
+
+from .fordpass_handler import ROOT_METRICS, ROOT_EVENTS
+from .fordpass_timestamps import get_entry_epoch
+
+# the (deep) size of the container will be calculated at most every MEMORY_SAMPLE_INTERVAL seconds - the
+# samples of the last 24h will be kept to calculate the growth rate
+MEMORY_SAMPLE_INTERVAL: Final = 15 * 60
+MEMORY_SAMPLE_SIZE: Final = 96
+
+# the maps that only gain keys via the websocket merge (and the root object they belong to)
+CUSTOM_ENTRY_CONTAINERS: Final = ((ROOT_METRICS, "customMetrics"), (ROOT_EVENTS, "customEvents"))
+
+
+def deep_sizeof(obj, seen: set = None) -> int:
+    """The (approximated) number of bytes that are allocated by the object and all of its children."""
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        for a_key, a_value in obj.items():
+            size += deep_sizeof(a_key, seen) + deep_sizeof(a_value, seen)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for a_item in obj:
+            size += deep_sizeof(a_item, seen)
+    elif hasattr(type(obj), "__slots__") and not isinstance(obj, (str, bytes)):
+        # e.g. our MetricRecords
+        for a_slot in type(obj).__slots__:
+            size += deep_sizeof(getattr(obj, a_slot, None), seen)
+    return size
+
+def count_keys(container: dict) -> dict:
+    """Number of entries per root key (and of the nested custom/configuration maps)."""
+    counts = {}
+    for a_root_key, a_root_obj in container.items():
+        if hasattr(a_root_obj, "__len__") and not isinstance(a_root_obj, str):
+            counts[a_root_key] = len(a_root_obj)
+    for a_root_key, a_sub_key in CUSTOM_ENTRY_CONTAINERS + ((ROOT_METRICS, "configurations"),):
+        a_sub_obj = container.get(a_root_key, {}).get(a_sub_key, None)
+        if a_sub_obj is not None:
+            counts[f"{a_root_key}.{a_sub_key}"] = len(a_sub_obj)
+    return counts
+
+def prune_custom_entries(container: dict, max_age_seconds: float, now: float = None) -> list:
+    """Remove all 'customMetrics' & 'customEvents' that have not been updated for max_age_seconds - returns the
+    list of the (root_key, sub_key, entry_key) that have been removed. Entries without any timestamp are kept."""
+    if now is None:
+        now = time.time()
+    removed = []
+    for a_root_key, a_sub_key in CUSTOM_ENTRY_CONTAINERS:
+        a_sub_obj = container.get(a_root_key, {}).get(a_sub_key, None)
+        if not hasattr(a_sub_obj, "items"):
+            continue
+        for a_entry_key, a_entry in list(a_sub_obj.items()):
+            an_epoch = get_entry_epoch(a_entry)
+            if an_epoch is not None and now - an_epoch > max_age_seconds:
+                a_sub_obj.pop(a_entry_key, None)
+                removed.append((a_root_key, a_sub_key, a_entry_key))
+    return removed
+
+
+class FordPassMemoryProfile:
+    """The sampled size of a single vehicle data container."""
+
+    def __init__(self):
+        # (timestamp, bytes)
+        self._samples = deque(maxlen=MEMORY_SAMPLE_SIZE)
+        self._key_counts = {}
+        self.pruned_entries = 0
+
+    def sample(self, container: dict, now: float = None):
+        if now is None:
+            now = time.time()
+        self._samples.append((now, deep_sizeof(container)))
+        self._key_counts = count_keys(container)
+
+    def sample_due(self, now: float = None) -> bool:
+        if now is None:
+            now = time.time()
+        return len(self._samples) == 0 or self._samples[-1][0] + MEMORY_SAMPLE_INTERVAL < now
+
+    @property
+    def growth_bytes_per_hour(self) -> float | None:
+        if len(self._samples) < 2:
+            return None
+        first_ts, first_bytes = self._samples[0]
+        last_ts, last_bytes = self._samples[-1]
+        if last_ts <= first_ts:
+            return None
+        return (last_bytes - first_bytes) / ((last_ts - first_ts) / 3600)
+
+    def as_dict(self) -> dict:
+        if len(self._samples) == 0:
+            return {"samples": 0, "pruned_entries": self.pruned_entries}
+        growth = self.growth_bytes_per_hour
+        return {
+            "samples": len(self._samples),
+            "container_bytes": self._samples[-1][1],
+            "growth_bytes_per_hour": round(growth) if growth is not None else None,
+            "key_counts": dict(sorted(self._key_counts.items())),
+            "pruned_entries": self.pruned_entries,
+        }
@@ -0,0 +1,110 @@
+"""Indexed store for the FordPass message center"""
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+# the messages are bound to the ford account (and not to a single vehicle) - so all
+# vehicles of the same account share a single (indexed) store...
+# (the stores are only accessed from the event loop - so no lock is required)
+_message_stores: dict = {}
+
+def get_message_store_for_account(account_key: str) -> "FordPassMessageStore":
+    """Get the cached message store for the account (user & region)."""
+    if account_key not in _message_stores:
+        _message_stores[account_key] = FordPassMessageStore()
+    return _message_stores[account_key]
+
+def remove_message_store_for_account(account_key: str):
+    _message_stores.pop(account_key, None)
+
+def get_message_store_count() -> int:
+    return len(_message_stores)
+
+
+class FordPassMessageStore:
+    # all messages of the account keyed by 'messageId' (in the order provided by the backend)
+    _by_id: dict
+    # the message ids per vin - lazy build on first access after an update
+    _vin_views: dict
+    # the message ids that each vehicle has already 'seen' (required to calculate the deltas
+    # per vehicle - since the vehicles of an account do not fetch the messages at the same time)
+    _known_ids_per_vin: dict
+    # the (immutable) messages - and the list they have been created from
+    _messages: tuple
+    _source: list | None
+
+    def __init__(self):
+        self._by_id = {}
+        self._vin_views = {}
+        self._known_ids_per_vin = {}
+        self._messages = ()
+        self._source = None
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    @property
+    def is_empty(self) -> bool:
+        return len(self._messages) == 0
+
+    @property
+    def messages(self) -> tuple:
+        # the tuple is immutable - so it can be shared with all callers without a copy
+        return self._messages
+
+    def update(self, messages: list, vin: str) -> tuple[list, list]:
+        """Replace the stored messages with the provided list & return the (added, removed)
+        messages that are relevant for the given vin."""
+        if messages is None:
+            return [], []
+
+        # we only rebuild the index, when the list of messages is not the same as the
+        # one that we have already in the store (other vehicles of the account might
+        # have already fetched the same list)
+        if messages is not self._source:
+            new_by_id = {}
+            for a_msg in messages:
+                if isinstance(a_msg, dict) and "messageId" in a_msg:
+                    try:
+                        new_by_id[int(a_msg["messageId"])] = a_msg
+                    except (ValueError, TypeError):
+                        _LOGGER.debug(f"update(): ignoring message with invalid messageId: {a_msg.get('messageId')}")
+
+            self._by_id = new_by_id
+            self._messages = tuple(messages)
+            self._source = messages
+            self._vin_views = {}
+
+        current_ids = set(self.get_ids_for_vin(vin))
+        known_ids = self._known_ids_per_vin.get(vin, None)
+        self._known_ids_per_vin[vin] = current_ids
+
+        if known_ids is None:
+            # initial fetch for this vehicle - we don't want to report all existing messages as 'new'
+            return [], []
+
+        added = [self._by_id[a_id] for a_id in self.get_ids_for_vin(vin) if a_id not in known_ids]
+        removed_ids = list(known_ids - current_ids)
+        return added, removed_ids
+
+    def get_ids_for_vin(self, vin: str) -> list:
+        """All message ids that are relevant for the vin (messages without a 'relevantVin' are
+        relevant for all vehicles of the account)."""
+        if vin not in self._vin_views:
+            self._vin_views[vin] = [a_id for a_id, a_msg in self._by_id.items()
+                                    if len(a_msg.get("relevantVin", "") or "") == 0 or a_msg.get("relevantVin") == vin]
+        return self._vin_views[vin]
+
+    def get(self, msg_id: int) -> dict | None:
+        return self._by_id.get(msg_id, None)
+
+    def remove_ids(self, msg_ids: list):
+        """Remove the (deleted) messages from the index - the next fetch will provide the final state."""
+        any_removed = False
+        for a_id in msg_ids:
+            if self._by_id.pop(a_id, None) is not None:
+                any_removed = True
+        if any_removed:
+            self._messages = tuple(self._by_id.values())
+            self._source = None
+            self._vin_views = {}
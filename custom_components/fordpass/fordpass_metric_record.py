@@ -0,0 +1,122 @@
+"""Compact (optional) representation of the metric entries of our data container"""
+import sys
+from collections.abc import Mapping
+from typing import Final
+
+from .fordpass_timestamps import parse_timestamp
+
+# the origin of a metric record
+SOURCE_POLL: Final = "poll"
+SOURCE_WEBSOCKET: Final = "ws"
+SOURCE_SNAPSHOT: Final = "snapshot"
+
+# fields of the metric entries that are never read by any of the handlers - they will not be kept in the
+# compact records at all
+DROPPED_FIELDS: Final = frozenset(["oemCorrelationId"])
+
+# the metric objects that contain a further level of metric entries (like in the websocket merge)
+NESTED_METRICS_KEYS: Final = ("customMetrics", "configurations", "indicators")
+
+# string values that are shorter than this will be interned (like "ON", "OFF", "CLOSED", "UNLOCKED", ...) - the
+# same values will be delivered with every single websocket frame
+INTERN_VALUE_MAX_LENGTH: Final = 32
+
+_MISSING = object()
+
+
+def intern_key(a_key):
+    return sys.intern(a_key) if type(a_key) is str else a_key
+
+def _intern_value(a_value):
+    if type(a_value) is str and len(a_value) < INTERN_VALUE_MAX_LENGTH:
+        return sys.intern(a_value)
+    return a_value
+
+
+class MetricRecord(Mapping):
+    """A single metric entry (value, parsed update epoch & source) - all other fields the handlers might read (like
+    the original 'updateTime' string, 'tags', 'vehicleSide', ...) are kept in an (optional) extra dict. The record
+    can be used like the original (read only) dict, so none of the handlers need to know if the data container has
+    been compacted or not - the epoch & source are internal and not part of the mapping."""
+    __slots__ = ("value", "update_epoch", "source", "_extra")
+
+    def __init__(self, value, update_epoch: float | None, source: str | None, extra: dict | None = None):
+        self.value = value
+        self.update_epoch = update_epoch
+        self.source = source
+        self._extra = extra
+
+    @staticmethod
+    def from_dict(an_entry: dict, source: str | None = None) -> "MetricRecord":
+        extra = None
+        for a_key, a_value in an_entry.items():
+            if a_key == "value" or a_key in DROPPED_FIELDS:
+                continue
+            if extra is None:
+                extra = {}
+            extra[intern_key(a_key)] = a_value
+        return MetricRecord(_intern_value(an_entry.get("value", _MISSING)), parse_timestamp(an_entry.get("updateTime", None)), source, extra)
+
+    @property
+    def update_time(self) -> str | None:
+        # the original ISO 8601 string (as delivered by the API - the attributes expose it unchanged)
+        return self._extra.get("updateTime", None) if self._extra is not None else None
+
+    def __getitem__(self, a_key):
+        a_value = self.get(a_key, _MISSING)
+        if a_value is _MISSING:
+            raise KeyError(a_key)
+        return a_value
+
+    def get(self, a_key, default=None):
+        if a_key == "value":
+            return default if self.value is _MISSING else self.value
+        elif self._extra is not None:
+            return self._extra.get(a_key, default)
+        return default
+
+    def __contains__(self, a_key):
+        return self.get(a_key, _MISSING) is not _MISSING
+
+    def __iter__(self):
+        if self.value is not _MISSING:
+            yield "value"
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self):
+        return ((self.value is not _MISSING) +
+                (len(self._extra) if self._extra is not None else 0))
+
+    def __repr__(self):
+        return repr(self.as_dict())
+
+    def as_dict(self) -> dict:
+        """The plain dict (e.g. for the snapshot or the HA JSON encoder)."""
+        return {a_key: self.get(a_key) for a_key in self}
+
+
+def _compact_entry(an_entry, source: str | None):
+    if type(an_entry) is dict:
+        return MetricRecord.from_dict(an_entry, source)
+    elif type(an_entry) is list:
+        return [_compact_entry(a_list_entry, source) for a_list_entry in an_entry]
+    return an_entry
+
+def compact_metrics(metrics_obj: dict, source: str | None = None) -> dict:
+    """A new metrics dict with interned keys where all metric entries (incl. the ones in the 'customMetrics' &
+    'configurations') have been replaced by MetricRecords."""
+    compacted = {}
+    for a_key_name, an_entry in metrics_obj.items():
+        if a_key_name in NESTED_METRICS_KEYS and hasattr(an_entry, "items"):
+            compacted[intern_key(a_key_name)] = {intern_key(a_sub_key_name): _compact_entry(a_sub_entry, source)
+                                                 for a_sub_key_name, a_sub_entry in an_entry.items()}
+        else:
+            compacted[intern_key(a_key_name)] = _compact_entry(an_entry, source)
+    return compacted
+
+def to_plain(obj):
+    """JSON encoder 'default' - converts the MetricRecords back to plain dicts."""
+    if isinstance(obj, MetricRecord):
+        return obj.as_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
@@ -0,0 +1,89 @@
+"""Runtime statistics (counters & histograms) of the hot paths of the integration"""
+import time
+from collections import deque
+from typing import Final
+
+# number of the most recent samples that will be used to calculate the percentiles
+HISTOGRAM_SAMPLE_SIZE: Final = 256
+
+
+def percentile(samples, pct: float) -> float | None:
+    if len(samples) == 0:
+        return None
+    sorted_samples = sorted(samples)
+    idx = min(len(sorted_samples) - 1, int(round(pct / 100 * (len(sorted_samples) - 1))))
+    return sorted_samples[idx]
+
+
+class FordPassHistogram:
+    __slots__ = ("count", "total", "min", "max", "samples")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self.samples = deque(maxlen=HISTOGRAM_SAMPLE_SIZE)
+
+    def observe(self, value: float):
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        self.samples.append(value)
+
+    def percentile(self, pct: float) -> float | None:
+        return percentile(self.samples, pct)
+
+    def as_dict(self) -> dict:
+        if self.count == 0:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "avg": round(self.total / self.count, 2),
+            "min": round(self.min, 2),
+            "max": round(self.max, 2),
+            "p50": round(self.percentile(50), 2),
+            "p95": round(self.percentile(95), 2),
+        }
+
+
+class FordPassMetrics:
+    """All counters & histograms of a single vehicle - histograms for durations are in milliseconds."""
+
+    def __init__(self):
+        self.started = time.time()
+        self._counters: dict = {}
+        self._histograms: dict = {}
+
+    def incr(self, name: str, amount: int = 1):
+        self._counters[name] = self._counters.get(name, 0) + amount
+
+    def observe(self, name: str, value: float):
+        a_histogram = self._histograms.get(name, None)
+        if a_histogram is None:
+            a_histogram = FordPassHistogram()
+            self._histograms[name] = a_histogram
+        a_histogram.observe(value)
+
+    def observe_since(self, name: str, monotonic_start: float):
+        self.observe(name, (time.monotonic() - monotonic_start) * 1000)
+
+    def observe_response(self, endpoint: str, status: int, monotonic_start: float):
+        self.observe_since(f"http_{endpoint}_ms", monotonic_start)
+        self.incr(f"http_{endpoint}_{status}")
+
+    def counter(self, name: str) -> int:
+        return self._counters.get(name, 0)
+
+    def histogram(self, name: str) -> FordPassHistogram | None:
+        return self._histograms.get(name, None)
+
+    def as_dict(self) -> dict:
+        return {
+            "uptime_seconds": int(time.time() - self.started),
+            "counters": dict(sorted(self._counters.items())),
+            "histograms": {a_name: a_histogram.as_dict() for a_name, a_histogram in sorted(self._histograms.items())},
+        }
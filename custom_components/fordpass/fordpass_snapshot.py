@@ -0,0 +1,133 @@
+"""Compact persistent snapshot of the vehicle data container"""
+import json
+import logging
+import os
+import zlib
+from typing import Final
+
+from .fordpass_metric_record import MetricRecord, to_plain
+
+_LOGGER = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT_VERSION: Final = 1
+
+# snapshot file layout (zlib compressed JSON):
+#   {"v": <format version>, "k": [<all dict keys>], "d": <data>}
+# where every dict key in <data> is replaced by the (string) index of the key in "k" - the metric
+# names (and their 'value', 'updateTime', ...) are repeated hundreds of times in the container
+#
+# journal file layout (one JSON line per delta):
+#   [[<root_key>, <sub_key or null>, <value>], ...]
+
+def _intern_keys(obj, key_index: dict, keys: list):
+    if isinstance(obj, MetricRecord):
+        obj = obj.as_dict()
+    if isinstance(obj, dict):
+        encoded = {}
+        for a_key, a_value in obj.items():
+            idx = key_index.get(a_key, None)
+            if idx is None:
+                idx = len(keys)
+                key_index[a_key] = idx
+                keys.append(a_key)
+            encoded[str(idx)] = _intern_keys(a_value, key_index, keys)
+        return encoded
+    elif isinstance(obj, list):
+        return [_intern_keys(a_item, key_index, keys) for a_item in obj]
+    return obj
+
+def _restore_keys(obj, keys: list):
+    if isinstance(obj, dict):
+        return {keys[int(a_key)]: _restore_keys(a_value, keys) for a_key, a_value in obj.items()}
+    elif isinstance(obj, list):
+        return [_restore_keys(a_item, keys) for a_item in obj]
+    return obj
+
+def copy_container(data: dict) -> dict:
+    """A cheap copy of the data container that can be serialized in the executor - the websocket merge (and the
+    pruning) only replaces/removes the entries of the root objects and of their nested maps, but never modifies an
+    entry itself. So we only have to copy the dicts (and lists) of the first three levels."""
+    a_copy = {}
+    for a_root_key, a_root_obj in data.items():
+        if type(a_root_obj) is dict:
+            a_copy[a_root_key] = {a_key: (dict(a_value) if type(a_value) is dict else a_value) for a_key, a_value in a_root_obj.items()}
+        elif type(a_root_obj) is list:
+            a_copy[a_root_key] = list(a_root_obj)
+        else:
+            a_copy[a_root_key] = a_root_obj
+    return a_copy
+
+def encode_snapshot(data: dict) -> bytes:
+    keys = []
+    encoded_data = _intern_keys(data, {}, keys)
+    a_json_str = json.dumps({"v": SNAPSHOT_FORMAT_VERSION, "k": keys, "d": encoded_data}, separators=(",", ":"))
+    return zlib.compress(a_json_str.encode("utf-8"))
+
+def decode_snapshot(raw: bytes) -> dict | None:
+    snapshot = json.loads(zlib.decompress(raw).decode("utf-8"))
+    if not isinstance(snapshot, dict) or snapshot.get("v", None) != SNAPSHOT_FORMAT_VERSION:
+        _LOGGER.debug(f"decode_snapshot(): unsupported snapshot format version: {snapshot.get('v', None) if isinstance(snapshot, dict) else None}")
+        return None
+    return _restore_keys(snapshot["d"], snapshot["k"])
+
+def encode_delta(data: dict, dirty_keys: set) -> str:
+    a_delta = []
+    for a_root_key, a_sub_key in dirty_keys:
+        if a_root_key not in data:
+            continue
+        if a_sub_key is None:
+            a_delta.append([a_root_key, None, data[a_root_key]])
+        elif isinstance(data[a_root_key], dict) and a_sub_key in data[a_root_key]:
+            a_delta.append([a_root_key, a_sub_key, data[a_root_key][a_sub_key]])
+    return json.dumps(a_delta, separators=(",", ":"), default=to_plain)
+
+def apply_delta(data: dict, a_delta: list):
+    for a_root_key, a_sub_key, a_value in a_delta:
+        if a_sub_key is None:
+            data[a_root_key] = a_value
+        else:
+            if not isinstance(data.get(a_root_key, None), dict):
+                data[a_root_key] = {}
+            data[a_root_key][a_sub_key] = a_value
+
+def write_atomic(filename: str, raw: bytes):
+    """Synchronous method to (atomic) write a file, called from executor."""
+    directory = os.path.dirname(filename)
+    if not os.path.exists(directory):
+        os.makedirs(directory, exist_ok=True)
+    tmp_filename = f"{filename}.tmp"
+    with open(tmp_filename, "wb") as outfile:
+        outfile.write(raw)
+        outfile.flush()
+        os.fsync(outfile.fileno())
+    os.replace(tmp_filename, filename)
+
+def append_line(filename: str, a_line: str):
+    """Synchronous method to append a line to a file, called from executor."""
+    with open(filename, "a", encoding="utf-8") as outfile:
+        outfile.write(a_line)
+        outfile.write("\n")
+
+def read_snapshot_with_journal(snapshot_filename: str, journal_filename: str) -> tuple[dict | None, int]:
+    """Synchronous method to read the snapshot (and apply all deltas of the journal), called from executor."""
+    if not os.path.isfile(snapshot_filename):
+        return None, 0
+
+    with open(snapshot_filename, "rb") as snapshot_file:
+        data = decode_snapshot(snapshot_file.read())
+
+    journal_lines = 0
+    if data is not None and os.path.isfile(journal_filename):
+        with open(journal_filename, encoding="utf-8") as journal_file:
+            for a_line in journal_file:
+                a_line = a_line.strip()
+                if len(a_line) == 0:
+                    continue
+                try:
+                    apply_delta(data, json.loads(a_line))
+                    journal_lines += 1
+                except ValueError:
+                    # the last line might be incomplete (when HA was killed while writing)
+                    _LOGGER.debug(f"read_snapshot_with_journal(): ignoring invalid journal line in '{journal_filename}'")
+                    break
+    return data, journal_lines
@@ -0,0 +1,90 @@
+"""Staggered (jittered) startup of all vehicles of a single account - avoids the request burst (401/429) when HA starts"""
+import asyncio
+import logging
+import random
+import time
+from contextlib import asynccontextmanager
+from typing import Final
+
+_LOGGER = logging.getLogger(__name__)
+
+# max number of vehicles (of the same account) that are doing their startup network work at the same time
+STARTUP_CONCURRENCY: Final = 2
+# min time between the start of two vehicles of the same account [in seconds] - plus a random jitter
+STARTUP_STAGGER: Final = 4
+STARTUP_JITTER: Final = 3
+# while a vehicle without any snapshot is waiting for its (blocking) first refresh, the background work of the
+# other vehicles (that have been already created from their snapshot) will wait [poll interval in seconds]
+STARTUP_PRIORITY_POLL: Final = 1
+
+# (the orchestrators are only accessed from the event loop - so no lock is required)
+_orchestrators: dict = {}
+
+def get_startup_orchestrator_for_account(account_key: str) -> "FordPassStartupOrchestrator":
+    """Get the cached startup orchestrator for the account (user & region)."""
+    if account_key not in _orchestrators:
+        _orchestrators[account_key] = FordPassStartupOrchestrator()
+    return _orchestrators[account_key]
+
+def remove_startup_orchestrator_for_account(account_key: str):
+    _orchestrators.pop(account_key, None)
+
+def get_startup_orchestrator_count() -> int:
+    return len(_orchestrators)
+
+
+class FordPassStartupOrchestrator:
+    """The concurrency budget of an account - every startup step (first refresh, websocket connect) of a vehicle
+    must acquire a slot. The slots are handed out with a minimum distance (+ jitter), so the token validation,
+    the status & all other requests of the vehicles will trickle in, instead of hitting the backend at once.
+    A single vehicle will not be delayed at all."""
+
+    def __init__(self):
+        self._semaphore = asyncio.Semaphore(STARTUP_CONCURRENCY)
+        # monotonic time, when the next slot can be used
+        self._next_start = 0.0
+        self._blocking_pending = 0
+        self.slots = 0
+        self.delayed = 0
+        self.total_wait_ms = 0
+
+    def _reserve_start(self) -> float:
+        now = time.monotonic()
+        if self._next_start <= now:
+            a_delay = 0.0
+        else:
+            a_delay = self._next_start - now + random.uniform(0, STARTUP_JITTER)
+        self._next_start = now + a_delay + STARTUP_STAGGER
+        return a_delay
+
+    @asynccontextmanager
+    async def slot(self, vli: str, name: str, blocking: bool = False):
+        """Wait for a startup slot - as long as 'blocking' slots (the first refresh of a vehicle that could not be
+        created from a snapshot, so HA is waiting for it) are pending or in use, no background slot will be served."""
+        a_wait_start = time.monotonic()
+        if blocking:
+            self._blocking_pending += 1
+        try:
+            if not blocking:
+                while self._blocking_pending > 0:
+                    await asyncio.sleep(STARTUP_PRIORITY_POLL)
+
+            async with self._semaphore:
+                a_delay = self._reserve_start()
+                if a_delay > 0:
+                    _LOGGER.debug(f"{vli}startup slot '{name}' delayed by {a_delay:.1f} sec")
+                    await asyncio.sleep(a_delay)
+                    self.delayed += 1
+                self.slots += 1
+                self.total_wait_ms += int((time.monotonic() - a_wait_start) * 1000)
+                yield
+        finally:
+            if blocking:
+                self._blocking_pending -= 1
+
+    def as_dict(self) -> dict:
+        return {
+            "slots": self.slots,
+            "delayed": self.delayed,
+            "avg_wait_ms": int(self.total_wait_ms / self.slots) if self.slots > 0 else 0,
+        }
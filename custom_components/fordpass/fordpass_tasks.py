@@ -0,0 +1,132 @@
+"""Supervisor of all background tasks of a single vehicle (debounced updates, websocket, ...)"""
+import asyncio
+import logging
+import time
+from typing import Final
+
+_LOGGER = logging.getLogger(__name__)
+
+# a (not long-lived) task that runs longer than this, will be reported as long-running [in seconds]
+TASK_MAX_AGE: Final = 15 * 60
+# max time we wait for the canceled tasks to finish (when the vehicle will be unloaded) [in seconds]
+TASK_CANCEL_TIMEOUT: Final = 2
+
+
+class FordPassTaskSupervisor:
+    """Owns all background tasks of a vehicle - every task has a name, tasks spawned with 'replace' cancel
+    the running task of the same name (debounce). When the supervisor has been closed (entry unload), no new
+    tasks will be accepted anymore - so the number of tasks stays bounded even with frequent reloads."""
+
+    def __init__(self, owner=None):
+        # the owner (our bridge) provides the (v)ehicle (l)og (i)d - which will change after the vehicle
+        # data have been read
+        self._owner = owner
+        # task -> (name, started, long_lived)
+        self._tasks: dict = {}
+        self._reported_long_running = set()
+        self._closed = False
+        self.created = 0
+        self.canceled = 0
+        self.failed = 0
+        self.leaked = 0
+
+    @property
+    def vli(self) -> str:
+        return getattr(self._owner, "vli", "")
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def spawn(self, coro, name: str, replace: bool = False, long_lived: bool = False) -> asyncio.Task | None:
+        if self._closed:
+            _LOGGER.debug(f"{self.vli}spawn(): supervisor is closed - '{name}' will not be started")
+            coro.close()
+            return None
+        if replace:
+            self.cancel(name)
+        return self.adopt(asyncio.create_task(coro, name=f"fordpass_{name}"), name, long_lived)
+
+    def adopt(self, a_task: asyncio.Task, name: str, long_lived: bool = False) -> asyncio.Task | None:
+        """Take over the ownership of a task that has been created elsewhere (e.g. by the config entry)."""
+        if a_task is None:
+            return None
+        if self._closed:
+            a_task.cancel()
+            return None
+        self._tasks[a_task] = (name, time.monotonic(), long_lived)
+        self.created += 1
+        a_task.add_done_callback(self._task_done)
+        return a_task
+
+    def _task_done(self, a_task: asyncio.Task):
+        a_task_info = self._tasks.pop(a_task, None)
+        self._reported_long_running.discard(a_task)
+        if a_task.cancelled():
+            self.canceled += 1
+        elif a_task.exception() is not None:
+            self.failed += 1
+            name = a_task_info[0] if a_task_info is not None else a_task.get_name()
+            _LOGGER.info(f"{self.vli}task '{name}' failed: {type(a_task.exception()).__name__} - {a_task.exception()}")
+
+    def get_tasks(self, name: str) -> list:
+        return [a_task for a_task, a_task_info in self._tasks.items() if a_task_info[0] == name and not a_task.done()]
+
+    def is_running(self, name: str) -> bool:
+        return len(self.get_tasks(name)) > 0
+
+    def cancel(self, name: str) -> bool:
+        """Cancel all running tasks with the name - True, if at least one task has been canceled."""
+        any_canceled = False
+        for a_task in self.get_tasks(name):
+            any_canceled = a_task.cancel() or any_canceled
+        return any_canceled
+
+    async def cancel_all(self, timeout: float = TASK_CANCEL_TIMEOUT) -> int:
+        """Close the supervisor, cancel all tasks & wait (max timeout seconds) till they are finished - returns
+        the number of tasks that did not finish in time (leaked)."""
+        self._closed = True
+        # we must not wait for the task that is calling us
+        current = asyncio.current_task()
+        pending = [a_task for a_task in self._tasks if not a_task.done() and a_task is not current]
+        if len(pending) == 0:
+            return 0
+
+        for a_task in pending:
+            a_task.cancel()
+        done, still_pending = await asyncio.wait(pending, timeout=timeout)
+        if len(still_pending) > 0:
+            self.leaked += len(still_pending)
+            _LOGGER.warning(f"{self.vli}cancel_all(): {len(still_pending)} task(s) did not finish within {timeout} sec: {[self._tasks.get(a_task, (a_task.get_name(),))[0] for a_task in still_pending]}")
+        return len(still_pending)
+
+    def check_long_running(self, max_age: float = TASK_MAX_AGE) -> list:
+        """The (name, age) of all tasks (that are not long-lived) running longer than max_age - each task
+        will be only logged once."""
+        now = time.monotonic()
+        long_running = []
+        for a_task, (name, started, long_lived) in self._tasks.items():
+            if not long_lived and not a_task.done() and now - started > max_age:
+                long_running.append((name, int(now - started)))
+                if a_task not in self._reported_long_running:
+                    self._reported_long_running.add(a_task)
+                    _LOGGER.warning(f"{self.vli}check_long_running(): task '{name}' is running for {int(now - started)} sec")
+        return long_running
+
+    def as_dict(self) -> dict:
+        now = time.monotonic()
+        running = {}
+        for a_task, (name, started, long_lived) in self._tasks.items():
+            if not a_task.done():
+                running[name] = max(running.get(name, 0), int(now - started))
+        return {
+            "running": sum(1 for a_task in self._tasks if not a_task.done()),
+            "created": self.created,
+            "canceled": self.canceled,
+            "failed": self.failed,
+            "leaked": self.leaked,
+            "closed": self._closed,
+            # the age (in seconds) of the oldest running task per name
+            "ages": dict(sorted(running.items())),
+            "long_running": [name for name, age in self.check_long_running()],
+        }
@@ -0,0 +1,51 @@
+"""Cached parsing of the ISO 8601 timestamps (updateTime/timestamp fields) of the FordPass payloads"""
+from datetime import datetime
+from functools import lru_cache
+from typing import Final
+
+# the same timestamps will be delivered again & again (the websocket sends the complete metrics objects
+# and the handlers are evaluated for every coordinator update) - the parsed epoch is not stored in the
+# entries of our data container (they are exposed as attributes & stored in the snapshot), so the cache
+# must be large enough for all timestamps of a (full) container
+TIMESTAMP_PARSE_CACHE_SIZE: Final = 4096
+
+
+@lru_cache(maxsize=TIMESTAMP_PARSE_CACHE_SIZE)
+def _parse(a_timestamp: str) -> tuple[datetime, float] | None:
+    try:
+        parsed_dt = datetime.fromisoformat(a_timestamp.replace('Z', '+00:00'))
+        return parsed_dt, parsed_dt.timestamp()
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+def parse_timestamp(a_timestamp: str) -> float | None:
+    """ISO 8601 timestamp (e.g. "2025-06-05T21:34:47.619487Z") to unix epoch - or None if it can't be parsed."""
+    if not isinstance(a_timestamp, str):
+        return None
+    parsed = _parse(a_timestamp)
+    return parsed[1] if parsed is not None else None
+
+def parse_datetime(a_timestamp: str) -> datetime | None:
+    """ISO 8601 timestamp to a (timezone aware) datetime - or None if it can't be parsed."""
+    if not isinstance(a_timestamp, str):
+        return None
+    parsed = _parse(a_timestamp)
+    return parsed[0] if parsed is not None else None
+
+def get_entry_epoch(an_entry) -> float | None:
+    """The 'updateTime' (or 'timestamp') of a metric/state/event entry as unix epoch - for lists of entries the
+    newest one will be used."""
+    if hasattr(an_entry, "get"):
+        # the compact MetricRecords keep the parsed epoch in a slot
+        an_epoch = getattr(an_entry, "update_epoch", None)
+        if an_epoch is not None:
+            return an_epoch
+        return parse_timestamp(an_entry.get("updateTime", None) or an_entry.get("timestamp", None))
+    elif isinstance(an_entry, list):
+        newest = None
+        for a_list_entry in an_entry:
+            an_epoch = get_entry_epoch(a_list_entry)
+            if an_epoch is not None and (newest is None or an_epoch > newest):
+                newest = an_epoch
+        return newest
+    return None
@@ -8,7 +8,7 @@ from typing import Any
 
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
+from homeassistant.const import Platform, MATCH_ALL
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_platform
 from homeassistant.helpers.restore_state import RestoreEntity, RestoredExtraData, async_get, StoredState
@@ -42,6 +42,8 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, asyn
         if a_entity_description.tag == Tag.FIRMWARE_UPDATE_HISTORY:
             # a special sensor implementation created by TheHangMan97
             sensor = FordPassFirmwareUpdateHistorySensor(coordinator, a_entity_description)
+        elif a_entity_description.tag == Tag.INTEGRATION_STATISTICS:
+            sensor = FordPassStatisticsSensor(coordinator, a_entity_description)
         else:
             sensor = FordPassSensor(coordinator, a_entity_description)
             # # we want to restore the last known 'id' of the energyTransferLogs
@@ -194,4 +196,20 @@ class FordPassFirmwareUpdateHistorySensor(FordPassSensor):
 
     @property
     def extra_state_attributes(self):
-        return {"history": list(reversed(self._history))}
\ No newline at end of file
+        return {"history": list(reversed(self._history))}
+
+
+class FordPassStatisticsSensor(FordPassSensor):
+    """The runtime statistics of the integration (for this vehicle) - the state is the number of
+    data pushes to the coordinator, the counters & histograms are provided as attributes."""
+    # the state changes with every push - the (large) statistics attributes must not be written to the
+    # recorder each time
+    _unrecorded_attributes = frozenset({MATCH_ALL})
+
+    @property
+    def native_value(self):
+        return self.coordinator.bridge.metrics.counter("coordinator_pushes")
+
+    @property
+    def extra_state_attributes(self):
+        return self.coordinator.bridge.get_statistics()
@@ -0,0 +1,394 @@
+"""Services of the FordPass integration - registered once and fanned out to all targeted vehicles"""
+import asyncio
+import logging
+import time
+from typing import Final
+
+from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse
+from homeassistant.helpers import device_registry as the_device_registry
+from homeassistant.helpers import entity_registry as the_entity_registry
+from homeassistant.helpers.service import async_extract_referenced_entity_ids
+
+from .const import DOMAIN, CONF_VIN
+from .const_shared import COORDINATOR_KEY, DAYS_MAP
+from .const_tags import Tag
+from .fordpass_handler import FordpassDataHandler
+
+_LOGGER = logging.getLogger(__name__)
+
+# max number of vehicles that will be processed in parallel by a single service call
+FLEET_SERVICE_CONCURRENCY: Final = 5
+# the 'vin' field value to address all vehicles (which is also the default when no target is provided - but
+# only for the read-only/refresh services; the destructive services require an explicit target)
+TARGET_ALL: Final = "all"
+
+SERVICE_REFRESH_STATUS: Final = "refresh_status"
+SERVICE_CLEAR_TOKENS: Final = "clear_tokens"
+SERVICE_POLL_API: Final = "poll_api"
+SERVICE_RELOAD: Final = "reload"
+SERVICE_DELETE_MESSAGE: Final = "delete_message"
+SERVICE_UPDATE_DEPARTURE_SCHEDULE: Final = "update_departure_schedule"
+SERVICE_DELETE_DEPARTURE_SCHEDULE_BY_DAYS: Final = "delete_departure_schedule_by_days"
+SERVICE_DELETE_DEPARTURE_SCHEDULE_BY_IDS: Final = "delete_departure_schedule_by_ids"
+SERVICE_BATCH_DEPARTURE_SCHEDULE: Final = "batch_departure_schedule"
+
+DEPARTURE_SCHEDULE_SERVICES: Final = [
+    SERVICE_UPDATE_DEPARTURE_SCHEDULE,
+    SERVICE_DELETE_DEPARTURE_SCHEDULE_BY_DAYS,
+    SERVICE_DELETE_DEPARTURE_SCHEDULE_BY_IDS,
+    SERVICE_BATCH_DEPARTURE_SCHEDULE,
+]
+
+
+def get_coordinators(hass: HomeAssistant) -> dict:
+    """All loaded coordinators (by config entry id)."""
+    coordinators = {}
+    for a_entry_id, a_entry_data in hass.data.get(DOMAIN, {}).items():
+        if isinstance(a_entry_data, dict) and COORDINATOR_KEY in a_entry_data:
+            coordinators[a_entry_id] = a_entry_data[COORDINATOR_KEY]
+    return coordinators
+
+
+def resolve_target_coordinators(hass: HomeAssistant, call: ServiceCall, required_tag: Tag = None, default_all: bool = True) -> list:
+    """The coordinators of the vehicles that are addressed by the service call (vin, device or entity target) -
+    without any target, all vehicles will be addressed (when 'default_all' is set) or none."""
+    coordinators = get_coordinators(hass)
+    target_entry_ids = set()
+    any_target = False
+
+    raw_vins = call.data.get(CONF_VIN, None)
+    if raw_vins is not None and len(raw_vins) > 0:
+        if isinstance(raw_vins, str):
+            raw_vins = [a_vin.strip() for a_vin in raw_vins.split(",") if a_vin.strip()]
+        a_vin_list = [str(a_vin).lower() for a_vin in raw_vins]
+        if TARGET_ALL in a_vin_list:
+            target_entry_ids.update(coordinators.keys())
+        else:
+            for a_entry_id, a_coordinator in coordinators.items():
+                if a_coordinator._vin.lower() in a_vin_list:
+                    target_entry_ids.add(a_entry_id)
+        any_target = True
+
+    selected = async_extract_referenced_entity_ids(hass, call)
+    if len(selected.referenced) > 0 or len(selected.indirectly_referenced) > 0 or len(selected.referenced_devices) > 0:
+        any_target = True
+        entity_registry = the_entity_registry.async_get(hass)
+        for a_entity_id in selected.referenced | selected.indirectly_referenced:
+            a_entity_entry = entity_registry.async_get(a_entity_id)
+            if a_entity_entry is not None and a_entity_entry.config_entry_id in coordinators:
+                target_entry_ids.add(a_entity_entry.config_entry_id)
+
+        device_registry = the_device_registry.async_get(hass)
+        for a_device_id in selected.referenced_devices:
+            a_device_entry = device_registry.async_get(a_device_id)
+            if a_device_entry is not None:
+                target_entry_ids.update(a_entry_id for a_entry_id in a_device_entry.config_entries if a_entry_id in coordinators)
+
+    if not any_target:
+        if not default_all:
+            _LOGGER.warning(f"Service '{call.service}': requires a target (device, entity or 'vin' - use '{TARGET_ALL}' to address all vehicles)")
+            return []
+        target_entry_ids.update(coordinators.keys())
+
+    target_coordinators = []
+    for a_entry_id in target_entry_ids:
+        a_coordinator = coordinators[a_entry_id]
+        if required_tag is not None and not a_coordinator.tag_supported_by_vehicle(required_tag):
+            _LOGGER.debug(f"{a_coordinator.vli}Service '{call.service}' skipped - not supported by this vehicle")
+            continue
+        target_coordinators.append(a_coordinator)
+
+    if len(target_coordinators) == 0:
+        _LOGGER.warning(f"Service '{call.service}': no (supported) vehicle found for the provided target: {call.data}")
+    return target_coordinators
+
+
+async def fan_out(call: ServiceCall, coordinators: list, a_vehicle_fn) -> dict:
+    """Run 'a_vehicle_fn(coordinator)' for all coordinators (max FLEET_SERVICE_CONCURRENCY in parallel) and
+    return the result per VIN."""
+    a_semaphore = asyncio.Semaphore(FLEET_SERVICE_CONCURRENCY)
+
+    async def run_for_vehicle(a_coordinator):
+        async with a_semaphore:
+            try:
+                result = await a_vehicle_fn(a_coordinator)
+                return a_coordinator._vin, {"success": result is not False}
+            except Exception as ex:
+                _LOGGER.warning(f"{a_coordinator.vli}Service '{call.service}' failed: {type(ex).__name__} - {ex}")
+                return a_coordinator._vin, {"success": False, "error": f"{type(ex).__name__}: {ex}"}
+
+    results = await asyncio.gather(*[run_for_vehicle(a_coordinator) for a_coordinator in coordinators])
+    return {"vehicles": dict(results)}
+
+
+# simple service implementations (the per vehicle part)
+async def _refresh_status(coordinator) -> bool:
+    # returns as soon as the fresh metrics have arrived (or after a single status request as fallback)
+    success = await coordinator.bridge.request_update_and_wait()
+    _LOGGER.debug(f"[@{coordinator.vli}] refresh_status: {'fresh data received' if success else 'failed'}")
+    return success
+
+async def _clear_tokens(coordinator) -> bool:
+    """Clear the token file in config directory, only use in emergency"""
+    await coordinator.bridge.clear_token()
+    await asyncio.sleep(5)
+    await coordinator.async_request_refresh_force_classic_requests()
+    return True
+
+async def _poll_api(coordinator) -> bool:
+    await coordinator.async_request_refresh_force_classic_requests()
+    return True
+
+
+# parsing/validation of the service call data (done once per call - not per vehicle)
+def _parse_days(call_data_days, service_fn_name: str) -> list | None:
+    days = call_data_days
+    if isinstance(days, str):
+        days = [days]
+    elif not isinstance(days, list):
+        _LOGGER.warning(f"{service_fn_name}(): invalid 'schedule_days' format: {type(days).__name__}")
+        return None
+
+    validated_days = []
+    for day in days:
+        day_name = str(day).upper()
+        if day_name in DAYS_MAP:
+            validated_days.append(day_name)
+
+    if len(validated_days) == 0:
+        _LOGGER.warning(f"{service_fn_name}(): No valid days were provided")
+        return None
+    return validated_days
+
+def _parse_schedule_ids(raw_ids, service_fn_name: str) -> list | None:
+    if isinstance(raw_ids, int):
+        schedule_ids = [raw_ids]
+    elif isinstance(raw_ids, str):
+        parts = [p.strip() for p in raw_ids.split(",") if p.strip()]
+        try:
+            schedule_ids = [int(p) for p in parts]
+        except ValueError:
+            _LOGGER.warning(f"{service_fn_name}(): invalid 'schedule_ids' string: {raw_ids}")
+            return None
+    elif isinstance(raw_ids, list):
+        schedule_ids = []
+        for value in raw_ids:
+            try:
+                schedule_ids.append(int(value))
+            except (TypeError, ValueError):
+                _LOGGER.warning(f"{service_fn_name}(): invalid schedule id value: {value}")
+                return None
+    else:
+        _LOGGER.warning(f"{service_fn_name}(): invalid 'schedule_ids' format: {type(raw_ids).__name__}")
+        return None
+
+    if len(schedule_ids) == 0:
+        _LOGGER.warning(f"{service_fn_name}(): No schedule IDs were provided")
+        return None
+    return schedule_ids
+
+def _parse_precon_temperature(raw_value, service_fn_name: str) -> str:
+    precon_temperature = str(raw_value).upper()
+    if precon_temperature not in ["LOW", "MEDIUM", "HIGH", "OFF"]:
+        _LOGGER.warning(f"{service_fn_name}(): invalid precon_temperature '{precon_temperature}' - fallback to OFF")
+        precon_temperature = "OFF"
+    return precon_temperature
+
+def _parse_batch_edits(raw_edits) -> list | None:
+    if isinstance(raw_edits, dict):
+        raw_edits = [raw_edits]
+    elif not isinstance(raw_edits, list):
+        _LOGGER.warning(f"async_batch_departure_schedule_service(): invalid 'edits' format: {type(raw_edits).__name__}")
+        return None
+
+    # all edits will be validated first - a single invalid edit will reject the complete batch
+    edits = []
+    for idx, a_raw_edit in enumerate(raw_edits):
+        if not isinstance(a_raw_edit, dict):
+            _LOGGER.warning(f"async_batch_departure_schedule_service(): invalid edit #{idx + 1} format: {type(a_raw_edit).__name__}")
+            return None
+
+        action = str(a_raw_edit.get("action", "")).lower()
+        a_fn_name = f"async_batch_departure_schedule_service[edit #{idx + 1}]"
+        if action in ["update", "delete_by_days"]:
+            validated_days = _parse_days(a_raw_edit.get("schedule_days", []), a_fn_name)
+            if validated_days is None:
+                return None
+
+            if action == "update":
+                hour = a_raw_edit.get("hour", None)
+                minute = a_raw_edit.get("minute", None)
+                try:
+                    hour = int(hour)
+                    minute = int(minute)
+                except (TypeError, ValueError):
+                    _LOGGER.warning(f"{a_fn_name}(): invalid hour/minute values: hour={hour}, minute={minute}")
+                    return None
+
+                precon_temperature = _parse_precon_temperature(a_raw_edit.get("precondition_temperature", "OFF"), a_fn_name)
+                edits.append({"action": action, "days_list": validated_days, "hour": hour, "minute": minute, "precon_temperature": precon_temperature})
+            else:
+                edits.append({"action": action, "days_list": validated_days})
+
+        elif action == "delete_by_ids":
+            schedule_ids = _parse_schedule_ids(a_raw_edit.get("schedule_ids", []), a_fn_name)
+            if schedule_ids is None:
+                return None
+            edits.append({"action": action, "schedule_id_list": schedule_ids})
+
+        else:
+            _LOGGER.warning(f"{a_fn_name}(): invalid action '{action}'")
+            return None
+
+    if len(edits) == 0:
+        _LOGGER.warning("async_batch_departure_schedule_service(): No edits were provided")
+        return None
+    return edits
+
+
+def async_setup_services(hass: HomeAssistant):
+    """Register the services (only once - independent of the number of config entries)."""
+
+    async def async_refresh_status_service(call: ServiceCall):
+        _LOGGER.debug("Running Service 'refresh_status'")
+        return await fan_out(call, resolve_target_coordinators(hass, call), _refresh_status)
+
+    async def async_clear_tokens_service(call: ServiceCall):
+        _LOGGER.debug("Running Service 'clear_tokens'")
+        return await fan_out(call, resolve_target_coordinators(hass, call, default_all=False), _clear_tokens)
+
+    async def poll_api_service(call: ServiceCall):
+        return await fan_out(call, resolve_target_coordinators(hass, call), _poll_api)
+
+    async def handle_reload_service(call: ServiceCall):
+        """Handle reload service call."""
+        _LOGGER.debug("Reloading Integration")
+
+        current_entries = hass.config_entries.async_entries(DOMAIN)
+        reload_tasks = [
+            hass.config_entries.async_reload(entry.entry_id)
+            for entry in current_entries
+        ]
+
+        reload_start = time.monotonic()
+        await asyncio.gather(*reload_tasks)
+        _LOGGER.info(f"Reloaded {len(reload_tasks)} entries in {int((time.monotonic() - reload_start) * 1000)} ms")
+
+    async def async_delete_message_service(call: ServiceCall):
+        _LOGGER.debug("Running Service 'delete_message'")
+        msg_id = call.data.get('msgid', None)
+        if msg_id is None:
+            _LOGGER.warning("async_delete_message_service: No 'msgid' was provided!")
+            return {"vehicles": {}}
+        try:
+            msg_id = int(msg_id)
+        except ValueError:
+            _LOGGER.warning(f"async_delete_message_service: provided 'msgid' can not be convert to a number: {type(msg_id).__name__} - {msg_id}")
+            return {"vehicles": {}}
+
+        async def delete_message(coordinator):
+            return await FordpassDataHandler.messages_delete_with_id_called_from_service(coordinator, msg_id)
+
+        # the messages are shared by all vehicles of an account - so the message must be deleted only once
+        # per account
+        a_coordinator_per_account = {}
+        for a_coordinator in resolve_target_coordinators(hass, call, default_all=False):
+            a_coordinator_per_account.setdefault(a_coordinator.bridge.account_key, a_coordinator)
+        return await fan_out(call, list(a_coordinator_per_account.values()), delete_message)
+
+    async def async_update_departure_schedule_service(call: ServiceCall):
+        _LOGGER.debug("Running Service 'update_departure_schedule'")
+        a_fn_name = "async_update_departure_schedule_service"
+
+        hour = call.data.get("hour", None)
+        minute = call.data.get("minute", None)
+        if hour is None or minute is None:
+            _LOGGER.warning(f"{a_fn_name}(): 'hour' and 'minute' are required")
+            return {"vehicles": {}}
+        try:
+            hour = int(hour)
+            minute = int(minute)
+        except ValueError:
+            _LOGGER.warning(f"{a_fn_name}(): invalid hour/minute values: hour={hour}, minute={minute}")
+            return {"vehicles": {}}
+
+        validated_days = _parse_days(call.data.get("schedule_days", []), a_fn_name)
+        if validated_days is None:
+            return {"vehicles": {}}
+        precon_temperature = _parse_precon_temperature(call.data.get("precondition_temperature", "OFF"), a_fn_name)
+
+        async def update_departure_schedule(coordinator):
+            return await FordpassDataHandler.update_departure_schedule(coordinator.data, coordinator.bridge,
+                validated_days, hour, minute, precon_temperature
+            )
+
+        return await fan_out(call, resolve_target_coordinators(hass, call, Tag.DEPARTURE_SCHEDULES, default_all=False), update_departure_schedule)
+
+    async def async_delete_departure_schedule_by_days_service(call: ServiceCall):
+        _LOGGER.debug("Running Service 'delete_departure_schedule_by_days'")
+        validated_days = _parse_days(call.data.get("schedule_days", []), "async_delete_departure_schedule_by_days_service")
+        if validated_days is None:
+            return {"vehicles": {}}
+
+        async def delete_departure_schedule_by_days(coordinator):
+            return await FordpassDataHandler.delete_departure_schedule_by_days(coordinator.data, coordinator.bridge, validated_days)
+
+        return await fan_out(call, resolve_target_coordinators(hass, call, Tag.DEPARTURE_SCHEDULES, default_all=False), delete_departure_schedule_by_days)
+
+    async def async_delete_departure_schedule_by_ids_service(call: ServiceCall):
+        _LOGGER.debug("Running Service 'delete_departure_schedule_by_ids'")
+        schedule_ids = _parse_schedule_ids(call.data.get("schedule_ids", []), "async_delete_departure_schedule_by_ids_service")
+        if schedule_ids is None:
+            return {"vehicles": {}}
+
+        async def delete_departure_schedule_by_ids(coordinator):
+            return await FordpassDataHandler.delete_departure_schedule_by_schedule_ids(coordinator.data, coordinator.bridge, schedule_ids)
+
+        return await fan_out(call, resolve_target_coordinators(hass, call, Tag.DEPARTURE_SCHEDULES, default_all=False), delete_departure_schedule_by_ids)
+
+    async def async_batch_departure_schedule_service(call: ServiceCall):
+        _LOGGER.debug("Running Service 'batch_departure_schedule'")
+        edits = _parse_batch_edits(call.data.get("edits", []))
+        if edits is None:
+            return {"vehicles": {}}
+
+        async def batch_departure_schedule(coordinator):
+            return await FordpassDataHandler.batch_update_departure_schedules(coordinator.data, coordinator.bridge, edits)
+
+        return await fan_out(call, resolve_target_coordinators(hass, call, Tag.DEPARTURE_SCHEDULES, default_all=False), batch_departure_schedule)
+
+    services = {
+        SERVICE_REFRESH_STATUS: async_refresh_status_service,
+        SERVICE_CLEAR_TOKENS: async_clear_tokens_service,
+        SERVICE_POLL_API: poll_api_service,
+        SERVICE_DELETE_MESSAGE: async_delete_message_service,
+        SERVICE_UPDATE_DEPARTURE_SCHEDULE: async_update_departure_schedule_service,
+        SERVICE_DELETE_DEPARTURE_SCHEDULE_BY_DAYS: async_delete_departure_schedule_by_days_service,
+        SERVICE_DELETE_DEPARTURE_SCHEDULE_BY_IDS: async_delete_departure_schedule_by_ids_service,
+        SERVICE_BATCH_DEPARTURE_SCHEDULE: async_batch_departure_schedule_service,
+    }
+    any_departure_schedules = any(a_coordinator.tag_supported_by_vehicle(Tag.DEPARTURE_SCHEDULES) for a_coordinator in get_coordinators(hass).values())
+    for a_service_name, a_service_fn in services.items():
+        if hass.services.has_service(DOMAIN, a_service_name):
+            continue
+        if a_service_name in DEPARTURE_SCHEDULE_SERVICES and not any_departure_schedules:
+            continue
+        hass.services.async_register(DOMAIN, a_service_name, a_service_fn, supports_response=SupportsResponse.OPTIONAL)
+
+    if not hass.services.has_service(DOMAIN, SERVICE_RELOAD):
+        hass.services.async_register(DOMAIN, SERVICE_RELOAD, handle_reload_service)
+
+
+def async_unload_services(hass: HomeAssistant):
+    """Remove the services that are not used by any of the remaining config entries."""
+    remaining_coordinators = get_coordinators(hass).values()
+    if len(remaining_coordinators) == 0:
+        a_service_list = [SERVICE_REFRESH_STATUS, SERVICE_CLEAR_TOKENS, SERVICE_POLL_API, SERVICE_RELOAD, SERVICE_DELETE_MESSAGE] + DEPARTURE_SCHEDULE_SERVICES
+    elif not any(a_coordinator.tag_supported_by_vehicle(Tag.DEPARTURE_SCHEDULES) for a_coordinator in remaining_coordinators):
+        a_service_list = DEPARTURE_SCHEDULE_SERVICES
+    else:
+        a_service_list = []
+
+    for a_service_name in a_service_list:
+        if hass.services.has_service(DOMAIN, a_service_name):
+            hass.services.async_remove(DOMAIN, a_service_name)